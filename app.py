@@ -1,8 +1,13 @@
 import streamlit as st
 import pandas as pd
 from scrapers import TourismScraper
-from datetime import datetime
-import re
+import math
+from datetime import date, datetime, timedelta
+from near_duplicates import collapse
+from news_archive import get_archive
+from report_writer import HIGHLIGHT_KEYWORDS, render_card
+from search_index import TitleIndex
+from snapshot_refresher import SnapshotRefresher
 
 # 페이지 설정
 st.set_page_config(
@@ -86,6 +91,13 @@ st.markdown("""
         gap: 5px;
     }
 
+    /* 같은 보도자료가 함께 올라온 다른 소스 */
+    .news-also {
+        font-size: 0.8rem;
+        color: #888;
+        margin-top: 0.3rem;
+    }
+
     /* 키워드 하이라이트 스타일 */
     .highlight {
         background: linear-gradient(120deg, #fff176 0%, #fff176 100%);
@@ -105,23 +117,47 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
-# 강조할 키워드 목록
-HIGHLIGHT_KEYWORDS = ["여행", "참여", "숙박", "호텔", "할인", "이벤트", "축제", "패키지", "쿠폰"]
-
-def highlight_text(text):
-    """제목 내 주요 키워드에 하이라이트 적용"""
-    for keyword in HIGHLIGHT_KEYWORDS:
-        if keyword in text:
-            # 대소문자 구분 없이 강조 (한국어는 해당 없으나 패턴 유지를 위해)
-            pattern = re.compile(f"({keyword})", re.IGNORECASE)
-            text = pattern.sub(r'<span class="highlight">\1</span>', text)
-    return text
+# 강조 키워드와 카드 렌더링(하이라이트 포함)은 report_writer와 공유
+# 한 페이지에 그릴 카드 수
+PAGE_SIZES = [20, 50, 100]
 
-# 데이터 로딩 함수 (캐싱)
-@st.cache_data(ttl=1800) # 30분 캐시
+# 데이터 로딩 함수 (백그라운드 갱신 스레드에서 실행)
 def load_data():
     scraper = TourismScraper()
-    return scraper.fetch_all()
+    news = scraper.fetch_all()
+    # 지난 기록 보기용 날짜별 보관소에도 추가 (이미 있는 글은 보관소가 거름) - 같은 보도자료도 소스별로 모두 보관
+    try:
+        get_archive().append(news)
+    except Exception as e:
+        print(f"Archive update failed: {repr(e)}")
+    # 화면에는 여러 기관에 올라온 같은 보도자료를 한 카드로
+    return collapse(news), scraper.source_status
+
+# 프로세스 전체에서 하나만 두는 스냅샷 갱신기 (30분마다 백그라운드 갱신)
+@st.cache_resource
+def get_refresher():
+    return SnapshotRefresher(load_data)
+
+# 스냅샷마다 한 번만 검색 색인 생성 (_items는 해시 대상에서 제외)
+@st.cache_resource(max_entries=2)
+def get_search_index(data_key, _items):
+    return TitleIndex(_items)
+
+# 보관소 조회는 기간과 색인 버전(보관소에 글이 추가되면 바뀜)마다 한 번만 - 기간에 해당하는 날짜 파티션만 읽음
+# 여러 기관에 올라온 같은 보도자료는 한 카드로 묶음 (LSH 후보만 비교하므로 기간이 길어도 전체 쌍을 보지 않음)
+@st.cache_resource(max_entries=8)
+def load_archive(start, end, version):
+    return collapse(get_archive().query(start, end))
+
+def format_age(seconds):
+    minutes = int(seconds // 60)
+    if minutes < 1:
+        return "방금 전"
+    if minutes < 60:
+        return f"{minutes}분 전"
+    return f"{minutes // 60}시간 {minutes % 60}분 전"
+
+refresher = get_refresher()
 
 # 사이드바 구성
 st.sidebar.title("🇰🇷 관광 뉴스 통합 필터")
@@ -130,13 +166,23 @@ st.sidebar.markdown("---")
 # 검색 및 필터
 search_query = st.sidebar.text_input("제목 내 키워드 검색", "")
 
-sources = ["전체", "MCST", "VisitKorea", "VisitSeoul", "GGTour", "Busan", "Jeju", "Incheon", "Gangwon", "Gyeongbuk"]
+# 지난 기록 보기: 최신 수집 결과 대신 보관소에서 고른 기간의 글
+archive_mode = st.sidebar.checkbox("지난 기록 보기 (기간 선택)")
+if archive_mode:
+    today = date.today()
+    period = st.sidebar.date_input("기간", value=(today - timedelta(days=6), today), max_value=today)
+    # 끝 날짜를 고르는 중에는 시작 날짜 하나만 옴
+    period = tuple(period) if isinstance(period, (tuple, list)) else (period,)
+    start_date, end_date = (period[0], period[-1]) if period else (today, today)
+    sources = ["전체"] + get_archive().sources(start_date, end_date)
+else:
+    sources = ["전체", "MCST", "VisitKorea", "VisitSeoul", "GGTour", "Busan", "Jeju", "Incheon", "Gangwon", "Gyeongbuk"]
 selected_source = st.sidebar.selectbox("뉴스 소스 선택", sources)
+page_size = st.sidebar.selectbox("페이지당 표시 개수", PAGE_SIZES)
 
-# 새로고침
+# 새로고침 (기다리지 않고 백그라운드 갱신만 시작, 끝나면 다음 화면 갱신 때 반영)
 if st.sidebar.button("데이터 강제 업데이트"):
-    st.cache_data.clear()
-    st.rerun()
+    refresher.refresh_async()
 
 st.sidebar.markdown("---")
 st.sidebar.markdown("### 💡 강조 키워드")
@@ -148,23 +194,42 @@ for i, kw in enumerate(HIGHLIGHT_KEYWORDS):
 st.title("🇰🇷 전국 관광 뉴스 통합 엔진 v2.0")
 st.markdown("**중앙 부처 및 8개 지자체**의 실시간 여행, 참여, 할인 정보를 한눈에 확인하세요.")
 
-# 데이터 가져오기
-with st.spinner('실시간 전국 관광 정보를 수집하는 중...'):
-    all_news = load_data()
+# 데이터 가져오기: 저장된 스냅샷을 바로 보여주고, 스냅샷이 전혀 없을 때만 첫 수집을 기다림
+snapshot = refresher.get()
+if archive_mode:
+    archive_version = get_archive().version()
+    all_news = load_archive(start_date, end_date, archive_version)
+    source_status = {}
+    data_key = f"archive:{start_date}:{end_date}:{archive_version}"
+    st.caption(f"🗂 보관된 기록: {start_date} ~ {end_date} ({len(all_news)}건)")
+else:
+    if snapshot is None:
+        with st.spinner('실시간 전국 관광 정보를 수집하는 중...'):
+            snapshot = refresher.wait()
+    all_news = snapshot["items"] if snapshot else []
+    source_status = snapshot["status"] if snapshot else {}
+    data_key = snapshot["fetched_at"] if snapshot else None
+
+if snapshot and not archive_mode:
+    fetched_at = datetime.fromtimestamp(snapshot["fetched_at"]).strftime('%Y-%m-%d %H:%M')
+    age_text = f"📦 데이터 기준: {fetched_at} ({format_age(refresher.age())})"
+    if refresher.refreshing:
+        age_text += " · 🔄 백그라운드에서 최신 정보로 갱신 중 (완료 후 새로고침하면 반영)"
+    st.caption(age_text)
 
-if not all_news:
+# 제한 시간 초과/오류 소스 안내 (나머지 소스는 부분 결과로 표시)
+failed_sources = [f"{name}({info['status']})" for name, info in source_status.items() if info['status'] != 'ok']
+if failed_sources:
+    st.warning(f"일부 소스를 가져오지 못했습니다: {', '.join(failed_sources)}")
+
+if not all_news and archive_mode:
+    st.info("선택한 기간에 보관된 글이 없습니다.")
+elif not all_news:
     st.error("데이터를 수집하는 중 오류가 발생했거나 데이터가 없습니다.")
 else:
-    # 필터링 로직
-    filtered_news = all_news
-    
-    # 소스 필터
-    if selected_source != "전체":
-        filtered_news = [i for i in filtered_news if i['source'] == selected_source]
-    
-    # 검색 필터
-    if search_query:
-        filtered_news = [i for i in filtered_news if search_query.lower() in i['title'].lower()]
+    # 필터링 로직: 소스 필터와 검색어를 색인의 postings 교집합으로 처리
+    search_index = get_search_index(data_key, all_news)
+    filtered_news = search_index.filter(search_query, None if selected_source == "전체" else selected_source)
     
     # 요약 통계
     c1, c2, c3 = st.columns(3)
@@ -177,23 +242,25 @@ else:
     if not filtered_news:
         st.info("검색 조건에 맞는 뉴스가 없습니다.")
     else:
-        # 뉴스 카드 루프
-        for item in filtered_news:
-            source_class = f"tag-{item['source'].lower()}"
-            highlighted_title = highlight_text(item['title'])
-            
-            st.markdown(f"""
-            <div class="news-card">
-                <span class="source-tag {source_class}">{item['source']}</span>
-                <a href="{item['link']}" target="_blank" class="news-title">{highlighted_title}</a>
-                <div class="news-date">📅 {item['date']}</div>
-            </div>
-            """, unsafe_allow_html=True)
+        # 필터가 바뀌면 첫 페이지로
+        total_pages = max(1, math.ceil(len(filtered_news) / page_size))
+        filter_key = (selected_source, search_query, page_size, data_key)
+        if st.session_state.get("filter_key") != filter_key:
+            st.session_state["filter_key"] = filter_key
+            st.session_state["page"] = 1
+        st.session_state["page"] = min(st.session_state.get("page", 1), total_pages)
+        page = st.number_input(f"페이지 (전체 {total_pages}쪽)", min_value=1, max_value=total_pages, key="page")
+
+        # 보이는 페이지의 카드만 하나의 HTML 블록으로 묶어 한 번에 전송
+        start = (page - 1) * page_size
+        visible = filtered_news[start:start + page_size]
+        st.markdown("".join(render_card(item) for item in visible), unsafe_allow_html=True)
+        st.caption(f"{start + 1}–{start + len(visible)} / {len(filtered_news)}건")
 
 # 푸터
 st.markdown("---")
 st.markdown(f"""
 <div style="text-align: center; color: #999; font-size: 0.85rem; padding: 20px;">
-    © 2026 관광 뉴스 통합 엔진 | 마지막 업데이트: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
+    © 2026 관광 뉴스 통합 엔진 | 마지막 업데이트: {datetime.fromtimestamp(snapshot['fetched_at']).strftime('%Y-%m-%d %H:%M:%S') if snapshot else '-'}
 </div>
 """, unsafe_allow_html=True)
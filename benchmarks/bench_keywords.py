@@ -0,0 +1,68 @@
+"""키워드 필터링/하이라이트: 기존 키워드별 루프 vs KeywordMatcher
+
+    python benchmarks/bench_keywords.py --titles 50000
+"""
+import argparse
+import os
+import random
+import re
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from integrated_news_engine import IntegratedNewsEngine  # noqa: E402
+from keyword_matcher import KeywordMatcher  # noqa: E402
+from report_writer import HIGHLIGHT_KEYWORDS  # noqa: E402
+
+WORDS = ("서울 부산 시민 안내 공지 여행 축제 할인 쿠폰 지원 사업 모집 발표 결과 계획 문화 행사 "
+         "참여 숙박 호텔 일정 변경 교통 통제 청년 창업 보조금 관광 패키지 이벤트 선정 예산").split()
+
+
+def make_titles(count, seed=0):
+    rng = random.Random(seed)
+    return [" ".join(rng.choice(WORDS) for _ in range(rng.randint(4, 12))) for _ in range(count)]
+
+
+def legacy_is_money_news(keywords, title):
+    for kw in keywords:
+        if kw in title:
+            return True
+    return False
+
+
+def legacy_highlight(text):
+    for keyword in HIGHLIGHT_KEYWORDS:
+        if keyword in text:
+            pattern = re.compile(f"({keyword})", re.IGNORECASE)
+            text = pattern.sub(r'<span class="highlight">\1</span>', text)
+    return text
+
+
+def timed(fn, titles):
+    started = time.perf_counter()
+    result = [fn(t) for t in titles]
+    return result, time.perf_counter() - started
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--titles", type=int, default=50000)
+    args = parser.parse_args()
+
+    titles = make_titles(args.titles)
+    engine = IntegratedNewsEngine(only_new=False)
+    money_keywords = engine.money_keywords
+    highlight_matcher = KeywordMatcher(HIGHLIGHT_KEYWORDS)
+
+    old, old_s = timed(lambda t: legacy_is_money_news(money_keywords, t), titles)
+    new, new_s = timed(engine.is_money_news, titles)
+    print(f"filter     legacy {old_s * 1000:8.1f}ms  matcher {new_s * 1000:8.1f}ms  same={old == new}")
+
+    old, old_s = timed(legacy_highlight, titles)
+    new, new_s = timed(lambda t: highlight_matcher.highlight(t, '<span class="highlight">', '</span>'), titles)
+    print(f"highlight  legacy {old_s * 1000:8.1f}ms  matcher {new_s * 1000:8.1f}ms  same={old == new}")
+
+
+if __name__ == "__main__":
+    main()
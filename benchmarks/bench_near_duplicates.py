@@ -0,0 +1,69 @@
+"""같은 보도자료 묶기: 모든 쌍 Jaccard 비교 vs MinHash + LSH 후보 비교
+
+    python benchmarks/bench_near_duplicates.py --titles 20000
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bench_keywords import make_titles  # noqa: E402
+from near_duplicates import NearDuplicateIndex, jaccard, shingles  # noqa: E402
+from news_item import NewsItem  # noqa: E402
+
+SOURCES = ["MCST", "VisitKorea", "VisitSeoul", "GGTour", "Busan", "Jeju", "Incheon", "Gangwon", "Gyeongbuk"]
+PREFIXES = ["", "[보도자료] ", "[알림] ", "시, ", "도, "]
+
+
+def make_items(count, copies, seed=0):
+    """count건 중 약 copies 비율은 다른 소스에 말머리/띄어쓰기만 바꿔 다시 올린 글"""
+    rng = random.Random(seed)
+    titles = make_titles(count, seed)
+    items = []
+    for i, title in enumerate(titles):
+        if items and rng.random() < copies:
+            original = rng.choice(items[-50:])
+            title = rng.choice(PREFIXES) + original.title.replace(" ", "", 1)
+        items.append(NewsItem(title, f"https://example.com/{i}", None, rng.choice(SOURCES)))
+    return items
+
+
+def brute_force(items, threshold):
+    grams = [shingles(item.title) for item in items]
+    pairs = 0
+    for i in range(len(items)):
+        for j in range(i):
+            if items[i].source != items[j].source and jaccard(grams[i], grams[j]) >= threshold:
+                pairs += 1
+                break
+    return pairs
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--titles", type=int, default=20000)
+    parser.add_argument("--copies", type=float, default=0.2, help="다른 소스에 다시 올린 글의 비율")
+    parser.add_argument("--threshold", type=float, default=0.5)
+    parser.add_argument("--brute-limit", type=int, default=5000, help="모든 쌍 비교는 이 건수까지만")
+    args = parser.parse_args()
+
+    items = make_items(args.titles, args.copies)
+    started = time.perf_counter()
+    index = NearDuplicateIndex(args.threshold)
+    index.add_many(items)
+    elapsed = time.perf_counter() - started
+    grouped = sum(len(members) - 1 for members in index.clusters())
+    print(f"LSH        {len(items):>7}건 {elapsed:8.2f}s  묶인 글 {grouped}건, 후보 비교 {index.compared}회 "
+          f"(모든 쌍 {len(items) * (len(items) - 1) // 2}회)")
+
+    sample = items[:args.brute_limit]
+    started = time.perf_counter()
+    pairs = brute_force(sample, args.threshold)
+    print(f"모든 쌍    {len(sample):>7}건 {time.perf_counter() - started:8.2f}s  다른 소스에 비슷한 글이 있는 글 {pairs}건")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,138 @@
+"""HTML 파서 백엔드별 파싱+선택 시간 비교
+
+저장해 둔 목록 페이지(benchmarks/fixtures)를 각 백엔드로 파싱해
+html.parser와 추출 결과가 같은지, 얼마나 빠른지 출력한다.
+
+    python benchmarks/bench_parsers.py --save        # 현재 목록 페이지를 fixtures로 저장 (네트워크 필요)
+    python benchmarks/bench_parsers.py --repeat 20   # 저장된 페이지로 비교
+"""
+import argparse
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import html_parser  # noqa: E402
+from integrated_news_engine import TARGET_SITES, IntegratedNewsEngine  # noqa: E402
+from scrapers import TourismScraper  # noqa: E402
+from site_profiles import SiteProfileStore  # noqa: E402
+
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+SOURCE_DIR = os.path.join(FIXTURE_DIR, "sources")
+SITE_DIR = os.path.join(FIXTURE_DIR, "sites")
+
+
+def load_cases(scraper, engine):
+    """(이름, 파싱 함수, 본문) 목록 - HTML을 파싱하는 소스만 대상"""
+    cases = []
+    for name, method in TourismScraper.SOURCES:
+        path = os.path.join(SOURCE_DIR, f"{name}.html")
+        if os.path.exists(path):
+            with open(path, "r", encoding="utf-8") as f:
+                text = f.read()
+            cases.append((name, getattr(scraper, method.replace("fetch_", "parse_", 1)), text))
+
+    index_path = os.path.join(SITE_DIR, "index.json")
+    if os.path.exists(index_path):
+        with open(index_path, "r", encoding="utf-8") as f:
+            sites = json.load(f)
+        for site in sites:
+            with open(os.path.join(SITE_DIR, site["file"]), "r", encoding="utf-8") as f:
+                text = f.read()
+
+            def extract(html, url=site["url"]):
+                # 학습 프로필 없이 전체 탐색 비용을 측정
+                engine.profiles = SiteProfileStore(path=os.devnull)
+                return engine.extract_items(url, html)
+            cases.append((site["name"], extract, text))
+    return cases
+
+
+def save_fixtures(scraper):
+    from http_client import get_client
+    client = get_client()
+    os.makedirs(SOURCE_DIR, exist_ok=True)
+    os.makedirs(SITE_DIR, exist_ok=True)
+
+    # TourismScraper 소스: 파싱 함수를 가로채 원본 본문을 저장
+    for name, method in TourismScraper.SOURCES:
+        parse_name = method.replace("fetch_", "parse_", 1)
+        captured = {}
+
+        def capture(text, captured=captured):
+            captured["text"] = text
+            return []
+        setattr(scraper, parse_name, capture)
+        scraper.cache.enabled = False
+        getattr(scraper, method)()
+        if "text" in captured:
+            ext = "json" if captured["text"].lstrip().startswith(("{", "[")) else "html"
+            with open(os.path.join(SOURCE_DIR, f"{name}.{ext}"), "w", encoding="utf-8") as f:
+                f.write(captured["text"])
+            print(f"saved {name}.{ext}")
+
+    sites = []
+    for i, site in enumerate(TARGET_SITES):
+        try:
+            res = client.get(site["url"], timeout=15)
+            res.raise_for_status()
+            if res.encoding == "ISO-8859-1":
+                res.encoding = res.apparent_encoding
+        except Exception as e:
+            print(f"skip {site['name']}: {repr(e)}")
+            continue
+        file_name = f"site_{i:03d}.html"
+        with open(os.path.join(SITE_DIR, file_name), "w", encoding="utf-8") as f:
+            f.write(res.text)
+        sites.append({"file": file_name, "name": site["name"], "url": site["url"]})
+        print(f"saved {file_name} ({site['name']})")
+    with open(os.path.join(SITE_DIR, "index.json"), "w", encoding="utf-8") as f:
+        json.dump(sites, f, ensure_ascii=False, indent=1)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--save", action="store_true", help="download current listing pages into fixtures")
+    parser.add_argument("--repeat", type=int, default=10)
+    parser.add_argument("--backends", nargs="*", default=None)
+    args = parser.parse_args()
+
+    scraper = TourismScraper()
+    if args.save:
+        save_fixtures(scraper)
+        return
+
+    engine = IntegratedNewsEngine(only_new=False)
+    cases = load_cases(scraper, engine)
+    if not cases:
+        print(f"No fixtures in {FIXTURE_DIR}. Run with --save first.")
+        return
+
+    backends = args.backends or html_parser.available_backends()
+    html_parser.set_default_backend("html.parser")
+    expected = {name: parse(text) for name, parse, text in cases}
+
+    totals = {}
+    print(f"{'source':<36}" + "".join(f"{b:>14}" for b in backends))
+    for name, parse, text in cases:
+        row = f"{name[:35]:<36}"
+        for backend in backends:
+            html_parser.set_default_backend(backend)
+            started = time.perf_counter()
+            for _ in range(args.repeat):
+                result = parse(text)
+            ms = (time.perf_counter() - started) * 1000 / args.repeat
+            totals[backend] = totals.get(backend, 0) + ms
+            mark = " " if result == expected[name] else "*"
+            row += f"{ms:>11.2f}ms{mark}"
+        print(row)
+    html_parser.set_default_backend("html.parser")
+
+    print(f"{'TOTAL':<36}" + "".join(f"{totals[b]:>11.2f}ms " for b in backends))
+    print("* = 추출 결과가 html.parser와 다름")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,300 @@
+"""네트워크 없이 돌리는 수집/리포트 성능 벤치마크
+
+benchmarks/fixtures에 저장된 목록 페이지로 소스별 파싱+추출, fetch_all 병합/정렬,
+리포트 생성, 제목 하이라이트를 측정해 초당 실행 횟수(ops/s)와 최대 메모리를 출력한다.
+기준값(baseline.json)과 비교해 느려지거나 메모리가 늘어난 항목은 표시하고 종료 코드 1을 반환한다.
+속도는 여러 번 나눠 잰 것 중 가장 빠른 회차로 비교한다. 항목마다 고정된 보정 작업(calibration)을
+번갈아 재서 함께 저장하고 그 속도 비율만큼 기준값을 조정하므로, 기계가 전체적으로 느리거나
+실행 중에 클럭이 바뀐 것만으로는 회귀로 잡히지 않는다. 기준값을 잴 때 회차 사이에 흔들린 폭(noise)도
+함께 저장해 허용 범위는 --threshold와 그 폭 중 큰 쪽으로 하고, 회귀로 보이는 항목은 --retries번까지
+다시 재서 그래도 나쁠 때만 회귀로 친다. 인터프리터 버전에 따라 속도가 크게 달라지므로 기준값은
+CI와 같은 Python(3.9)으로 저장한다.
+
+    python benchmarks/run_benchmarks.py                  # 기준값과 비교
+    python benchmarks/run_benchmarks.py --save-baseline  # 현재 결과를 기준값으로 저장
+    python benchmarks/run_benchmarks.py --filter site:   # 이름에 'site:'가 들어간 항목만
+"""
+import argparse
+import io
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bench_parsers import SITE_DIR, SOURCE_DIR  # noqa: E402
+from daily_tourism_bot import highlight_text, report_meta  # noqa: E402
+from integrated_news_engine import IntegratedNewsEngine  # noqa: E402
+from near_duplicates import collapse  # noqa: E402
+from report_writer import (  # noqa: E402
+    DashboardHtmlReport, EmailHtmlReport, EngineHtmlReport, EngineTxtReport, ReportWriter, TourismTxtReport,
+    _render_card,
+)
+from scrapers import TourismScraper  # noqa: E402
+from site_profiles import SiteProfileStore  # noqa: E402
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+
+
+def read_fixture(path):
+    with open(path, "r", encoding="utf-8") as f:
+        return f.read()
+
+
+def source_cases(scraper):
+    """TourismScraper 소스별 파싱 (HTML/JSON 모두)"""
+    cases = []
+    for name, method in TourismScraper.SOURCES:
+        for ext in ("html", "json"):
+            path = os.path.join(SOURCE_DIR, f"{name}.{ext}")
+            if os.path.exists(path):
+                parse = getattr(scraper, method.replace("fetch_", "parse_", 1))
+                cases.append((f"source:{name}", parse, read_fixture(path)))
+                break
+    return cases
+
+
+def site_cases(engine):
+    """TARGET_SITES 표본의 extract_items - 학습 전(전체 탐색)과 학습 후(프로필 패턴) 둘 다"""
+    index_path = os.path.join(SITE_DIR, "index.json")
+    if not os.path.exists(index_path):
+        return []
+    with open(index_path, "r", encoding="utf-8") as f:
+        sites = json.load(f)
+
+    cases = []
+    for site in sites:
+        html = read_fixture(os.path.join(SITE_DIR, site["file"]))
+
+        def cold(html, url=site["url"]):
+            engine.profiles = SiteProfileStore(path=os.devnull)
+            return engine.extract_items(url, html)
+
+        def learned(html, url=site["url"], profiles=SiteProfileStore(path=os.devnull)):
+            engine.profiles = profiles
+            return engine.extract_items(url, html)
+
+        cases.append((f"site:{site['name']}", cold, html))
+        cases.append((f"site:{site['name']} (learned)", learned, html))
+    return cases
+
+
+def build_cases():
+    """(이름, 인자 없는 함수) 목록"""
+    scraper = TourismScraper()
+    engine = IntegratedNewsEngine(only_new=False)
+
+    cases = []
+    parsed = {}
+    for name, parse, text in source_cases(scraper):
+        cases.append((name, lambda parse=parse, text=text: parse(text)))
+        parsed[name.split(":", 1)[1]] = parse(text)
+    for name, extract, html in site_cases(engine):
+        cases.append((name, lambda extract=extract, html=html: extract(html)))
+    if not parsed:
+        return cases
+
+    # fetch_all: 각 fetcher를 fixture 파싱 결과로 바꿔 스레드 병합/필터/정렬 비용만 측정
+    merge_scraper = TourismScraper()
+    merge_scraper.profiles = SiteProfileStore(path=os.devnull)
+    for name, method in TourismScraper.SOURCES:
+        setattr(merge_scraper, method, lambda items=parsed.get(name, []): list(items))
+    cases.append(("fetch_all merge/sort", merge_scraper.fetch_all))
+
+    news = merge_scraper.fetch_all()
+    status = merge_scraper.source_status
+    # 메일/대시보드로 보내기 전 여러 소스의 같은 보도자료 묶기
+    cases.append(("near_duplicates collapse", lambda: collapse(news)))
+
+    def tourism_reports():
+        _render_card.cache_clear()  # 실제 실행처럼 카드 메모이즈가 비어 있는 상태에서 측정
+        sinks = [EmailHtmlReport(io.StringIO()), TourismTxtReport(io.StringIO()), DashboardHtmlReport(io.StringIO())]
+        return ReportWriter(sinks).write([(None, news)], report_meta(news, status))
+    cases.append(("report:tourism", tourism_reports))
+
+    groups = {}
+    for item in news:
+        groups.setdefault(item["source"], []).append({"title": item["title"], "link": item["link"],
+                                                      "date": item["date"]})
+
+    def engine_reports():
+        sinks = [EngineTxtReport(io.StringIO()), EngineHtmlReport(io.StringIO())]
+        return ReportWriter(sinks).write(groups.items(), {"generated_at": "2026-01-18 09:00:00",
+                                                          "keywords": engine.money_keywords})
+    cases.append(("report:engine", engine_reports))
+
+    titles = [item["title"] for item in news]
+    cases.append(("highlight_text", lambda: [highlight_text(t) for t in titles]))
+    return cases
+
+
+def calibration_work():
+    """기계 속도 보정용 고정 작업 (순수 Python 문자열/dict 처리 - 벤치마크 대상 코드와 무관)"""
+    counts = {}
+    for i in range(2000):
+        key = f"제목 {i % 97} 관광 {i % 13}"
+        counts[key] = counts.get(key, 0) + len(key.split())
+    return sorted(counts.items())
+
+
+def _round_ops(func, round_time):
+    runs = 0
+    started = time.perf_counter()
+    elapsed = 0.0
+    while runs < 1 or elapsed < round_time:
+        func()
+        runs += 1
+        elapsed = time.perf_counter() - started
+    return runs / elapsed
+
+
+def best_ops(func, min_time, repeats):
+    """(func ops/s, 보정 작업 ops/s, 흔들림) - min_time초를 repeats회로 나눠 재고 각각 가장 빠른 회차
+
+    다른 프로세스/타이머 잡음은 느려지는 쪽으로만 생기므로 평균 대신 최댓값(최소 실행 시간)을 쓰고,
+    회차마다 보정 작업을 바로 앞에서 같이 재서 그 사이의 기계 속도 변화가 양쪽에 똑같이 반영되게 한다.
+    흔들림은 회차별 (func / 보정 작업) 비율이 가장 좋은 회차보다 얼마나 낮았는지의 최댓값이다.
+    """
+    func()  # 워밍업 (임포트/정규식 컴파일 등 1회성 비용 제외)
+    calibration_work()
+    round_time = min_time / repeats
+    best = calibration = 0.0
+    ratios = []
+    for _ in range(repeats):
+        round_calibration = _round_ops(calibration_work, round_time / 2)
+        round_ops = _round_ops(func, round_time)
+        calibration = max(calibration, round_calibration)
+        best = max(best, round_ops)
+        ratios.append(round_ops / round_calibration)
+    return best, calibration, 1 - min(ratios) / max(ratios)
+
+
+def peak_kb(func, repeats):
+    """repeats회 실행 중 가장 작은 최대 메모리(KB) - GC 시점에 따라 한 번씩 튀는 값은 버림"""
+    peaks = []
+    for _ in range(repeats):
+        tracemalloc.start()
+        try:
+            func()
+            peaks.append(tracemalloc.get_traced_memory()[1])
+        finally:
+            tracemalloc.stop()
+    return min(peaks) / 1024
+
+
+def measure(func, min_time, repeats):
+    """ops/s(가장 빠른 회차), 같이 잰 보정 작업 ops/s, 회차 사이 흔들림, 최대 메모리(KB)"""
+    ops, calibration, noise = best_ops(func, min_time, repeats)
+    return {"ops_per_sec": round(ops, 2), "calibration_ops_per_sec": round(calibration, 2),
+            "noise": round(noise, 3), "peak_kb": round(peak_kb(func, min(repeats, 3)), 1)}
+
+
+def load_baseline(path):
+    """(항목별 기준값, 기준값을 잰 Python 버전)"""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}, None
+    return data.get("cases", {}), data.get("python")
+
+
+def save_baseline(path, results):
+    data = {
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "cases": results,
+    }
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, indent=1, sort_keys=True)
+        f.write("\n")
+    os.replace(tmp_path, path)
+
+
+def speed_ratio(result, base):
+    """지금 기계 속도 / 기준값을 잴 때 속도 (항목마다 같이 잰 보정 작업 기준, 없으면 1)"""
+    if not base.get("calibration_ops_per_sec"):
+        return 1.0
+    return result["calibration_ops_per_sec"] / base["calibration_ops_per_sec"]
+
+
+def regressions(result, base, threshold, speed=1.0):
+    """기준값 대비 threshold(비율) 이상 나빠진 지표 목록 (speed: speed_ratio())
+
+    속도는 기준값을 잴 때의 흔들림(noise)이 threshold보다 크면 그만큼 더 허용한다.
+    """
+    flags = []
+    slack = max(threshold, base.get("noise", 0))
+    if base.get("ops_per_sec") and result["ops_per_sec"] < base["ops_per_sec"] * speed * (1 - slack):
+        flags.append("slower")
+    if base.get("peak_kb") and result["peak_kb"] > base["peak_kb"] * (1 + threshold):
+        flags.append("memory")
+    return flags
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--filter", default=None, help="only run cases whose name contains this text")
+    parser.add_argument("--min-time", type=float, default=0.5, help="seconds to spend per case")
+    parser.add_argument("--repeats", type=int, default=5, help="timing rounds per case (the fastest round counts)")
+    parser.add_argument("--retries", type=int, default=2, help="re-measure a flagged case up to this many times")
+    parser.add_argument("--threshold", type=float, default=0.25, help="allowed slowdown/memory growth ratio")
+    parser.add_argument("--baseline", default=BASELINE_PATH)
+    parser.add_argument("--save-baseline", action="store_true")
+    args = parser.parse_args()
+
+    cases = build_cases()
+    if args.filter:
+        cases = [(name, func) for name, func in cases if args.filter in name]
+    if not cases:
+        print("No benchmark cases. Check benchmarks/fixtures.")
+        return 1
+
+    baseline, base_python = load_baseline(args.baseline)
+    python = platform.python_version()
+    if base_python and base_python.rsplit(".", 1)[0] != python.rsplit(".", 1)[0] and not args.save_baseline:
+        print(f"Warning: baseline was recorded on Python {base_python}, running on {python} "
+              f"- speed differences between interpreters are not regressions")
+    results = {}
+    flagged = []
+    # base: 기준값을 지금 기계 속도로 환산한 값
+    print(f"{'case':<44}{'ops/s':>12}{'base':>12}{'speed':>7}{'peak KB':>10}{'base':>10}")
+    for name, func in cases:
+        base = baseline.get(name, {})
+        for _ in range(args.retries + 1):
+            result = measure(func, args.min_time, args.repeats)
+            speed = speed_ratio(result, base)
+            flags = regressions(result, base, args.threshold, speed)
+            # 기준값을 저장할 때는 다시 잴 필요 없음
+            if not flags or args.save_baseline:
+                break
+        results[name] = result
+        if flags:
+            flagged.append(name)
+        print(f"{name[:43]:<44}{result['ops_per_sec']:>12.1f}{base.get('ops_per_sec', 0) * speed:>12.1f}{speed:>7.2f}"
+              f"{result['peak_kb']:>10.1f}{base.get('peak_kb', 0):>10.1f}  {' '.join(flags)}")
+
+    if args.save_baseline:
+        # --filter로 일부만 돌렸으면 나머지 기준값은 그대로 둔다 (항목마다 자기 보정값이 있음)
+        merged = dict(baseline)
+        merged.update(results)
+        save_baseline(args.baseline, merged)
+        print(f"Saved baseline to {args.baseline}")
+        return 0
+
+    if not baseline:
+        print("No baseline yet. Run with --save-baseline to record one.")
+        return 0
+    if flagged:
+        print(f"{len(flagged)} regression(s) beyond {args.threshold:.0%}: {', '.join(flagged)}")
+        return 1
+    print("No regressions.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,103 @@
+import codecs
+import re
+import time
+
+from requests.compat import chardet
+
+import crawl_metrics
+
+# <meta charset> / http-equiv Content-Type을 찾을 본문 앞부분 크기
+META_SCAN_BYTES = 4096
+# 통계적 추정 전에 그대로 읽어 보는 인코딩 (대상 사이트 대부분이 UTF-8 아니면 EUC-KR/CP949)
+TRIAL_ENCODINGS = ("utf-8", "cp949")
+
+_BOMS = (
+    (codecs.BOM_UTF8, "utf-8-sig"),
+    (codecs.BOM_UTF16_LE, "utf-16"),
+    (codecs.BOM_UTF16_BE, "utf-16"),
+)
+_HEADER_CHARSET = re.compile(r"charset\s*=\s*[\"']?([\w.:-]+)", re.I)
+_META_CHARSET = re.compile(rb"<meta[^>]+?charset\s*=\s*[\"']?\s*([\w.:-]+)", re.I)
+
+# EUC-KR로 선언된 지자체 사이트도 확장 한글(CP949)을 섞어 쓰는 경우가 많음
+_ALIASES = {"euc_kr": "cp949", "ks_c_5601-1987": "cp949"}
+
+
+def normalize(name):
+    """코덱 이름 정규화 - 파이썬이 모르는 이름이면 None"""
+    if not name:
+        return None
+    try:
+        codec = codecs.lookup(name.strip()).name
+    except LookupError:
+        return None
+    return _ALIASES.get(codec, codec)
+
+
+def declared_encoding(content, content_type=None):
+    """(인코딩, 출처) - BOM, HTTP 헤더 charset, 앞부분의 <meta charset> 순서 (없으면 (None, None))"""
+    for bom, encoding in _BOMS:
+        if content.startswith(bom):
+            return encoding, "bom"
+    match = _HEADER_CHARSET.search(content_type or "")
+    encoding = normalize(match.group(1)) if match else None
+    if encoding:
+        return encoding, "header"
+    match = _META_CHARSET.search(content[:META_SCAN_BYTES])
+    encoding = normalize(match.group(1).decode("ascii", "ignore")) if match else None
+    if encoding:
+        return encoding, "meta"
+    return None, None
+
+
+def _decode_strict(content, encoding):
+    """오류 없이 읽히면 문자열, 아니면 None
+
+    잘린 본문(MAX_PAGE_BYTES)의 끝에 걸친 멀티바이트 문자는 오류로 보지 않고 버린다.
+    """
+    try:
+        return codecs.getincrementaldecoder(encoding)().decode(content, final=False)
+    except (UnicodeDecodeError, LookupError):
+        return None
+
+
+def detect_encoding(content):
+    """선언이 없을 때: TRIAL_ENCODINGS 중 오류 없이 읽히는 것, 모두 실패하면 본문 전체로 통계적 추정"""
+    for encoding in TRIAL_ENCODINGS:
+        if _decode_strict(content, encoding) is not None:
+            return encoding
+    guess = chardet.detect(content).get("encoding") if chardet else None
+    return normalize(guess) or "utf-8"
+
+
+class CharsetResolver:
+    """응답 본문을 문자열로 바꿈 - 선언(BOM/헤더/meta)이 없으면 사이트별로 기억한 인코딩, 그다음 추정
+
+    추정한 인코딩은 학습 프로필(SiteProfileStore)의 encoding 필드에 남겨 다음 실행에서는 추정을 건너뛴다.
+    기억한 인코딩으로 읽히지 않으면(사이트가 바뀐 경우) 다시 추정한다.
+    """
+
+    def __init__(self, profiles):
+        self.profiles = profiles
+
+    def decode(self, response, key=None):
+        started = time.perf_counter()
+        content = response.content or b""
+        encoding, source = declared_encoding(content, response.headers.get("Content-Type"))
+        text = None
+        if encoding:
+            text = content.decode(encoding, errors="replace")
+        elif key:
+            memo = self.profiles.get(key).get("encoding")
+            if memo:
+                encoding, source, text = memo, "memo", _decode_strict(content, memo)
+        if text is None:
+            encoding, source = detect_encoding(content), "detect"
+            text = content.decode(encoding, errors="replace")
+            if key:
+                self.profiles.update(key, encoding=encoding)
+
+        response.encoding = encoding
+        crawl_metrics.add("encoding_ms", (time.perf_counter() - started) * 1000)
+        crawl_metrics.note("encoding", f"{encoding} ({source})")
+        return text
@@ -0,0 +1,226 @@
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+
+import settings
+
+# 사이트 하나를 수집하는 동안 그 스레드에서 쌓이는 측정값
+# http_client(연결/응답 시간)와 스크래퍼(인코딩/파싱/행 수)가 add()로 채운다.
+_local = threading.local()
+
+_FIELDS = (
+    "dns_ms", "connect_ms", "tls_ms", "ttfb_ms", "download_ms", "encoding_ms", "parse_ms", "select_ms",
+    "pages", "requests", "bytes", "wire_bytes", "rows_scanned", "accepted", "rejected", "stale",
+)
+
+# Prometheus textfile로 내보낼 지표 (이름, 레코드 필드, 배율, 설명)
+_GAUGES = (
+    ("news_bot_site_duration_seconds", "total_ms", 0.001, "Wall time spent on the site"),
+    ("news_bot_site_ttfb_seconds", "ttfb_ms", 0.001, "Time to response headers, including new connections"),
+    ("news_bot_site_download_seconds", "download_ms", 0.001, "Time spent reading response bodies"),
+    ("news_bot_site_encoding_seconds", "encoding_ms", 0.001, "Charset resolution and decoding time"),
+    ("news_bot_site_parse_seconds", "parse_ms", 0.001, "HTML/JSON parse time"),
+    ("news_bot_site_bytes", "bytes", 1, "Decoded response bytes"),
+    ("news_bot_site_rows_scanned", "rows_scanned", 1, "Candidate rows inspected"),
+    ("news_bot_site_items_accepted", "accepted", 1, "Items kept"),
+    ("news_bot_site_items_rejected", "rejected", 1, "Rows rejected by the keyword filter"),
+    ("news_bot_site_items_stale", "stale", 1, "Rows older than the date cutoff"),
+)
+
+
+def _new_record(name, url):
+    record = {"site": name, "url": url, "status": "running", "error": None, "encoding": None, "total_ms": 0.0}
+    record.update((field, 0) for field in _FIELDS)
+    return record
+
+
+def current():
+    """이 스레드에서 측정 중인 사이트 레코드 (없으면 None)"""
+    return getattr(_local, "record", None)
+
+
+def add(field, value):
+    record = current()
+    if record is not None:
+        record[field] = record.get(field, 0) + value
+
+
+def note(field, value):
+    """숫자가 아닌 값 기록 (예: 사용한 인코딩과 그 출처)"""
+    record = current()
+    if record is not None:
+        record[field] = value
+
+
+@contextmanager
+def recording(record):
+    """이 스레드의 add()/note()/set_status()가 record에 쌓이도록 (사이트 하나를 여러 스레드가 이어 처리할 때)"""
+    previous = current()
+    _local.record = record
+    try:
+        yield record
+    finally:
+        _local.record = previous
+
+
+def capture():
+    """site() 밖(파싱 프로세스 등)에서 측정값을 모을 임시 레코드 - counters()로 꺼내 add_counters()로 옮김"""
+    return recording(_new_record(None, None))
+
+
+def counters(record):
+    """레코드의 0이 아닌 숫자 측정값"""
+    return {field: record[field] for field in _FIELDS if record[field]}
+
+
+def add_counters(values):
+    for field, value in values.items():
+        add(field, value)
+
+
+def set_status(status, error=None):
+    record = current()
+    if record is not None:
+        record["status"] = status
+        record["error"] = error
+
+
+class CrawlMetrics:
+    """한 번의 수집 실행(run / fetch_all)에서 사이트별 측정값을 모음"""
+
+    def __init__(self, run):
+        self.run = run
+        self.started_at = datetime.now().isoformat(timespec="seconds")
+        self._started = time.perf_counter()
+        self._elapsed_ms = None
+        self._records = {}
+        self._clock = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_records(cls, run, records, elapsed_ms=None):
+        """다른 프로세스(샤드)가 records()로 남긴 레코드를 합친 측정값 - 같은 사이트는 마지막 것"""
+        metrics = cls(run)
+        for record in records:
+            metrics._records[record["site"]] = dict(record)
+        metrics._elapsed_ms = elapsed_ms
+        return metrics
+
+    @contextmanager
+    def site(self, name, url=None):
+        record = self.begin(name, url)
+        try:
+            with recording(record):
+                yield record
+        finally:
+            self.end(record)
+
+    def begin(self, name, url=None):
+        """사이트 측정 시작 - 여러 단계(수집 스레드 -> 파싱 -> 마무리)에 걸칠 때 site() 대신 end()와 함께 씀"""
+        record = _new_record(name, url)
+        with self._lock:
+            self._records[name] = record
+            self._clock[id(record)] = time.perf_counter()
+        return record
+
+    def end(self, record):
+        with self._lock:
+            started = self._clock.pop(id(record))
+        record["total_ms"] = round((time.perf_counter() - started) * 1000, 1)
+        # 제한 시간이 지나 이미 timeout으로 표시된 사이트는 그대로 둠
+        if record["status"] == "running":
+            record["status"] = "ok" if record["accepted"] else "empty"
+
+    def mark(self, name, status, error=None):
+        """site() 밖에서 상태를 정함 (예: fetch_all 제한 시간 초과)"""
+        with self._lock:
+            record = self._records.setdefault(name, _new_record(name, None))
+            record["status"] = status
+            record["error"] = error
+
+    def records(self):
+        with self._lock:
+            records = [dict(r) for r in self._records.values()]
+        for record in records:
+            for field, value in record.items():
+                if isinstance(value, float):
+                    record[field] = round(value, 2)
+        return records
+
+    def slowest(self, limit=10):
+        """요청을 보낸 사이트 중 오래 걸린 순 (건너뛴 사이트 제외)"""
+        records = [r for r in self.records() if r["status"] != "skipped"]
+        return sorted(records, key=lambda r: r["total_ms"], reverse=True)[:limit]
+
+    def summary(self):
+        records = self.records()
+        statuses = {}
+        for record in records:
+            statuses[record["status"]] = statuses.get(record["status"], 0) + 1
+        return {
+            "run": self.run,
+            "started_at": self.started_at,
+            "elapsed_ms": self._elapsed_ms if self._elapsed_ms is not None
+            else round((time.perf_counter() - self._started) * 1000, 1),
+            "sites": len(records),
+            "statuses": statuses,
+            "bytes": sum(r["bytes"] for r in records),
+            "encoding_ms": round(sum(r["encoding_ms"] for r in records), 1),
+            "accepted": sum(r["accepted"] for r in records),
+        }
+
+    def write_jsonl(self, path):
+        """사이트별 레코드 한 줄씩, 마지막에 실행 요약 한 줄 (파일 끝에 추가)"""
+        lines = [json.dumps(dict(r, run=self.run, started_at=self.started_at), ensure_ascii=False)
+                 for r in self.records()]
+        lines.append(json.dumps(dict(self.summary(), type="summary"), ensure_ascii=False))
+        with open(path, "a", encoding="utf-8") as f:
+            f.write("\n".join(lines) + "\n")
+
+    def write_prometheus(self, path):
+        """node_exporter textfile collector 형식 (임시 파일에 쓰고 교체)"""
+        records = self.records()
+        out = []
+        for metric, field, scale, help_text in _GAUGES:
+            out.append(f"# HELP {metric} {help_text}")
+            out.append(f"# TYPE {metric} gauge")
+            for record in records:
+                labels = _labels(run=self.run, site=record["site"], status=record["status"])
+                out.append(f"{metric}{{{labels}}} {record[field] * scale:g}")
+        summary = self.summary()
+        out.append("# HELP news_bot_run_duration_seconds Wall time of the whole run")
+        out.append("# TYPE news_bot_run_duration_seconds gauge")
+        out.append(f"news_bot_run_duration_seconds{{{_labels(run=self.run)}}} {summary['elapsed_ms'] / 1000:g}")
+        out.append("# HELP news_bot_run_sites Sites by final status")
+        out.append("# TYPE news_bot_run_sites gauge")
+        for status, count in sorted(summary["statuses"].items()):
+            out.append(f"news_bot_run_sites{{{_labels(run=self.run, status=status)}}} {count}")
+
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write("\n".join(out) + "\n")
+        os.replace(tmp_path, path)
+
+    def export(self):
+        """설정된 위치로 JSON lines / Prometheus textfile 기록"""
+        if settings.METRICS_JSONL_PATH:
+            self.write_jsonl(settings.METRICS_JSONL_PATH)
+        if settings.METRICS_PROMETHEUS_PATH:
+            self.write_prometheus(settings.METRICS_PROMETHEUS_PATH)
+
+
+def _labels(**labels):
+    parts = []
+    for key, value in labels.items():
+        value = str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+        parts.append(f'{key}="{value}"')
+    return ",".join(parts)
+
+
+def format_summary(metrics):
+    summary = metrics.summary()
+    statuses = ", ".join(f"{k} {v}" for k, v in sorted(summary["statuses"].items()))
+    return f"사이트 {summary['sites']}곳 ({statuses}), {summary['bytes'] / 1024:.0f}KB, {summary['elapsed_ms'] / 1000:.1f}s"
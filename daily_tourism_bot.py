@@ -1,102 +1,96 @@
-import os
+import io
+import crawl_metrics
+import history_export
+import http_client
+import near_duplicates
+import news_archive
+import settings
+from item_store import ItemStore
 from scrapers import TourismScraper
 from datetime import datetime
-import re
+from report_writer import (
+    EMAIL_HIGHLIGHT_OPEN, DashboardHtmlReport, EmailHtmlReport, ReportWriter,
+    TourismTxtReport, highlight_title,
+)
 
-# 강조할 키워드 목록 (app.py와 동일)
-HIGHLIGHT_KEYWORDS = ["여행", "참여", "숙박", "호텔", "할인", "이벤트", "축제", "패키지", "쿠폰"]
+# 메일 본문에 넣는 최대 건수 (넘는 새 글은 본 것으로 기록하지 않아 다음 메일에 이어서 나감)
+EMAIL_MAX_ITEMS = 30
 
 def highlight_text(text):
-    """제목 내 주요 키워드에 하이라이트 적용 (이메일용 인라인 스타일)"""
-    for keyword in HIGHLIGHT_KEYWORDS:
-        if keyword in text:
-            pattern = re.compile(f"({keyword})", re.IGNORECASE)
-            # 이메일 클라이언트 호환성을 위해 인라인 스타일 사용
-            text = pattern.sub(r'<span style="background-color: #fff176; font-weight: bold; color: #d32f2f; padding: 0 2px;">\1</span>', text)
-    return text
+    """제목 내 주요 키워드에 하이라이트 적용 (이메일용 인라인 스타일, 제목은 이스케이프)"""
+    return highlight_title(text, EMAIL_HIGHLIGHT_OPEN)
 
-def generate_html_report(news_data):
+def report_meta(news_data, source_status=None, metrics=None, health=None):
+    source_status = source_status or {}
+    return {
+        "generated_at": datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+        "total": len(news_data),
+        "sources": len(set(i['source'] for i in news_data)),
+        "failed_sources": [f"{name}({info['status']})" for name, info in source_status.items() if info['status'] != 'ok'],
+        "metrics": metrics,
+        "health": health,
+    }
+
+def generate_html_report(news_data, source_status=None):
     """프리미엄 스타일의 이메일용 HTML 리포트 생성"""
-    now_str = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-    
-    html = f"""
-    <!DOCTYPE html>
-    <html lang="ko">
-    <head>
-        <meta charset="UTF-8">
-        <style>
-            body {{ font-family: 'Apple SD Gothic Neo', 'Malgun Gothic', sans-serif; line-height: 1.6; color: #333; margin: 0; padding: 0; background-color: #f8f9fa; }}
-            .container {{ max-width: 600px; margin: 20px auto; background: #ffffff; border-radius: 12px; overflow: hidden; box-shadow: 0 4px 15px rgba(0,0,0,0.1); border: 1px solid #eee; }}
-            .header {{ background: linear-gradient(135deg, #007bff 0%, #0056b3 100%); color: white; padding: 30px 20px; text-align: center; }}
-            .header h1 {{ margin: 0; font-size: 24px; font-weight: bold; }}
-            .header p {{ margin: 10px 0 0; font-size: 14px; opacity: 0.9; }}
-            .content {{ padding: 20px; }}
-            .stats {{ background: #f1f3f5; padding: 15px; border-radius: 8px; margin-bottom: 20px; font-size: 14px; display: flex; justify-content: space-around; }}
-            .news-item {{ border-bottom: 1px solid #eee; padding: 15px 0; }}
-            .news-item:last-child {{ border-bottom: none; }}
-            .source-tag {{ display: inline-block; padding: 2px 8px; border-radius: 4px; font-size: 11px; font-weight: bold; color: #1976D2; background: #E3F2FD; margin-bottom: 5px; }}
-            .title {{ display: block; font-size: 17px; font-weight: bold; color: #1a1a1a; text-decoration: none; margin-bottom: 5px; line-height: 1.4; }}
-            .date {{ font-size: 13px; color: #888; }}
-            .footer {{ background: #f8f9fa; padding: 20px; text-align: center; font-size: 12px; color: #999; border-top: 1px solid #eee; }}
-            .highlight {{ background-color: #fff176; font-weight: bold; color: #d32f2f; }}
-        </style>
-    </head>
-    <body>
-        <div class="container">
-            <div class="header">
-                <h1>🇰🇷 전국 관광 뉴스 일일 리포트</h1>
-                <p>{now_str} 기준 최신 소식</p>
-            </div>
-            <div class="content">
-                <div class="stats">
-                    <span>전체 소식: <b>{len(news_data)}건</b></span>
-                    <span>수집 소스: <b>{len(set(i['source'] for i in news_data))}개</b></span>
-                </div>
-    """
-    
-    if not news_data:
-        html += "<p style='text-align:center; padding: 40px; color: #666;'>오늘 수집된 새로운 소식이 없습니다.</p>"
-    else:
-        for item in news_data[:30]:  # 이메일 용량을 고려하여 상위 30건만 포함
-            highlighted_title = highlight_text(item['title'])
-            html += f"""
-                <div class="news-item">
-                    <span class="source-tag">{item['source']}</span>
-                    <a href="{item['link']}" class="title">{highlighted_title}</a>
-                    <div class="date">📅 {item['date']}</div>
-                </div>
-            """
-            
-    html += f"""
-            </div>
-            <div class="footer">
-                <p>본 메일은 설정된 스케줄에 따라 자동 발송되었습니다.</p>
-                <p>© 2026 관광 뉴스 통합 엔진 | <a href="#" style="color:#999;">알림 설정 변경</a></p>
-            </div>
-        </div>
-    </body>
-    </html>
-    """
-    return html
+    buffer = io.StringIO()
+    ReportWriter([EmailHtmlReport(buffer)]).write([(None, news_data)], report_meta(news_data, source_status))
+    return buffer.getvalue()
 
 def main():
     print("Starting daily news collection for email...")
-    scraper = TourismScraper()
-    news_list = scraper.fetch_all()
+    store = ItemStore() if settings.ONLY_NEW_ITEMS else None
+    # 수집 이력이 있으면 소스별로 이미 본 글이 나올 때까지 다음 쪽도 읽음
+    scraper = TourismScraper(item_store=store)
+    # 새 항목만 보고할 때는 소스별 마지막 성공 실행일 이전 글을 읽지 않음
+    news_list = scraper.fetch_all(since_last_run=settings.ONLY_NEW_ITEMS)
+    # 날짜별 보관소에는 이미 보낸 글도 넘김 (보관소가 중복을 거름)
+    try:
+        print(f"Archived {news_archive.get_archive().append(news_list)} new items")
+    except Exception as e:
+        print(f"Archive update failed: {repr(e)}")
+
+    # 이전 메일에서 이미 보낸 소식은 제외 (본 것으로 기록하는 건 메일에 실제로 들어간 글만, 리포트 작성 후)
+    if store is not None:
+        news_list = store.filter_new(news_list, mark=False)
+    new_items = news_list
+    # 여러 기관에 올라온 같은 보도자료는 메일/리포트에서 한 건으로 (다른 소스는 also) - 이력 파일에는 소스별 원래 항목
+    groups = near_duplicates.groups(new_items)
+    news_list = [head for head, _ in groups]
     
     print(f"Collected {len(news_list)} items. Generating HTML...")
-    html_report = generate_html_report(news_list)
-    
-    # GitHub Action이 읽을 수 있도록 파일 저장
-    with open("daily_news_report.html", "w", encoding="utf-8") as f:
-        f.write(html_report)
-    
-    # 텍스트 버전도 백업용으로 생성
-    with open("daily_news_report.txt", "w", encoding="utf-8") as f:
-        for item in news_list[:10]:
-            f.write(f"[{item['source']}] {item['title']} - {item['link']}\n")
+    # 메일 HTML(GitHub Action 첨부용), 백업 텍스트, 정적 대시보드를 한 번의 순회로 함께 기록
+    writer = ReportWriter([
+        EmailHtmlReport("daily_news_report.html", max_items=EMAIL_MAX_ITEMS),
+        TourismTxtReport("daily_news_report.txt"),
+        DashboardHtmlReport("daily_news_dashboard.html"),
+    ])
+    writer.write([(None, news_list)], report_meta(news_list, scraper.source_status, scraper.metrics, scraper.health))
             
     print("Report files generated successfully.")
+    if store is not None:
+        # 메일에 들어간 글과 그 글로 묶인 다른 소스의 같은 글
+        store.mark_seen([member for _, members in groups[:EMAIL_MAX_ITEMS] for member in members])
+        held_back = [member for _, members in groups[EMAIL_MAX_ITEMS:] for member in members]
+        if held_back:
+            print(f"{len(news_list) - EMAIL_MAX_ITEMS} new items over the mail limit are kept for the next run")
+        # 리포트를 다 만든 뒤에만 마지막 성공 실행일을 넘김 (메일 단계가 실패하면 워크플로가 상태를 저장하지 않음)
+        # 보내지 못한 글이 있는 소스는 그 글의 날짜까지만 넘겨 다음 실행의 기준일에 걸리지 않게 함
+        scraper.save_last_run(held_back)
+    # 열 단위 이력 파일 (Parquet 등) - 대시보드/분석에서 바로 불러옴
+    try:
+        path = history_export.export_run(new_items, "tourism")
+        if path:
+            print(f"History saved to {path}")
+    except Exception as e:
+        print(f"History export failed: {repr(e)}")
+    scraper.metrics.export()
+    print(crawl_metrics.format_summary(scraper.metrics))
+    print(http_client.format_stats(http_client.close_client()))
+    scraper.cache.prune()
+    if store is not None:
+        store.compact()
+        store.close()
 
 if __name__ == "__main__":
     main()
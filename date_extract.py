@@ -0,0 +1,126 @@
+import re
+from datetime import date, datetime, timedelta
+
+import crawl_metrics
+import settings
+
+# 2026-01-18 / 2026.01.18 / 2026/1/18 / 2026. 1. 18.
+_FULL = re.compile(r"(?<!\d)(\d{4})\s*[-./]\s*(\d{1,2})\s*[-./]\s*(\d{1,2})(?!\d)")
+# 2026년 1월 18일
+_KOREAN = re.compile(r"(\d{4})\s*년\s*(\d{1,2})\s*월\s*(\d{1,2})\s*일")
+# 20260118 / 20260118093000 (API 응답의 createDate 등)
+_COMPACT = re.compile(r"(?<!\d)(20\d{2})(\d{2})(\d{2})(?:\d{4}|\d{6})?(?!\d)")
+# 26-01-18 / 26.01.18
+_SHORT = re.compile(r"(?<!\d)(\d{2})\s*[-./]\s*(\d{1,2})\s*[-./]\s*(\d{1,2})(?!\d)")
+# 01-18 / 01.18 (날짜 칸 전체가 이 형태일 때만 - 제목 안의 숫자와 헷갈리지 않도록)
+_MONTH_DAY = re.compile(r"(\d{1,2})\s*[-./]\s*(\d{1,2})\.?")
+# 3일 전 / 5시간 전 / 10분 전
+_RELATIVE = re.compile(r"(\d+)\s*(일|시간|분)\s*전")
+
+
+def _make_date(year, month, day):
+    try:
+        return date(int(year), int(month), int(day))
+    except ValueError:
+        return None
+
+
+def extract_date(text, today=None):
+    """목록의 날짜 칸(또는 행 텍스트)에서 첫 번째 날짜를 date로 - 없으면 None"""
+    if not text:
+        return None
+    if isinstance(text, datetime):
+        return text.date()
+    if isinstance(text, date):
+        return text
+    try:
+        # 가장 흔한 'YYYY-MM-DD...' 는 정규식 없이
+        return date.fromisoformat(text[:10])
+    except ValueError:
+        pass
+    today = today or date.today()
+    for pattern, century in ((_FULL, 0), (_KOREAN, 0), (_COMPACT, 0), (_SHORT, 2000)):
+        for match in pattern.finditer(text):
+            year, month, day = match.groups()
+            found = _make_date(int(year) + century, month, day)
+            if found and 2000 <= found.year <= today.year + 1:
+                return found
+
+    match = _RELATIVE.search(text)
+    if match:
+        amount, unit = int(match.group(1)), match.group(2)
+        return today - timedelta(days=amount) if unit == "일" else today
+    if "오늘" in text:
+        return today
+    if "어제" in text:
+        return today - timedelta(days=1)
+
+    match = _MONTH_DAY.fullmatch(text.strip())
+    if match:
+        found = _make_date(today.year, *match.groups())
+        # 연도가 없으면 올해로 보되 미래 날짜면 작년 글
+        if found and found > today:
+            found = _make_date(today.year - 1, *match.groups())
+        return found
+    return None
+
+
+def format_date(value):
+    """리포트/화면 표시용 'YYYY-MM-DD' (날짜가 없으면 빈 문자열)"""
+    if isinstance(value, date):
+        return value.strftime("%Y-%m-%d")
+    return value or ""
+
+
+def json_default(value):
+    """json.dump(default=...)용 - date는 ISO 문자열로, NewsItem은 dict로"""
+    if isinstance(value, date):
+        return value.isoformat()
+    if hasattr(value, "to_dict"):
+        return value.to_dict()
+    raise TypeError(f"{type(value).__name__} is not JSON serializable")
+
+
+def cutoff_date(since=None, today=None):
+    """기준일: 최근 MAX_ITEM_AGE_DAYS일과 마지막 성공 실행일(since) 중 늦은 날 (둘 다 없으면 None)"""
+    today = today or date.today()
+    cutoff = None
+    if settings.MAX_ITEM_AGE_DAYS > 0:
+        cutoff = today - timedelta(days=settings.MAX_ITEM_AGE_DAYS)
+    since = extract_date(since) if since else None
+    if since and (cutoff is None or since > cutoff):
+        cutoff = since
+    return cutoff
+
+
+class DateCutoff:
+    """최신순 목록을 읽으며 기준일보다 오래된 행을 거름
+
+    상단 고정 공지처럼 오래된 행이 섞여 있을 수 있으므로 오래된 행이 STALE_ROW_STREAK개
+    연속으로 나온 뒤에야 done이 되어 나머지 행을 읽지 않는다. 날짜가 없는 행은 거르지 않는다.
+    """
+
+    def __init__(self, cutoff, streak=None):
+        self.cutoff = cutoff
+        self.streak = settings.STALE_ROW_STREAK if streak is None else streak
+        self._stale_run = 0
+
+    @property
+    def done(self):
+        return self.cutoff is not None and self._stale_run >= self.streak
+
+    def accept(self, row_date):
+        if self.cutoff is None or row_date is None:
+            return True
+        if row_date >= self.cutoff:
+            self._stale_run = 0
+            return True
+        self._stale_run += 1
+        crawl_metrics.add("stale", 1)
+        return False
+
+    def filter(self, items):
+        """이미 추출된 항목(캐시 결과 등)에서 기준일 이전 항목만 뺌"""
+        if self.cutoff is None:
+            return items
+        return [item for item in items if item.get("date") is None or item["date"] >= self.cutoff]
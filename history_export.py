@@ -0,0 +1,111 @@
+import importlib
+import os
+from datetime import datetime
+
+import pandas as pd
+
+import settings
+
+# 열 순서 (run: 어느 수집기가 남긴 결과인지, run_at: 수집 시각)
+COLUMNS = ["run", "run_at", "source", "title", "link", "date"]
+
+# 형식별 확장자와 필요한 모듈 - parquet/feather는 pyarrow, 없으면 압축 CSV
+FORMATS = {
+    "parquet": (".parquet", "pyarrow"),
+    "feather": (".feather", "pyarrow"),
+    "csv": (".csv.gz", None),
+}
+
+
+def resolve_format(name=None):
+    """설정한 형식을 쓸 수 없으면 csv (pyarrow 미설치 등)"""
+    name = (name or settings.HISTORY_EXPORT_FORMAT).lower()
+    if name not in FORMATS:
+        raise ValueError(f"Unknown history format: {name} (choose from {', '.join(FORMATS)})")
+    module = FORMATS[name][1]
+    if module is not None:
+        try:
+            importlib.import_module(module)
+        except ImportError:
+            print(f"History format '{name}' needs {module}, falling back to csv")
+            return "csv"
+    return name
+
+
+def items_frame(items, run=None, run_at=None):
+    """NewsItem(또는 같은 키의 dict) 목록 -> DataFrame
+
+    소스/실행 이름은 반복이 많아 category로, 날짜는 datetime64로 두어 파일과 메모리를 줄인다.
+    """
+    run_at = run_at or datetime.now()
+    frame = pd.DataFrame({
+        "run": run,
+        "run_at": pd.Timestamp(run_at),
+        "source": [item.get("source") for item in items],
+        "title": [item.get("title") for item in items],
+        "link": [item.get("link") for item in items],
+        "date": pd.to_datetime([item.get("date") for item in items], errors="coerce"),
+    }, columns=COLUMNS)
+    frame["run"] = frame["run"].astype("category")
+    frame["source"] = frame["source"].astype("category")
+    return frame
+
+
+def write_frame(frame, path_base, fmt=None):
+    """path_base + 형식별 확장자로 저장 후 실제 경로 반환 (임시 파일에 쓰고 교체)"""
+    fmt = resolve_format(fmt)
+    path = path_base + FORMATS[fmt][0]
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    if fmt == "parquet":
+        frame.to_parquet(tmp_path, index=False, compression="zstd")
+    elif fmt == "feather":
+        frame.reset_index(drop=True).to_feather(tmp_path, compression="zstd")
+    else:
+        frame.to_csv(tmp_path, index=False, compression="gzip")
+    os.replace(tmp_path, path)
+    return path
+
+
+def read_frame(path, columns=None):
+    """write_frame()으로 저장한 파일 하나 (확장자로 형식 판단)"""
+    if path.endswith(".parquet"):
+        return pd.read_parquet(path, columns=columns)
+    if path.endswith(".feather"):
+        return pd.read_feather(path, columns=columns)
+    frame = pd.read_csv(path, usecols=columns, parse_dates=[c for c in ("run_at", "date") if not columns or c in columns])
+    for column in ("run", "source"):
+        if column in frame:
+            frame[column] = frame[column].astype("category")
+    return frame
+
+
+def export_run(items, run, run_at=None, directory=None, fmt=None):
+    """한 번의 수집 결과를 HISTORY_EXPORT_DIR/<run>-<시각> 파일로 - 경로 반환 (꺼져 있거나 항목이 없으면 None)"""
+    directory = settings.HISTORY_EXPORT_DIR if directory is None else directory
+    if not directory or not items:
+        return None
+    run_at = run_at or datetime.now()
+    frame = items_frame(items, run, run_at)
+    return write_frame(frame, os.path.join(directory, f"{run}-{run_at.strftime('%Y%m%d-%H%M%S')}"), fmt)
+
+
+def load_history(directory=None, columns=None):
+    """쌓인 실행별 파일을 하나의 DataFrame으로 (대시보드/분석용, 수집 시각 순)"""
+    directory = settings.HISTORY_EXPORT_DIR if directory is None else directory
+    extensions = tuple(ext for ext, _ in FORMATS.values())
+    try:
+        names = sorted(name for name in os.listdir(directory) if name.endswith(extensions))
+    except OSError:
+        names = []
+    if not names:
+        return pd.DataFrame(columns=columns or COLUMNS)
+    frames = [read_frame(os.path.join(directory, name), columns) for name in names]
+    frame = pd.concat(frames, ignore_index=True)
+    # 파일마다 category 값이 달라 concat 후 object가 되므로 다시 category로
+    for column in ("run", "source"):
+        if column in frame:
+            frame[column] = frame[column].astype("category")
+    return frame
@@ -0,0 +1,248 @@
+import importlib
+import re
+
+from bs4 import BeautifulSoup, SoupStrainer
+
+import settings
+
+try:
+    from bs4.filter import ElementFilter  # beautifulsoup4 4.13+
+except ImportError:
+    ElementFilter = None
+
+# 백엔드 이름과 필요한 모듈
+BACKENDS = {
+    "html.parser": None,
+    "lxml": "lxml",
+    "html5lib": "html5lib",
+    "selectolax": "selectolax.lexbor",
+}
+
+
+def available_backends():
+    names = []
+    for name, module in BACKENDS.items():
+        if module is None:
+            names.append(name)
+            continue
+        try:
+            importlib.import_module(module)
+            names.append(name)
+        except ImportError:
+            pass
+    return names
+
+
+class LexborNode:
+    """selectolax(lexbor) 노드를 스크래퍼가 쓰는 BeautifulSoup API 일부로 감싼 것"""
+
+    __slots__ = ("_node",)
+
+    def __init__(self, node):
+        self._node = node
+
+    @property
+    def node_id(self):
+        return self._node.mem_id
+
+    def select(self, selector):
+        # lexbor는 자기 자신도 결과에 포함하므로 BeautifulSoup처럼 하위 노드만 남김
+        own_id = self._node.mem_id
+        return [LexborNode(n) for n in self._node.css(selector) if n.mem_id != own_id]
+
+    def select_one(self, selector):
+        own_id = self._node.mem_id
+        for n in self._node.css(selector):
+            if n.mem_id != own_id:
+                return LexborNode(n)
+        return None
+
+    def find_all(self, name):
+        return self.select(name)
+
+    def get_text(self, separator="", strip=False):
+        return self._node.text(deep=True, separator=separator, strip=strip)
+
+    @property
+    def text(self):
+        return self.get_text()
+
+    @property
+    def attrs(self):
+        return self._node.attributes
+
+    def get(self, key, default=None):
+        value = self._node.attributes.get(key, default)
+        return default if value is None else value
+
+    def __getitem__(self, key):
+        return self._node.attributes[key]
+
+    def decompose(self):
+        self._node.decompose()
+
+
+class LexborDocument(LexborNode):
+    """문서 전체 (파서 객체를 잡고 있어야 노드 메모리가 유지됨)"""
+
+    __slots__ = ("_parser",)
+
+    def __init__(self, parser):
+        super().__init__(parser.root)
+        self._parser = parser
+
+    def select(self, selector):
+        return [LexborNode(n) for n in self._parser.css(selector)]
+
+    def select_one(self, selector):
+        node = self._parser.css_first(selector)
+        return LexborNode(node) if node is not None else None
+
+    def decompose(self):
+        self._parser = None
+        self._node = None
+
+
+# 선택자의 가장 바깥 단계: 태그, .클래스/#id, [속성 조건] 하나
+_COMPOUND = re.compile(
+    r"(?P<tag>[a-zA-Z][\w-]*)?(?P<rest>(?:[.#][\w-]+)*)"
+    r"(?:\[(?P<attr>[\w-]+)(?:(?P<op>[*^$~|]?=)['\"]?(?P<value>[^'\"\]]*)['\"]?)?\])?"
+)
+
+
+def _compile_rule(selector):
+    """'table.board-list tr' -> ('table', {'board-list'}, None, None) - 해석할 수 없으면 None"""
+    parts = selector.split()
+    if not parts:
+        return None
+    match = _COMPOUND.fullmatch(parts[0])
+    if not match or not parts[0]:
+        return None
+    rest = match.group("rest")
+    classes = frozenset(re.findall(r"\.([\w-]+)", rest))
+    ids = re.findall(r"#([\w-]+)", rest)
+    attr = (match.group("attr"), match.group("op"), match.group("value") or "") if match.group("attr") else None
+    return (match.group("tag") or "").lower() or None, classes, ids[0] if ids else None, attr
+
+
+def _attr_matches(op, actual, expected):
+    if op is None:
+        return True
+    if op == "=":
+        return actual == expected
+    if op == "*=":
+        return expected in actual
+    if op == "^=":
+        return actual.startswith(expected)
+    if op == "$=":
+        return actual.endswith(expected)
+    if op == "~=":
+        return expected in actual.split()
+    return actual == expected or actual.startswith(expected + "-")
+
+
+def _rule_matches(rule, name, attrs):
+    tag, classes, element_id, attr = rule
+    if tag and name != tag:
+        return False
+    if classes:
+        value = attrs.get("class") or ""
+        tokens = value.split() if isinstance(value, str) else value
+        if not classes.issubset(tokens):
+            return False
+    if element_id and attrs.get("id") != element_id:
+        return False
+    if attr:
+        value = attrs.get(attr[0])
+        if value is None:
+            return False
+        if not isinstance(value, str):
+            value = " ".join(value)
+        return _attr_matches(attr[1], value, attr[2])
+    return True
+
+
+if ElementFilter is not None:
+    class _ContainerFilter(ElementFilter):
+        def __init__(self, predicate):
+            super().__init__()
+            self._predicate = predicate
+
+        def allow_tag_creation(self, nsprefix, name, attrs):
+            return self._predicate(name, attrs or {})
+
+        def allow_string_creation(self, string):
+            # 목록 영역 밖의 최상위 텍스트는 버림
+            return False
+
+    def _make_strainer(predicate):
+        return _ContainerFilter(predicate)
+else:
+    def _make_strainer(predicate):
+        # 4.12 이하: 함수형 name 규칙이 (태그 이름, 속성)을 받음
+        return SoupStrainer(predicate)
+
+
+def container_strainer(selectors):
+    """선택자들의 바깥 요소(목록 영역)만 트리로 만드는 strainer
+
+    선택자 결과는 이 요소들의 하위에 있으므로 걸러낸 트리에서 같은 선택자를 그대로 쓸 수 있다.
+    하나라도 해석할 수 없는 선택자가 있으면 None (전체 문서 파싱).
+    """
+    rules = []
+    for selector in selectors:
+        for part in selector.split(","):
+            rule = _compile_rule(part.strip())
+            if rule is None:
+                return None
+            rules.append(rule)
+    if not rules:
+        return None
+
+    def predicate(name, attrs):
+        return any(_rule_matches(rule, name, attrs) for rule in rules)
+    return _make_strainer(predicate)
+
+
+def _resolve(name):
+    if name not in BACKENDS:
+        raise ValueError(f"Unknown HTML parser backend: {name} (choose from {', '.join(BACKENDS)})")
+    if name not in available_backends():
+        print(f"HTML parser backend '{name}' is not installed, falling back to html.parser")
+        return "html.parser"
+    return name
+
+
+_default_backend = _resolve(settings.HTML_PARSER)
+
+
+def set_default_backend(name):
+    global _default_backend
+    _default_backend = _resolve(name)
+    return _default_backend
+
+
+def get_default_backend():
+    return _default_backend
+
+
+def parse_html(markup, backend=None, only=None):
+    """모든 fetch_*/smart_scrape 파싱의 공통 진입점
+
+    only: container_strainer() 결과 - html.parser/lxml에서만 적용 (selectolax는 충분히 빠르고,
+    html5lib은 부분 파싱을 지원하지 않아 전체를 파싱)
+    """
+    backend = backend or _default_backend
+    if backend == "selectolax":
+        from selectolax.lexbor import LexborHTMLParser
+        return LexborDocument(LexborHTMLParser(markup))
+    if only is not None and backend in ("html.parser", "lxml"):
+        return BeautifulSoup(markup, backend, parse_only=only)
+    return BeautifulSoup(markup, backend)
+
+
+def node_key(node):
+    """같은 요소인지 비교할 때 쓰는 키 (selectolax는 매번 새 래퍼를 만들기 때문)"""
+    if isinstance(node, LexborNode):
+        return node.node_id
+    return id(node)
@@ -0,0 +1,255 @@
+import hashlib
+import json
+import os
+import threading
+import time
+from datetime import date
+
+from requests.models import Response
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+import crawl_metrics
+import settings
+from date_extract import json_default
+from news_item import restore_items
+
+# 304 응답 시 본문을 복원하는 데 필요한 헤더만 저장
+_KEPT_HEADERS = ("Content-Type", "ETag", "Last-Modified")
+
+
+def _write_atomic(path, data):
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+
+def _covers(items_cutoff, cutoff):
+    """items_cutoff(저장된 결과를 추출할 때의 기준일) 기준으로 추출한 결과가 cutoff 기준의 결과를 모두 담는지
+
+    기준일 없이 추출했거나 지금 기준일이 같거나 늦으면 저장된 결과를 다시 거르기만 하면 된다.
+    """
+    if items_cutoff is None:
+        return True
+    return cutoff is not None and cutoff >= date.fromisoformat(items_cutoff)
+
+
+def read_limited(response, max_bytes, chunk_size=16384):
+    """stream=True로 받은 응답 본문을 max_bytes까지만 읽음
+
+    상한을 넘으면 나머지는 받지 않고 연결을 닫으며 response.truncated를 True로 둔다.
+    다 읽은 경우 연결은 풀로 돌아간다. (어댑터는 stream 응답의 다운로드 시간을 재지 않으므로 여기서 기록)
+    """
+    started = time.perf_counter()
+    chunks = []
+    size = 0
+    truncated = False
+    for chunk in response.iter_content(chunk_size):
+        chunks.append(chunk)
+        size += len(chunk)
+        if size > max_bytes:
+            truncated = True
+            break
+    content = b"".join(chunks)
+    wire_bytes = response.raw.tell() if hasattr(response.raw, "tell") else len(content)
+    if truncated:
+        content = content[:max_bytes]
+        response.close()
+    response._content = content
+    response._content_consumed = True
+    response.truncated = truncated
+    crawl_metrics.add("download_ms", (time.perf_counter() - started) * 1000)
+    crawl_metrics.add("bytes", len(content))
+    crawl_metrics.add("wire_bytes", wire_bytes)
+    return response
+
+
+class HttpCache:
+    """URL 단위 디스크 캐시 (검증자 + 본문 + 마지막 추출 결과)
+
+    fetch(max_bytes=...)는 본문을 스트리밍으로 받아 상한까지만 읽는다 (response.truncated).
+    fetch()가 돌려주는 Response에는 다음 속성이 추가된다.
+    - unchanged: 304 이거나 본문 해시가 이전과 같음
+    - cached_items: 같은 본문에서 이전에 추출한 결과 (없으면 None)
+      fetch(cutoff=...)에 넘긴 기준일로 다시 걸러 쓸 수 있는 결과만 (더 늦은 기준일로 잘라 낸 결과는 None)
+    """
+
+    def __init__(self, directory=None, max_bytes=None, max_age_days=None, enabled=None):
+        self.directory = directory or settings.HTTP_CACHE_DIR
+        self.max_bytes = max_bytes if max_bytes is not None else settings.HTTP_CACHE_MAX_BYTES
+        if max_age_days is None:
+            max_age_days = settings.HTTP_CACHE_MAX_AGE_DAYS
+        self.max_age = max_age_days * 86400
+        self.enabled = settings.HTTP_CACHE_ENABLED if enabled is None else enabled
+
+    def _key(self, method, url, params, data):
+        raw = json.dumps([method, url, params, data], sort_keys=True, ensure_ascii=False)
+        return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+    def _paths(self, key):
+        base = os.path.join(self.directory, key)
+        return base + ".json", base + ".body"
+
+    def _load(self, key):
+        meta_path, body_path = self._paths(key)
+        try:
+            with open(meta_path, "r", encoding="utf-8") as f:
+                meta = json.load(f)
+            with open(body_path, "rb") as f:
+                body = f.read()
+            return meta, body
+        except (OSError, ValueError):
+            return None, None
+
+    def _save_meta(self, key, meta):
+        meta_path, _ = self._paths(key)
+        # 추출 결과(NewsItem)는 dict로, date는 'YYYY-MM-DD'로 저장하고 읽을 때 restore_items로 되돌림
+        _write_atomic(meta_path, json.dumps(meta, ensure_ascii=False, default=json_default).encode("utf-8"))
+
+    def _request(self, client, method, url, max_bytes, **kwargs):
+        if not max_bytes:
+            return client.request(method, url, **kwargs)
+        return read_limited(client.request(method, url, stream=True, **kwargs), max_bytes)
+
+    def _cached_items(self, meta, body_hash, cutoff):
+        if meta.get("items_hash") != body_hash or not _covers(meta.get("items_cutoff"), cutoff):
+            return None
+        return restore_items(meta.get("items"))
+
+    def fetch(self, client, url, method="GET", params=None, data=None, headers=None, max_bytes=None, cutoff=None,
+              **kwargs):
+        if not self.enabled:
+            response = self._request(client, method, url, max_bytes, params=params, data=data, headers=headers,
+                                     **kwargs)
+            response.raise_for_status()
+            response.unchanged, response.cached_items, response.cache_key = False, None, None
+            return response
+
+        key = self._key(method, url, params, data)
+        meta, body = self._load(key)
+        headers = dict(headers or {})
+        # 조건부 요청은 GET에만 의미가 있음 (POST는 본문 해시로만 비교)
+        if meta and method == "GET":
+            if meta.get("etag"):
+                headers["If-None-Match"] = meta["etag"]
+            if meta.get("last_modified"):
+                headers["If-Modified-Since"] = meta["last_modified"]
+
+        response = self._request(client, method, url, max_bytes, params=params, data=data, headers=headers, **kwargs)
+        now = time.time()
+
+        if response.status_code == 304 and meta:
+            restored = Response()
+            restored._content = body
+            restored.status_code = 200
+            restored.headers = CaseInsensitiveDict(meta.get("headers", {}))
+            restored.encoding = get_encoding_from_headers(restored.headers)
+            restored.url = response.url
+            restored.request = response.request
+            restored.unchanged = True
+            restored.cached_items = self._cached_items(meta, meta.get("body_hash"), cutoff)
+            restored.cache_key = key
+            meta["used_at"] = now
+            self._save_meta(key, meta)
+            return restored
+
+        response.raise_for_status()
+        content = response.content
+        body_hash = hashlib.sha256(content).hexdigest()
+        unchanged = bool(meta) and meta.get("body_hash") == body_hash
+        response.unchanged = unchanged
+        response.cached_items = self._cached_items(meta, body_hash, cutoff) if unchanged else None
+        response.cache_key = key
+
+        new_meta = {
+            "url": url,
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified"),
+            "headers": {h: response.headers[h] for h in _KEPT_HEADERS if h in response.headers},
+            "body_hash": body_hash,
+            "size": len(content),
+            "stored_at": now,
+            "used_at": now,
+        }
+        if response.cached_items is not None:
+            new_meta["items"] = response.cached_items
+            new_meta["items_hash"] = body_hash
+            new_meta["items_cutoff"] = meta.get("items_cutoff")
+        os.makedirs(self.directory, exist_ok=True)
+        if not unchanged:
+            _write_atomic(self._paths(key)[1], content)
+        self._save_meta(key, new_meta)
+        return response
+
+    def store_items(self, response, items, cutoff=None):
+        """본문에서 추출한 결과를 저장 (다음 실행에서 본문이 같으면 파싱 생략)
+
+        cutoff: 결과를 추출할 때 적용한 기준일 - 같거나 늦은 기준일로 가져올 때만 재사용된다
+        """
+        key = getattr(response, "cache_key", None)
+        if not key:
+            return
+        meta, _ = self._load(key)
+        if not meta:
+            return
+        meta["items"] = items
+        meta["items_hash"] = meta.get("body_hash")
+        meta["items_cutoff"] = cutoff.isoformat() if cutoff else None
+        self._save_meta(key, meta)
+
+    def prune(self):
+        """오래된 항목을 지우고 전체 크기가 상한을 넘으면 오래 안 쓴 순서로 삭제"""
+        if not self.enabled or not os.path.isdir(self.directory):
+            return 0
+        now = time.time()
+        entries = []
+        names = set(os.listdir(self.directory))
+        removed = 0
+        for name in names:
+            # 메타 파일이 지워졌거나 쓰다 실패한 본문은 다시 쓰일 일이 없으므로 바로 삭제
+            if name.endswith(".body") and name[:-5] + ".json" not in names:
+                try:
+                    os.remove(os.path.join(self.directory, name))
+                    removed += 1
+                except OSError:
+                    pass
+                continue
+            if not name.endswith(".json"):
+                continue
+            key = name[:-5]
+            meta_path, body_path = self._paths(key)
+            try:
+                with open(meta_path, "r", encoding="utf-8") as f:
+                    meta = json.load(f)
+                size = os.path.getsize(meta_path) + os.path.getsize(body_path)
+            except (OSError, ValueError):
+                meta, size = {}, 0
+            entries.append((meta.get("used_at", 0), size, key))
+
+        total = sum(size for _, size, _ in entries)
+        entries.sort()
+        for used_at, size, key in entries:
+            if now - used_at <= self.max_age and total <= self.max_bytes:
+                continue
+            for path in self._paths(key):
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+            total -= size
+            removed += 1
+        return removed
+
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def get_cache():
+    """프로세스 공용 HttpCache"""
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = HttpCache()
+        return _cache
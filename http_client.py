@@ -0,0 +1,227 @@
+import socket
+import threading
+import time
+from functools import partial
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.util.ssl_ import is_ipaddress
+
+import crawl_metrics
+import http_replay
+import settings
+
+# urllib3는 brotli(또는 brotlicffi)가 설치된 경우에만 br 응답을 풀 수 있음
+try:
+    import brotli  # noqa: F401
+    ACCEPT_ENCODING = "gzip, deflate, br"
+except ImportError:
+    try:
+        import brotlicffi  # noqa: F401
+        ACCEPT_ENCODING = "gzip, deflate, br"
+    except ImportError:
+        ACCEPT_ENCODING = "gzip, deflate"
+
+
+class ConnectionStats:
+    """호스트별 요청 수와 새로 연 연결 수 (차이가 재사용된 연결 수)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._hosts = {}
+
+    def _entry(self, host):
+        return self._hosts.setdefault(host, {"requests": 0, "connections": 0})
+
+    def record_request(self, host):
+        with self._lock:
+            self._entry(host)["requests"] += 1
+
+    def record_connection(self, host):
+        with self._lock:
+            self._entry(host)["connections"] += 1
+
+    def snapshot(self):
+        with self._lock:
+            hosts = {}
+            for host, entry in self._hosts.items():
+                hosts[host] = dict(entry, reused=max(entry["requests"] - entry["connections"], 0))
+        total_requests = sum(h["requests"] for h in hosts.values())
+        total_connections = sum(h["connections"] for h in hosts.values())
+        return {
+            "requests": total_requests,
+            "connections": total_connections,
+            "reused": sum(h["reused"] for h in hosts.values()),
+            "hosts": hosts,
+        }
+
+
+class _TimedConnectionMixin:
+    """새 연결의 DNS / TCP 연결 / TLS 시간을 현재 사이트 측정값에 더함 (DNS는 HTTP_TIME_DNS일 때만 따로, 아니면 연결에 포함)"""
+
+    def _new_conn(self):
+        started = time.perf_counter()
+        if settings.HTTP_TIME_DNS and crawl_metrics.current() is not None and not is_ipaddress(self._dns_host):
+            # urllib3는 조회와 연결을 한 번에 하므로 조회 시간만 따로 재려면 미리 한 번 더 조회해야 함
+            # (glibc는 기본적으로 조회 결과를 캐시하지 않아 연결마다 DNS 조회가 두 번 - 그래서 설정으로 켤 때만)
+            try:
+                socket.getaddrinfo(self._dns_host, self.port, 0, socket.SOCK_STREAM)
+            except OSError:
+                pass
+        resolved = time.perf_counter()
+        sock = super()._new_conn()
+        self._connect_elapsed = time.perf_counter() - started
+        crawl_metrics.add("dns_ms", (resolved - started) * 1000)
+        crawl_metrics.add("connect_ms", (time.perf_counter() - resolved) * 1000)
+        return sock
+
+    def connect(self):
+        self._connect_elapsed = 0.0
+        started = time.perf_counter()
+        super().connect()
+        tls = time.perf_counter() - started - self._connect_elapsed
+        if isinstance(self, HTTPSConnection):
+            crawl_metrics.add("tls_ms", tls * 1000)
+
+
+class _TimedHTTPConnection(_TimedConnectionMixin, HTTPConnection):
+    pass
+
+
+class _TimedHTTPSConnection(_TimedConnectionMixin, HTTPSConnection):
+    pass
+
+
+class _CountingPoolMixin:
+    def __init__(self, *args, stats=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._stats = stats
+
+    def _new_conn(self):
+        if self._stats is not None:
+            self._stats.record_connection(self.host)
+        return super()._new_conn()
+
+
+class _CountingHTTPConnectionPool(_CountingPoolMixin, HTTPConnectionPool):
+    ConnectionCls = _TimedHTTPConnection
+
+
+class _CountingHTTPSConnectionPool(_CountingPoolMixin, HTTPSConnectionPool):
+    ConnectionCls = _TimedHTTPSConnection
+
+
+class _PooledAdapter(HTTPAdapter):
+    def __init__(self, stats, base_url=None, cassette=None, **kwargs):
+        self._stats = stats
+        self._base_url = base_url
+        self._cassette = cassette
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": partial(_CountingHTTPConnectionPool, stats=self._stats),
+            "https": partial(_CountingHTTPSConnectionPool, stats=self._stats),
+        }
+
+    def send(self, request, **kwargs):
+        if self._cassette is not None and self._cassette.replaying:
+            self._stats.record_request(urlsplit(request.url).hostname)
+            crawl_metrics.add("requests", 1)
+            return self._cassette.replay(request)
+
+        url = request.url
+        if self._base_url:
+            # 스텁 서버로 보내되 리다이렉트/링크 계산에는 원래 URL을 쓰도록 되돌려 둠
+            request.url = http_replay.route_url(self._base_url, url)
+        # 연결 수와 같은 기준(실제 접속 호스트)으로 세어야 재사용 수가 맞음
+        self._stats.record_request(urlsplit(request.url).hostname)
+        started = time.perf_counter()
+        try:
+            response = super().send(request, **kwargs)
+        finally:
+            request.url = url
+        response.url = url
+        crawl_metrics.add("requests", 1)
+        crawl_metrics.add("ttfb_ms", (time.perf_counter() - started) * 1000)
+        if not kwargs.get("stream"):
+            # requests도 곧바로 본문을 읽으므로 여기서 먼저 읽어 다운로드 시간과 크기를 잰다
+            started = time.perf_counter()
+            content = response.content
+            crawl_metrics.add("download_ms", (time.perf_counter() - started) * 1000)
+            crawl_metrics.add("bytes", len(content))
+            crawl_metrics.add("wire_bytes", response.raw.tell() if hasattr(response.raw, "tell") else len(content))
+        if self._cassette is not None:
+            self._cassette.record(request, response)
+        return response
+
+
+class HttpClient:
+    """두 스크래퍼가 함께 쓰는 keep-alive 연결 풀 기반 HTTP 클라이언트
+
+    base_url을 주면 모든 요청을 그 주소(stub_server.py)로 보내고,
+    cassette를 주면 응답을 기록하거나 네트워크 없이 재생한다 (http_replay.py).
+    """
+
+    def __init__(self, pool_hosts=None, pool_maxsize=None, base_url=None, cassette=None):
+        self.stats = ConnectionStats()
+        # pool_block=False: 풀이 가득 차면 임시 연결을 쓰고 반납하지 않으므로 유지 연결 수는 pool_maxsize로 제한됨
+        adapter = _PooledAdapter(
+            self.stats,
+            base_url=base_url,
+            cassette=cassette,
+            pool_connections=pool_hosts or settings.HTTP_POOL_HOSTS,
+            pool_maxsize=pool_maxsize or settings.HTTP_POOL_MAXSIZE,
+            pool_block=False,
+        )
+        self.session = requests.Session()
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.session.headers["Accept-Encoding"] = ACCEPT_ENCODING
+
+    def request(self, method, url, **kwargs):
+        return self.session.request(method, url, **kwargs)
+
+    def get(self, url, **kwargs):
+        return self.session.get(url, **kwargs)
+
+    def post(self, url, **kwargs):
+        return self.session.post(url, **kwargs)
+
+    def close(self):
+        self.session.close()
+
+
+_client = None
+_client_lock = threading.Lock()
+
+
+def get_client():
+    """프로세스 공용 HttpClient (처음 호출할 때 생성)"""
+    global _client
+    with _client_lock:
+        if _client is None:
+            _client = HttpClient(base_url=settings.HTTP_BASE_URL or None, cassette=http_replay.get_cassette())
+        return _client
+
+
+def close_client():
+    """공용 클라이언트의 연결을 모두 닫고 최종 연결 통계를 반환"""
+    global _client
+    with _client_lock:
+        client, _client = _client, None
+    if client is None:
+        return None
+    client.close()
+    return client.stats.snapshot()
+
+
+def format_stats(stats):
+    if not stats or not stats["requests"]:
+        return "HTTP 요청 없음"
+    return (f"HTTP 요청 {stats['requests']}건, 새 연결 {stats['connections']}개, "
+            f"재사용 {stats['reused']}건 ({len(stats['hosts'])}개 호스트)")
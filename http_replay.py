@@ -0,0 +1,122 @@
+import hashlib
+import json
+import os
+import threading
+import time
+from urllib.parse import urlsplit
+
+import requests
+from requests.models import Response
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+import settings
+from http_cache import _write_atomic
+
+# 저장한 본문은 이미 압축이 풀린 상태이므로 전송 관련 헤더는 버림
+_DROPPED_HEADERS = ("Content-Encoding", "Content-Length", "Transfer-Encoding", "Connection", "Keep-Alive")
+
+
+def request_key(method, url, body=None):
+    """카세트 항목 키 (stub_server.py도 같은 키로 찾음)"""
+    if isinstance(body, str):
+        body = body.encode("utf-8")
+    digest = hashlib.sha1(f"{method.upper()} {url}\n".encode("utf-8"))
+    digest.update(body or b"")
+    return digest.hexdigest()
+
+
+def route_url(base_url, url):
+    """https://host/path?q -> {base_url}/https/host/path?q (원래 호스트를 경로에 담아 스텁 서버로 보냄)"""
+    parts = urlsplit(url)
+    routed = f"{base_url.rstrip('/')}/{parts.scheme}/{parts.netloc}{parts.path or '/'}"
+    if parts.query:
+        routed += "?" + parts.query
+    return routed
+
+
+def unroute_path(path):
+    """route_url의 역변환: /https/host/path?q -> https://host/path?q (형식이 다르면 None)"""
+    parts = path.lstrip("/").split("/", 2)
+    if len(parts) < 2 or parts[0] not in ("http", "https") or not parts[1]:
+        return None
+    rest = parts[2] if len(parts) == 3 else ""
+    return f"{parts[0]}://{parts[1]}/{rest}"
+
+
+class Cassette:
+    """요청별 실제 응답을 디렉터리에 기록하고(record) 네트워크 없이 돌려줌(replay)
+
+    항목마다 <key>.json(상태/헤더/URL)과 <key>.body(압축 해제된 본문)를 저장한다.
+    """
+
+    def __init__(self, directory=None, mode=None):
+        self.directory = directory or settings.HTTP_CASSETTE_DIR
+        self.mode = mode or settings.HTTP_MODE
+        if self.mode not in ("record", "replay"):
+            raise ValueError(f"unknown cassette mode: {self.mode}")
+
+    @property
+    def replaying(self):
+        return self.mode == "replay"
+
+    def _paths(self, key):
+        base = os.path.join(self.directory, key)
+        return base + ".json", base + ".body"
+
+    def load(self, key):
+        meta_path, body_path = self._paths(key)
+        try:
+            with open(meta_path, "r", encoding="utf-8") as f:
+                meta = json.load(f)
+            with open(body_path, "rb") as f:
+                body = f.read()
+            return meta, body
+        except (OSError, ValueError):
+            return None, None
+
+    def record(self, request, response):
+        content = response.content
+        meta = {
+            "method": request.method,
+            "url": request.url,
+            "status": response.status_code,
+            "reason": response.reason,
+            "headers": {k: v for k, v in response.headers.items() if k.title() not in _DROPPED_HEADERS},
+            "recorded_at": time.time(),
+        }
+        key = request_key(request.method, request.url, request.body)
+        meta_path, body_path = self._paths(key)
+        os.makedirs(self.directory, exist_ok=True)
+        _write_atomic(body_path, content)
+        _write_atomic(meta_path, json.dumps(meta, ensure_ascii=False).encode("utf-8"))
+
+    def replay(self, request):
+        meta, body = self.load(request_key(request.method, request.url, request.body))
+        if meta is None:
+            raise requests.ConnectionError(f"not in cassette: {request.method} {request.url}", request=request)
+        response = Response()
+        response._content = body
+        response._content_consumed = True
+        response.status_code = meta["status"]
+        response.reason = meta.get("reason")
+        response.headers = CaseInsensitiveDict(meta.get("headers", {}))
+        response.encoding = get_encoding_from_headers(response.headers)
+        response.url = request.url
+        response.request = request
+        return response
+
+
+_lock = threading.Lock()
+_cassette = None
+
+
+def get_cassette():
+    """NEWS_BOT_HTTP_MODE가 record/replay일 때 공용 Cassette, live면 None"""
+    global _cassette
+    if settings.HTTP_MODE == "live":
+        return None
+    with _lock:
+        if _cassette is None:
+            _cassette = Cassette()
+        return _cassette
@@ -1,10 +1,41 @@
-import requests
-from bs4 import BeautifulSoup
-import re
-from urllib.parse import urljoin
-import time
+import argparse
+import json
+import multiprocessing
+import os
+import queue
+from functools import partial
+from urllib.parse import urlsplit
 import random
+import sys
+import threading
+import time
+import zlib
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from datetime import datetime
+
+import requests
+
+import crawl_metrics
+import http_client
+import settings
+from charset_resolver import CharsetResolver
+from crawl_metrics import CrawlMetrics
+from date_extract import DateCutoff, cutoff_date, json_default
+from html_parser import get_default_backend
+from http_cache import get_cache
+from item_store import ItemStore, item_key
+from listing_extractor import ListingExtractor, extract_listing, init_worker
+from near_duplicates import NearDuplicateIndex
+from news_item import restore_items
+from rate_limiter import HostRateLimiter
+from report_writer import EngineHtmlReport, EngineTxtReport, ReportWriter
+from site_health import SiteHealth
+from site_profiles import SiteProfileStore
+
+# 응답 시간 기록이 충분하지 않은 사이트의 요청 제한 시간(초)
+DEFAULT_TIMEOUT = 15
+
 # 수집 대상 사이트 설정 (필요에 따라 추가/수정 가능)
 # 수집 대상 사이트 설정 (특별시, 광역시, 도청, 서울 구청 및 여행/관광 사이트 포함)
 TARGET_SITES = [
@@ -79,8 +110,111 @@ TARGET_SITES = [
 ]
 
 
+def load_sites(path=None):
+    """수집 대상 목록 - NEWS_BOT_SITES_FILE(스텁 서버가 만든 가상 사이트 등)이 있으면 그 목록"""
+    path = path or settings.SITES_FILE
+    if not path:
+        return TARGET_SITES
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def shard_of(url, count):
+    """호스트 해시(crc32)로 정한 샤드 번호 - 같은 호스트는 항상 같은 샤드 (호스트별 요청 간격/상태 유지)"""
+    host = (urlsplit(url).hostname or url).lower()
+    return zlib.crc32(host.encode("utf-8")) % count
+
+
+def shard_sites(sites, index, count):
+    """사이트 목록 중 index번째 샤드 몫 (원래 순서 유지)"""
+    return [site for site in sites if shard_of(site["url"], count) == index]
+
+
+def parse_shard(text):
+    """'i/n' -> (i, n), 0 <= i < n"""
+    try:
+        index, count = (int(part) for part in text.split("/"))
+    except ValueError:
+        raise ValueError(f"shard must look like i/n, got {text!r}")
+    if not 0 <= index < count:
+        raise ValueError(f"shard index must be in 0..{count - 1}, got {index}")
+    return index, count
+
+
+class ParsePool:
+    """파싱 프로세스 풀 - 워커가 비정상 종료해 풀이 깨지면(BrokenProcessPool) 새로 만듦
+
+    깨진 풀에는 제출이 계속 실패하므로 max_restarts번까지는 새 풀로 바꾸고,
+    그 뒤로는 submit()이 None을 돌려 호출한 쪽이 직접 파싱하게 한다.
+    """
+
+    def __init__(self, factory, max_restarts=None):
+        self._factory = factory
+        self.max_restarts = settings.PARSE_POOL_RESTARTS if max_restarts is None else max_restarts
+        self.restarts = 0
+        self._lock = threading.Lock()
+        self._pool = factory()
+        self._retired = []
+
+    def _replace(self, broken):
+        with self._lock:
+            # 여러 수집 스레드가 동시에 깨진 풀을 만나도 한 번만 교체
+            if self._pool is not broken:
+                return
+            self._retired.append(broken)
+            if self.restarts < self.max_restarts:
+                self.restarts += 1
+                print(f"파싱 프로세스 풀이 깨져 새로 만듭니다 ({self.restarts}/{self.max_restarts})")
+                self._pool = self._factory()
+            else:
+                print("파싱 프로세스 풀이 계속 깨져 남은 사이트는 수집 스레드에서 파싱합니다")
+                self._pool = None
+
+    def submit(self, fn, *args):
+        """Future 또는 쓸 수 있는 풀이 없으면 None"""
+        while True:
+            with self._lock:
+                pool = self._pool
+            if pool is None:
+                return None
+            try:
+                return pool.submit(fn, *args)
+            except BrokenProcessPool:
+                self._replace(pool)
+
+    def shutdown(self):
+        with self._lock:
+            pools = self._retired + ([self._pool] if self._pool is not None else [])
+        for pool in pools:
+            pool.shutdown(wait=True, cancel_futures=True)
+
+
 class IntegratedNewsEngine:
-    def __init__(self):
+    def __init__(self, max_workers=None, host_interval=None, client=None, only_new=None, parse_processes=None):
+        # 모든 요청은 공용 연결 풀 클라이언트로 보냄 (호스트별 keep-alive 재사용)
+        self.client = client or http_client.get_client()
+        self.cache = get_cache()
+        # 동시 수집 개수 (1이면 기존처럼 순차 수집)
+        self.max_workers = max_workers or settings.CRAWL_MAX_WORKERS
+        # 파싱/추출은 별도 프로세스에서 (GIL에 묶이지 않고 코어 수만큼) - 0이면 수집 스레드에서 바로
+        self.parse_processes = settings.PARSE_PROCESSES if parse_processes is None else parse_processes
+        # 랜덤 sleep 대신 호스트별 요청 간격으로 예의(politeness) 유지
+        if host_interval is None:
+            host_interval = settings.HOST_MIN_INTERVAL
+        self.rate_limiter = HostRateLimiter(host_interval)
+        # 이전 실행에서 이미 보고한 항목은 리포트에서 제외
+        if only_new is None:
+            only_new = settings.ONLY_NEW_ITEMS
+        self.item_store = ItemStore() if only_new else None
+        # 사이트별로 실제 결과를 낸 목록 선택자를 기억해 다음 실행에서 먼저 시도
+        self.profiles = SiteProfileStore()
+        # 사이트별 응답 시간/연속 실패 (제한 시간 조정과 회로 차단)
+        self.health = SiteHealth(self.profiles, DEFAULT_TIMEOUT)
+        # 선언 없는 페이지의 인코딩은 추정 후 프로필에 기억
+        self.charset = CharsetResolver(self.profiles)
+        # 사이트별 연결/응답/파싱 측정값 (run()마다 새로 시작)
+        self.metrics = CrawlMetrics("integrated_news_engine")
+        self._local = threading.local()
         self.user_agents = [
             "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
             "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
@@ -94,6 +228,9 @@ class IntegratedNewsEngine:
             "table[summary*='게시판']", "table.table", ".board_list", ".list_type",
             ".news_list", ".bbsList", ".boardList", ".list_item"
         ]
+        # 목록 페이지 파싱/추출 (파싱 프로세스도 같은 키워드/패턴으로 만듦)
+        self.extractor = ListingExtractor(self.money_keywords, self.table_patterns)
+        self.keyword_matcher = self.extractor.keyword_matcher
 
     def get_headers(self):
         return {
@@ -105,135 +242,392 @@ class IntegratedNewsEngine:
         }
 
     def is_money_news(self, title):
-        # 키워드 필터링 로직
-        for kw in self.money_keywords:
-            if kw in title:
-                return True
-        return False
+        return self.extractor.is_money_news(title)
+
+    def _scrape_failed(self, e):
+        self._local.scrape_info = f"실패: {repr(e)}"
+        crawl_metrics.set_status("timeout" if isinstance(e, requests.Timeout) else "error", repr(e))
+        return None
+
+    def _fetch(self, url):
+        """요청+디코딩 - (결과, None) 또는 파싱할 본문이 있으면 (None, (응답, since, 본문))"""
+        started = time.perf_counter()
+        since = self._since(url)
+        cutoff = cutoff_date(since)
+        try:
+            # 조건부 GET 캐시: 304 또는 본문이 같으면 이전 추출 결과를 기준일로 다시 걸러 사용
+            response = self.cache.fetch(self.client, url, headers=self.get_headers(), timeout=self.health.timeout(url),
+                                        max_bytes=settings.MAX_PAGE_BYTES, cutoff=cutoff)
+        except Exception as e:
+            # 요청 단계의 실패만 사이트 상태에 반영 (파싱 오류는 사이트 문제가 아님)
+            self.health.failure(url, repr(e))
+            return self._scrape_failed(e), None
+        self.health.success(url, time.perf_counter() - started)
+
+        try:
+            if response.unchanged and response.cached_items is not None:
+                results = DateCutoff(cutoff).filter(response.cached_items)
+                self._local.scrape_info = "변경 없음 (캐시)"
+                crawl_metrics.set_status("cached")
+                crawl_metrics.add("accepted", len(results))
+                return results, None
+
+            return None, (response, since, self.charset.decode(response, url))
+        except Exception as e:
+            return self._scrape_failed(e), None
+
+    def _store(self, url, response, since, results):
+        # 기준일로 잘라 낸 결과도 그 기준일과 함께 저장 (같거나 늦은 기준일의 다음 실행에서 재사용)
+        self.cache.store_items(response, results, cutoff_date(since))
+        if self.item_store is not None:
+            self.profiles.update(url, last_run=datetime.now().strftime('%Y-%m-%d'))
+        return results
 
     def smart_scrape(self, url):
+        news_list, job = self._fetch(url)
+        if job is None:
+            return news_list
+        response, since, text = job
         try:
-            session = requests.Session()
-            response = session.get(url, headers=self.get_headers(), timeout=15)
-            response.raise_for_status()
-            
-            if response.encoding == 'ISO-8859-1':
-                response.encoding = response.apparent_encoding
-                
-            soup = BeautifulSoup(response.text, 'html.parser')
-            rows = []
-            for pattern in self.table_patterns:
-                areas = soup.select(pattern)
-                for area in areas:
-                    found = area.select("tbody tr, tr, li, .item, .list_item, .post-item")
-                    if found: rows.extend(found)
-            
-            if not rows:
-                content_area = soup.select_one("#contents, #content, .content, main")
-                if content_area:
-                    rows = content_area.select("tr, li, div[class*='item']")
-                else:
-                    rows = soup.select("tr, li")
-
-            results = []
-            seen_titles = set()
-            
-            for row in rows:
-                links = row.find_all("a")
-                if not links: continue
-                
-                valid_links = [l for l in links if len(l.get_text(strip=True)) > 5]
-                if not valid_links: continue
-                
-                title_tag = max(valid_links, key=lambda x: len(x.get_text(strip=True)))
-                title = title_tag.get_text(strip=True)
-                title = re.sub(r"\[공지\]|\[새글\]|NEW", "", title).strip()
-                
-                if title in seen_titles or len(title) < 5: continue
-                
-                # 키워드 필터링 적용
-                if not self.is_money_news(title): continue
-                
-                seen_titles.add(title)
-                link = urljoin(url, title_tag['href'])
-                
-                results.append({
-                    "title": title,
-                    "link": link,
-                    "date": datetime.now().strftime("%Y-%m-%d") # 실제 날짜 추출 로직은 이전 코드 참고
-                })
-                if len(results) >= 5: break # 사이트당 최대 5건만 수집
-                
-            return results
+            return self._store(url, response, since, self.extract_items(url, text, since))
         except Exception as e:
-            return None
+            return self._scrape_failed(e)
+
+    def _since(self, url):
+        # 새 항목만 보고하는 실행이면 마지막 성공 실행일 이전 글은 읽지 않음
+        return self.profiles.get(url).get("last_run") if self.item_store is not None else None
 
-    def run(self):
-        collected_data = []
-        total_count = 0
-        
-        for site in TARGET_SITES:
-            print(f"[{site['name']}] 수집 중...")
+    def _learn(self, url, update, info):
+        if update:
+            self.profiles.update(url, **update)
+        self._local.scrape_info = info
+
+    def extract_items(self, url, html, since=None):
+        """since: 이 날짜(마지막 성공 실행일) 이전 글은 건너뜀 - MAX_ITEM_AGE_DAYS 기준일과 늦은 쪽 적용"""
+        learned = self.profiles.get(url).get("pattern")
+        results, update, info = self.extractor.extract(url, html, learned, cutoff_date(since))
+        self._learn(url, update, info)
+        return results
+
+    def _admit(self, site):
+        """회로가 열린 사이트는 건너뜀으로 기록하고 False, 아니면 호스트 간격을 기다린 뒤 True"""
+        if not self.health.allow(site['url'], site['name']):
+            # 연속 실패로 회로가 열린 사이트는 쿨다운이 끝날 때까지 요청하지 않음
+            print(f"[{site['name']}] 건너뜀 (연속 실패로 차단 중)")
+            with self.metrics.site(site['name'], site['url']):
+                crawl_metrics.set_status("skipped")
+            return False
+        self.rate_limiter.wait(site['url'])
+        print(f"[{site['name']}] 수집 중...")
+        self._local.scrape_info = ""
+        return True
+
+    def crawl_site(self, site):
+        if not self._admit(site):
+            return None
+        with self.metrics.site(site['name'], site['url']):
             news_list = self.smart_scrape(site['url'])
+        print(f"[{site['name']}] {len(news_list or [])}건 ({self._local.scrape_info})")
+        return news_list
+
+    def _fetch_stage(self, index, site, pool, slots, done):
+        """1단계(수집 스레드): 요청/디코딩까지 하고 파싱은 프로세스 풀에 넘긴 뒤 다음 사이트로
+
+        done에는 (순번, 결과를 돌려주는 함수)를 넣는다 - 함수는 메인 스레드에서 실행된다.
+        """
+        finish = lambda: None
+        try:
+            if not self._admit(site):
+                return
+            url = site['url']
+            record = self.metrics.begin(site['name'], url)
+            with crawl_metrics.recording(record):
+                news_list, job = self._fetch(url)
+            if job is None:
+                self.metrics.end(record)
+                print(f"[{site['name']}] {len(news_list or [])}건 ({self._local.scrape_info})")
+                finish = lambda: news_list
+                return
+
+            response, since, text = job
+            learned, cutoff = self.profiles.get(url).get("pattern"), cutoff_date(since)
+            # 파싱 대기열이 차 있으면 자리가 날 때까지 이 스레드가 기다림 (backpressure)
+            slots.acquire()
+            try:
+                future = pool.submit(extract_listing, url, text, learned, cutoff)
+            except Exception as e:
+                # 제출하지 못하면 자리를 바로 돌려놓음 (안 그러면 자리가 새어 수집 스레드가 영영 멈춤)
+                slots.release()
+                with crawl_metrics.recording(record):
+                    self._scrape_failed(e)
+                self.metrics.end(record)
+                print(f"[{site['name']}] 0건 ({self._local.scrape_info})")
+                return
+            if future is None:
+                # 풀을 더 쓸 수 없으면 이 스레드에서 파싱
+                slots.release()
+                future = self._extract_here(record, url, text, learned, cutoff)
+                finish = partial(self._parsed_stage, site, record, response, since, future)
+                return
+            parsed = partial(self._parsed_stage, site, record, response, since, future)
+            future.add_done_callback(lambda _: (slots.release(), done.put((index, parsed))))
+            finish = None
+        finally:
+            if finish is not None:
+                done.put((index, finish))
+
+    def _extract_here(self, record, url, text, learned, cutoff):
+        """프로세스 풀 대신 현재 스레드에서 추출 - extract_listing과 같은 모양의 결과를 담은 완료된 Future"""
+        future = Future()
+        with crawl_metrics.recording(record):
+            try:
+                results, update, info = self.extractor.extract(url, text, learned, cutoff)
+            except Exception as e:
+                future.set_exception(e)
+            else:
+                # 측정값은 이미 record에 바로 기록됨
+                future.set_result((results, update, info, {}))
+        return future
+
+    def _parsed_stage(self, site, record, response, since, future):
+        """3단계(메인 스레드): 파싱 프로세스의 결과를 측정값/학습 프로필/캐시에 반영"""
+        url = site['url']
+        with crawl_metrics.recording(record):
+            try:
+                results, update, info, counters = future.result()
+                crawl_metrics.add_counters(counters)
+                self._learn(url, update, info)
+                news_list = self._store(url, response, since, results)
+            except Exception as e:
+                news_list = self._scrape_failed(e)
+        self.metrics.end(record)
+        print(f"[{site['name']}] {len(news_list or [])}건 ({self._local.scrape_info})")
+        return news_list
+
+    def _pipeline(self, sites):
+        """수집(스레드) -> 파싱/추출(프로세스 풀) -> 반영/새 항목 거르기(메인 스레드) -> 리포트
+
+        파싱을 기다리거나 파싱 중인 페이지가 PARSE_QUEUE_SIZE개면 수집 스레드가 멈춘다.
+        사이트는 끝나는 순서대로 도착하지만 리포트는 사이트 목록 순서로 흘려보내므로,
+        앞 사이트를 기다리는 결과(추출된 항목)만 잠시 보관한다.
+        """
+        done = queue.Queue()
+        slots = threading.BoundedSemaphore(settings.PARSE_QUEUE_SIZE)
+        # 수집 스레드가 도는 중에 fork하지 않도록 spawn (Windows/macOS 기본값과 같은 방식)
+        # 워커가 죽어 풀이 깨지면 ParsePool이 새 풀로 바꿈 (그때 파싱 중이던 사이트만 오류로 기록)
+        pool = ParsePool(partial(
+            ProcessPoolExecutor, self.parse_processes, mp_context=multiprocessing.get_context("spawn"),
+            initializer=init_worker, initargs=(self.money_keywords, self.table_patterns, get_default_backend()),
+        ))
+        fetchers = ThreadPoolExecutor(max_workers=self.max_workers)
+        try:
+            for index, site in enumerate(sites):
+                fetchers.submit(self._fetch_stage, index, site, pool, slots, done)
+            waiting = {}
+            next_index = 0
+            for _ in range(len(sites)):
+                index, finish = done.get()
+                waiting[index] = finish()
+                while next_index in waiting:
+                    yield from self._new_results([sites[next_index]], [waiting.pop(next_index)])
+                    next_index += 1
+        finally:
+            fetchers.shutdown(wait=True, cancel_futures=True)
+            pool.shutdown()
+
+    def _new_results(self, sites, results):
+        """(사이트 이름, 새 항목) 을 사이트 목록 순서대로 흘려보냄"""
+        for site, news_list in zip(sites, results):
+            # 엔진이 추출한 항목의 소스는 사이트 이름 (TourismScraper 항목과 같은 형태)
+            for item in news_list or ():
+                item.source = site['name']
+            if news_list and self.item_store is not None:
+                news_list = self.item_store.filter_new(news_list, source=site['name'])
             if news_list:
-                collected_data.append({"site_name": site['name'], "news_list": news_list})
-                total_count += len(news_list)
-            time.sleep(random.uniform(0.1, 0.5))
-
-        # 1. 텍스트 리포트 생성
-        report = []
-        report.append(f"📅 수집 일시: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        report.append(f"🔍 필터 키워드: {', '.join(self.money_keywords)}")
-        report.append("="*60)
-        
-        for entry in collected_data:
-            report.append(f"\n📌 {entry['site_name']} ({len(entry['news_list'])}건)")
-            for news in entry['news_list']:
-                report.append(f"- {news['title']}")
-                report.append(f"  🔗 {news['link']}")
-        
-        report.append("\n" + "="*60)
-        report.append(f"✅ 총 {total_count}건의 '돈 되는 정보'를 수집했습니다.")
-        final_report_txt = "\n".join(report)
-        
-        with open("daily_news_report.txt", "w", encoding="utf-8") as f:
-            f.write(final_report_txt)
-
-        # 2. HTML 리포트 생성 (클릭 가능한 링크용)
-        html_lines = [
-            "<html><head><meta charset='utf-8'><style>",
-            "body { font-family: 'Malgun Gothic', dotum, sans-serif; line-height: 1.6; max-width: 800px; margin: 20px auto; padding: 20px; border: 1px solid #ddd; border-radius: 10px; }",
-            "h1 { color: #2c3e50; text-align: center; border-bottom: 2px solid #3498db; padding-bottom: 10px; }",
-            "h3 { color: #2980b9; margin-top: 30px; border-left: 5px solid #3498db; padding-left: 10px; }",
-            "ul { list-style: none; padding: 0; }",
-            "li { margin-bottom: 15px; padding: 10px; background: #f9f9f9; border-radius: 5px; }",
-            "a { color: #3498db; text-decoration: none; font-weight: bold; font-size: 1.1em; }",
-            "a:hover { text-decoration: underline; color: #2980b9; }",
-            ".info { color: #7f8c8d; font-size: 0.9em; margin-bottom: 20px; }",
-            ".footer { margin-top: 40px; text-align: center; color: #95a5a6; font-size: 0.9em; border-top: 1px solid #eee; padding-top: 20px; }",
-            "</style></head><body>",
-            f"<h1>📅 오늘자 뉴스 수집 리포트</h1>",
-            f"<div class='info'>📅 <b>수집 일시:</b> {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}<br>",
-            f"🔍 <b>필터 키워드:</b> {', '.join(self.money_keywords)}</div>"
-        ]
+                yield site['name'], news_list
+
+    def _crawl(self, sites):
+        if self.parse_processes > 0:
+            yield from self._pipeline(sites)
+            return
+        # executor.map은 입력 순서대로 결과를 돌려주므로 결과 순서는 사이트 목록 순서로 고정됨
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            results = executor.map(self.crawl_site, sites)
+            yield from self._new_results(sites, results)
+
+    @staticmethod
+    def _drop_near_duplicates(groups, duplicates):
+        """앞선 사이트에 이미 나온 같은 보도자료(제목이 조금 다른 것 포함)는 빼고 흘려보냄
+
+        빠진 글은 duplicates의 묶음에 남아 리포트 끝에 소스 목록과 함께 정리된다.
+        """
+        for name, news_list in groups:
+            news_list = [item for item, head in zip(news_list, duplicates.add_many(news_list)) if head is item]
+            if news_list:
+                yield name, news_list
+
+    def _write_report(self, groups, metrics, health):
+        # TXT/HTML 리포트를 그룹이 들어오는 대로 바로 기록 (전체 결과를 모아 두지 않음)
+        writer = ReportWriter([
+            EngineTxtReport("daily_news_report.txt"),
+            EngineHtmlReport("daily_news_report.html"),
+        ])
+        duplicates = NearDuplicateIndex() if settings.NEAR_DUP_THRESHOLD > 0 else None
+        if duplicates is not None:
+            groups = self._drop_near_duplicates(groups, duplicates)
+        meta = {
+            "generated_at": datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+            "keywords": self.money_keywords,
+            "metrics": metrics,
+            "health": health,
+            "duplicates": duplicates,
+        }
+        return writer.write(groups, meta)
+
+    @staticmethod
+    def _collect(groups, items):
+        """리포트로 흘려보내는 그룹의 항목을 items에도 모음 (실행 결과 저장용)"""
+        for name, news_list in groups:
+            items.extend(news_list)
+            yield name, news_list
+
+    @staticmethod
+    def _export_history(items):
+        """실행 결과 파일(history_export)과 날짜별 보관소(news_archive)에 남김"""
+        # pandas는 여기서만 필요하므로 이때 불러옴 (파싱 프로세스 시작을 가볍게)
+        import history_export
+        import news_archive
+        try:
+            path = history_export.export_run(items, "integrated_news_engine")
+            added = news_archive.get_archive().append(items)
+        except Exception as e:
+            print(f"수집 결과 저장 실패: {repr(e)}")
+            return
+        if path:
+            print(f"수집 결과 저장: {path}, 보관소에 새 글 {added}건")
+
+    def run(self, sites=None):
+        sites = sites if sites is not None else load_sites()
+        self.metrics = CrawlMetrics("integrated_news_engine")
+        self.health = SiteHealth(self.profiles, DEFAULT_TIMEOUT)
+        items = []
+        totals = self._write_report(self._collect(self._crawl(sites), items), self.metrics, self.health)
+        self.profiles.save()
+        self._export_history(items)
+        self.metrics.export()
+        print(crawl_metrics.format_summary(self.metrics))
 
-        for entry in collected_data:
-            html_lines.append(f"<h3>📌 {entry['site_name']} ({len(entry['news_list'])}건)</h3><ul>")
-            for news in entry['news_list']:
-                html_lines.append(f"<li><a href='{news['link']}' target='_blank'>{news['title']}</a></li>")
-            html_lines.append("</ul>")
-
-        html_lines.append(f"<div class='footer'>✅ 총 {total_count}건의 정보를 수집했습니다.</div>")
-        html_lines.append("</body></html>")
-        
-        final_report_html = "".join(html_lines)
-        with open("daily_news_report.html", "w", encoding="utf-8") as f:
-            f.write(final_report_html)
-        
+        total_count = totals["items"]
         print(f"\n수집 완료! 총 {total_count}건. TXT/HTML 리포트가 생성되었습니다.")
-        return final_report_txt
+        return total_count
 
+    def run_shard(self, index, count, out_path, sites=None):
+        """사이트 목록을 count개로 나눈 것 중 index번째만 수집해 부분 결과(JSON)로 저장
+
+        샤드는 호스트 해시로 정해지므로 같은 사이트는 매번 같은 샤드에서 수집되고,
+        샤드별 상태(.news_bot: 이력/프로필/캐시)도 그대로 이어진다. 리포트는 merge_shards()가 만든다.
+        """
+        sites = shard_sites(sites if sites is not None else load_sites(), index, count)
+        self.metrics = CrawlMetrics("integrated_news_engine")
+        self.health = SiteHealth(self.profiles, DEFAULT_TIMEOUT)
+        groups = list(self._crawl(sites))
+        self.profiles.save()
+        # 샤드의 상태 디렉터리(.news_bot)에 남김 - 같은 사이트는 늘 같은 샤드이므로 이력도 이어짐
+        self._export_history([item for _, news_list in groups for item in news_list])
+
+        partial = {
+            "shard": [index, count],
+            "sites": [site["name"] for site in sites],
+            "groups": groups,
+            "metrics": self.metrics.records(),
+            "elapsed_ms": self.metrics.summary()["elapsed_ms"],
+            "health": self.health.unhealthy(),
+        }
+        directory = os.path.dirname(out_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = out_path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(partial, f, ensure_ascii=False, default=json_default)
+        os.replace(tmp_path, out_path)
+        print(crawl_metrics.format_summary(self.metrics))
+        print(f"\n샤드 {index}/{count}: 사이트 {len(sites)}곳, {sum(len(items) for _, items in groups)}건 -> {out_path}")
+        return partial
+
+    def merge_shards(self, paths, sites=None):
+        """샤드별 부분 결과를 합쳐 리포트 생성 (사이트 목록 순서, 같은 사이트의 같은 글은 한 번만)
+
+        읽은 샤드 결과가 하나도 없으면 빈 리포트를 만들지 않고 None을 반환한다.
+        """
+        order = {site["name"]: i for i, site in enumerate(sites if sites is not None else load_sites())}
+        groups = {}
+        seen = set()
+        records = []
+        health = []
+        elapsed_ms = 0.0
+        loaded = 0
+        for path in paths:
+            # 실패한 샤드는 결과 파일이 없음 - 나머지 샤드로 리포트
+            if not os.path.exists(path):
+                print(f"샤드 결과 없음, 건너뜀: {path}")
+                continue
+            with open(path, "r", encoding="utf-8") as f:
+                partial = json.load(f)
+            loaded += 1
+            for name, items in partial["groups"]:
+                group = groups.setdefault(name, [])
+                for item in restore_items(items):
+                    key = item_key(item, source=name)
+                    if key in seen: continue
+                    seen.add(key)
+                    group.append(item)
+            records.extend(partial.get("metrics", []))
+            health.extend(partial.get("health", []))
+            # 샤드는 동시에 돌므로 전체 시간은 가장 오래 걸린 샤드
+            elapsed_ms = max(elapsed_ms, partial.get("elapsed_ms", 0.0))
+
+        if not loaded:
+            print("읽은 샤드 결과가 없어 리포트를 만들지 않습니다.")
+            return None
+
+        # 목록에 없는 사이트(다른 사이트 목록으로 돌린 샤드)는 뒤에 파일 순서대로
+        ordered = sorted((group for group in groups.items() if group[1]), key=lambda g: order.get(g[0], len(order)))
+        self.metrics = CrawlMetrics.from_records("integrated_news_engine", records, elapsed_ms)
+        totals = self._write_report(ordered, self.metrics, sorted(health, key=lambda r: (r["state"], r["site"])))
+        self.metrics.export()
+        print(crawl_metrics.format_summary(self.metrics))
+        print(f"\n병합 완료! 샤드 {loaded}/{len(paths)}개, 총 {totals['items']}건. TXT/HTML 리포트가 생성되었습니다.")
+        return totals["items"]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="사이트 목록 수집 후 daily_news_report.txt/html 생성")
+    parser.add_argument("--shard", metavar="I/N", help="호스트 해시로 나눈 N개 중 I번째(0부터)만 수집해 --out에 저장")
+    parser.add_argument("--out", default=None, help="--shard 부분 결과 경로 (기본 shard-I.json)")
+    parser.add_argument("--merge", nargs="+", metavar="PARTIAL", help="--shard 결과 파일들을 합쳐 리포트 생성")
+    args = parser.parse_args()
+
+    if args.merge:
+        # 샤드 결과가 하나도 없으면 실패로 끝내 빈 리포트가 메일로 나가지 않게 함
+        if IntegratedNewsEngine(only_new=False).merge_shards(args.merge) is None:
+            sys.exit(1)
+        return
 
-if __name__ == "__main__":
     engine = IntegratedNewsEngine()
-    engine.run()
+    if args.shard:
+        try:
+            index, count = parse_shard(args.shard)
+        except ValueError as e:
+            parser.error(str(e))
+        engine.run_shard(index, count, args.out or f"shard-{index}.json")
+    else:
+        engine.run()
+    print(http_client.format_stats(http_client.close_client()))
+    engine.cache.prune()
+    if engine.item_store is not None:
+        engine.item_store.compact()
+        engine.item_store.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+import hashlib
+import os
+import re
+import sqlite3
+import threading
+import time
+import unicodedata
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+import settings
+
+# 링크 정규화 시 제거할 추적/세션 파라미터
+_IGNORED_PARAMS = re.compile(r"^(utm_\w+|fbclid|gclid|jsessionid|phpsessid)$", re.IGNORECASE)
+_TITLE_NOISE = re.compile(r"\[공지\]|\[새글\]|NEW|[\W_]+", re.UNICODE)
+
+
+def normalize_title(title):
+    title = unicodedata.normalize("NFKC", title or "")
+    return _TITLE_NOISE.sub("", title).lower()
+
+
+def normalize_link(link):
+    if not link:
+        return ""
+    parts = urlsplit(link.strip())
+    path = re.sub(r";jsessionid=[^/?#]*", "", parts.path, flags=re.IGNORECASE)
+    query = [(k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True) if not _IGNORED_PARAMS.match(k)]
+    return urlunsplit(("", (parts.hostname or "").lower(), path.rstrip("/"), urlencode(sorted(query)), ""))
+
+
+def item_key(item, source=None):
+    """정규화한 출처 + 링크 + 제목의 해시 (실행 간 같은 글 판별용)"""
+    raw = "\n".join([source or item.get("source") or "", normalize_link(item.get("link")), normalize_title(item.get("title"))])
+    return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+
+class ItemStore:
+    """이전 실행에서 본 항목 기록 (키 조회는 기본 키 인덱스로 처리)"""
+
+    def __init__(self, path=None, retention_days=None):
+        self.path = path or settings.ITEM_STORE_PATH
+        self.retention_days = settings.ITEM_RETENTION_DAYS if retention_days is None else retention_days
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS seen_items ("
+            " key TEXT PRIMARY KEY, source TEXT, title TEXT, link TEXT,"
+            " first_seen REAL NOT NULL, last_seen REAL NOT NULL) WITHOUT ROWID"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_seen_items_last_seen ON seen_items (last_seen)")
+        self._conn.commit()
+
+    def filter_new(self, items, source=None, mark=True):
+        """처음 보는 항목만 돌려주고, 이미 본 항목은 마지막 확인 시각만 갱신
+
+        mark=False면 처음 보는 항목을 본 것으로 기록하지 않음 - 실제로 보낸 항목만 나중에 mark_seen()으로 기록할 때
+        """
+        now = time.time()
+        new_items = []
+        with self._lock, self._conn:
+            for item in items:
+                key = item_key(item, source)
+                if mark:
+                    cur = self._conn.execute(
+                        "INSERT OR IGNORE INTO seen_items VALUES (?, ?, ?, ?, ?, ?)",
+                        (key, source or item.get("source"), item.get("title"), item.get("link"), now, now),
+                    )
+                    is_new = bool(cur.rowcount)
+                else:
+                    is_new = self._conn.execute("SELECT 1 FROM seen_items WHERE key = ?", (key,)).fetchone() is None
+                if is_new:
+                    new_items.append(item)
+                else:
+                    self._conn.execute("UPDATE seen_items SET last_seen = ? WHERE key = ?", (now, key))
+        return new_items
+
+    def mark_seen(self, items, source=None):
+        """항목들을 본 것으로 기록 (filter_new(mark=False)로 고른 것 중 실제로 보낸 항목)"""
+        now = time.time()
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO seen_items VALUES (?, ?, ?, ?, ?, ?)",
+                [(item_key(item, source), source or item.get("source"), item.get("title"), item.get("link"), now, now)
+                 for item in items],
+            )
+
+    def contains(self, item, source=None):
+        with self._lock:
+            row = self._conn.execute("SELECT 1 FROM seen_items WHERE key = ?", (item_key(item, source),)).fetchone()
+        return row is not None
+
+    def compact(self):
+        """보존 기간 동안 다시 보이지 않은 항목 삭제 (많이 지웠으면 파일도 정리)"""
+        cutoff = time.time() - self.retention_days * 86400
+        with self._lock:
+            with self._conn:
+                deleted = self._conn.execute("DELETE FROM seen_items WHERE last_seen < ?", (cutoff,)).rowcount
+            if deleted > 1000:
+                self._conn.execute("VACUUM")
+        return deleted
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,58 @@
+import re
+
+
+class KeywordMatcher:
+    """키워드 목록을 한 번 컴파일해 제목을 한 번만 훑어 모든 매치 위치를 찾는 매처
+
+    긴 키워드를 먼저 두는 하나의 정규식 대안(alternation)으로 만들어
+    각 위치에서 가장 긴 키워드를 고르고(leftmost-longest), 겹치지 않는 매치를 돌려준다.
+    필터링(contains_any), 하이라이트(highlight), 점수 계산(counts)이 같은 매처를 쓴다.
+    """
+
+    def __init__(self, keywords, ignore_case=True):
+        self.keywords = list(dict.fromkeys(k for k in keywords if k))
+        self.ignore_case = ignore_case
+        # 매치된 문자열 -> 원래 키워드 (대소문자 무시 시 정규화해서 찾음)
+        self._canonical = {self._fold(k): k for k in self.keywords}
+        ordered = sorted(self.keywords, key=len, reverse=True)
+        flags = re.IGNORECASE if ignore_case else 0
+        self._pattern = re.compile("|".join(map(re.escape, ordered)), flags) if ordered else None
+
+    def _fold(self, text):
+        return text.lower() if self.ignore_case else text
+
+    def contains_any(self, text):
+        return bool(self._pattern and text and self._pattern.search(text))
+
+    def spans(self, text):
+        """[(시작, 끝, 키워드), ...] - 한 번의 스캔으로 찾은 겹치지 않는 매치"""
+        if not self._pattern or not text:
+            return []
+        return [(m.start(), m.end(), self._canonical.get(self._fold(m.group(0)), m.group(0)))
+                for m in self._pattern.finditer(text)]
+
+    def counts(self, text):
+        """키워드별 등장 횟수 (키워드 점수 계산용)"""
+        result = {}
+        for _, _, keyword in self.spans(text):
+            result[keyword] = result.get(keyword, 0) + 1
+        return result
+
+    def highlight(self, text, before, after, escape=None):
+        """매치 부분을 before/after로 감쌈 (escape를 주면 나머지 텍스트와 매치 모두에 적용)"""
+        if not self._pattern or not text:
+            return escape(text) if escape and text else text
+        if escape is None:
+            return self._pattern.sub(lambda m: before + m.group(0) + after, text)
+
+        parts = []
+        last = 0
+        for m in self._pattern.finditer(text):
+            start, end = m.span()
+            parts.append(escape(text[last:start]))
+            parts.append(before)
+            parts.append(escape(m.group(0)))
+            parts.append(after)
+            last = end
+        parts.append(escape(text[last:]))
+        return "".join(parts)
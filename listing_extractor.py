@@ -0,0 +1,191 @@
+import re
+import time
+from urllib.parse import urljoin
+
+import crawl_metrics
+import html_parser
+from date_extract import DateCutoff, extract_date
+from html_parser import container_strainer, node_key, parse_html
+from keyword_matcher import KeywordMatcher
+from news_item import NewsItem
+
+# 목록 영역을 찾지 못했을 때의 대체 탐색 (학습 프로필에는 이 이름으로 기록)
+CONTENT_FALLBACK = "@content"
+DOCUMENT_FALLBACK = "@document"
+CONTENT_SELECTOR = "#contents, #content, .content, main"
+
+# 사이트당 최대 수집 건수 (채워지면 남은 행/패턴은 보지 않음)
+MAX_ITEMS_PER_SITE = 5
+
+
+class ListingExtractor:
+    """목록 페이지 HTML -> 항목 (파싱/행 선택/날짜/키워드 필터)
+
+    네트워크나 학습 프로필 같은 공유 상태를 갖지 않으므로 파싱 프로세스에서 그대로 쓸 수 있다.
+    학습할 내용은 extract()가 돌려주는 update로 호출한 쪽에서 프로필에 반영한다.
+    """
+
+    def __init__(self, keywords, table_patterns):
+        self.keyword_matcher = KeywordMatcher(keywords)
+        self.table_patterns = table_patterns
+        # 목록 영역만 트리로 만드는 파싱 필터 (전체 탐색용 / 학습 선택자별)
+        self._search_strainer = container_strainer(self.table_patterns)
+        self._strainers = {CONTENT_FALLBACK: container_strainer([CONTENT_SELECTOR]), DOCUMENT_FALLBACK: None}
+
+    def is_money_news(self, title):
+        # 키워드 필터링 로직 (키워드 전체를 한 번의 스캔으로 확인)
+        return self.keyword_matcher.contains_any(title)
+
+    def _rows_for_pattern(self, soup, pattern):
+        if pattern == CONTENT_FALLBACK:
+            content_area = soup.select_one(CONTENT_SELECTOR)
+            return content_area.select("tr, li, div[class*='item']") if content_area else []
+        if pattern == DOCUMENT_FALLBACK:
+            return soup.select("tr, li")
+
+        rows = []
+        for area in soup.select(pattern):
+            rows.extend(area.select("tbody tr, tr, li, .item, .list_item, .post-item"))
+        return rows
+
+    def _candidate_rows(self, soup):
+        """전체 탐색: 패턴 순서대로 (패턴, 행)을 내보내되 겹치는 패턴이 찾은 같은 행은 한 번만
+
+        제너레이터라서 할당량이 차면 남은 패턴은 선택하지 않는다.
+        """
+        seen_rows = set()
+        for pattern in self.table_patterns:
+            for row in self._rows_for_pattern(soup, pattern):
+                key = node_key(row)
+                if key in seen_rows: continue
+                seen_rows.add(key)
+                yield pattern, row
+
+    def _extract_rows(self, url, candidates, scan=None):
+        results = []
+        hits = {}
+        seen_titles = set()
+        scanned = rejected = 0
+        scan = scan or DateCutoff(None)
+
+        for pattern, row in candidates:
+            scanned += 1
+            links = row.find_all("a")
+            if not links: continue
+
+            valid_links = [l for l in links if len(l.get_text(strip=True)) > 5]
+            if not valid_links: continue
+
+            title_tag = max(valid_links, key=lambda x: len(x.get_text(strip=True)))
+            title = title_tag.get_text(strip=True)
+            title = re.sub(r"\[공지\]|\[새글\]|NEW", "", title).strip()
+
+            if title in seen_titles or len(title) < 5: continue
+
+            # 제목을 뺀 나머지 칸(작성일 등)에서 날짜를 읽고 (링크 안에 날짜를 넣는 목록은 링크에서),
+            # 오래된 행이 이어지면 목록 읽기를 멈춤
+            link_text = title_tag.get_text(" ", strip=True)
+            row_date = extract_date(row.get_text(" ", strip=True).replace(link_text, " ")) or extract_date(link_text)
+            if not scan.accept(row_date):
+                if scan.done: break
+                continue
+
+            # 키워드 필터링 적용
+            if not self.is_money_news(title):
+                rejected += 1
+                continue
+
+            seen_titles.add(title)
+            link = urljoin(url, title_tag['href'])
+            hits[pattern] = hits.get(pattern, 0) + 1
+
+            results.append(NewsItem(title=title, link=link, date=row_date))
+            if len(results) >= MAX_ITEMS_PER_SITE: break # 사이트당 최대 건수만 수집
+
+        crawl_metrics.add("rows_scanned", scanned)
+        crawl_metrics.add("rejected", rejected)
+        crawl_metrics.add("accepted", len(results))
+        return results, hits, scanned
+
+    def _strainer_for(self, pattern):
+        if pattern not in self._strainers:
+            self._strainers[pattern] = container_strainer([pattern])
+        return self._strainers[pattern]
+
+    def _parse(self, html, strainer=None):
+        started = time.perf_counter()
+        soup = parse_html(html, only=strainer)
+        crawl_metrics.add("parse_ms", (time.perf_counter() - started) * 1000)
+        return soup
+
+    def _pattern_rows(self, pattern):
+        return lambda soup: ((pattern, row) for row in self._rows_for_pattern(soup, pattern))
+
+    @staticmethod
+    def _release(soup):
+        # BeautifulSoup 트리는 부모/자식 순환 참조라 GC를 기다리지 않도록 바로 해제
+        if hasattr(soup, "decompose"):
+            soup.decompose()
+
+    def _extract_from(self, url, soup, candidates, scan=None):
+        """선택+추출 후 트리를 바로 해제"""
+        started = time.perf_counter()
+        try:
+            results, hits, scanned = self._extract_rows(url, candidates(soup), scan)
+        finally:
+            self._release(soup)
+        select_ms = (time.perf_counter() - started) * 1000
+        crawl_metrics.add("select_ms", select_ms)
+        return results, hits, scanned, select_ms
+
+    def extract(self, url, html, learned=None, cutoff=None):
+        """(항목, 프로필에 반영할 필드 또는 None, 로그용 설명)
+
+        learned: 이 사이트에서 전에 결과를 낸 목록 선택자, cutoff: 이 날짜 이전 글은 건너뜀
+        """
+        # 1) 학습된 선택자의 목록 영역만 파싱해서 먼저 시도
+        if learned:
+            soup = self._parse(html, self._strainer_for(learned))
+            scan = DateCutoff(cutoff)
+            results, _, _, select_ms = self._extract_from(url, soup, self._pattern_rows(learned), scan)
+            if results or scan.done:
+                # 기준일 이전 글만 남은 목록이면 전체 탐색 없이 끝냄
+                update = {"hits": len(results)} if results else None
+                return results, update, f"학습 선택자 {learned}, 선택 {select_ms:.1f}ms"
+
+        # 2) 결과가 없으면 전체 패턴 탐색 후 가장 많이 채택된 패턴을 기록
+        soup = self._parse(html, self._search_strainer)
+        results, hits, scanned, select_ms = self._extract_from(url, soup, self._candidate_rows, DateCutoff(cutoff))
+        if not scanned:
+            # 목록 영역이 없으면 본문 영역, 그것도 없으면 문서 전체의 tr/li (대체 탐색용으로 다시 파싱)
+            pattern = CONTENT_FALLBACK
+            soup = self._parse(html, self._strainer_for(pattern))
+            if not soup.select_one(CONTENT_SELECTOR):
+                self._release(soup)
+                pattern = DOCUMENT_FALLBACK
+                soup = self._parse(html)
+            results, hits, _, fallback_ms = self._extract_from(url, soup, self._pattern_rows(pattern), DateCutoff(cutoff))
+            select_ms += fallback_ms
+        update = None
+        if hits:
+            best = max(hits, key=hits.get)
+            update = {"pattern": best, "hits": hits[best]}
+        return results, update, f"전체 탐색 {len(self.table_patterns)}개 패턴, 선택 {select_ms:.1f}ms"
+
+
+# 파싱 프로세스마다 하나 (init_worker에서 생성)
+_worker = None
+
+
+def init_worker(keywords, table_patterns, backend):
+    """ProcessPoolExecutor initializer - 부모 프로세스와 같은 키워드/패턴/파서 백엔드"""
+    global _worker
+    html_parser.set_default_backend(backend)
+    _worker = ListingExtractor(keywords, table_patterns)
+
+
+def extract_listing(url, html, learned=None, cutoff=None):
+    """파싱 프로세스에서 도는 작업: extract() 결과와 그동안 쌓인 측정값 (모두 pickle 가능)"""
+    with crawl_metrics.capture() as record:
+        results, update, info = _worker.extract(url, html, learned, cutoff)
+    return results, update, info, crawl_metrics.counters(record)
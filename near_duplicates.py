@@ -0,0 +1,182 @@
+import re
+import unicodedata
+import zlib
+
+import numpy as np
+
+import settings
+from item_store import normalize_title
+from news_item import NewsItem
+
+# MinHash 서명 길이와 LSH 밴드 (16밴드 x 4행: 유사도 0.5 근처에서 후보가 될 확률이 급격히 오름)
+NUM_PERM = 64
+BANDS = 16
+SHINGLE_SIZE = 3
+
+# 순열 대신 multiply-shift 해시 ((a*h + b) mod 2^64 의 상위 32비트, a는 홀수) - 나머지 연산 없이 uint64 곱셈만
+# 실행/프로세스가 달라도 같은 제목은 같은 서명이 되도록 고정 시드
+_rng = np.random.RandomState(20260118)
+_PERM_A = (_rng.randint(1, 1 << 62, size=NUM_PERM, dtype=np.int64).astype(np.uint64) << np.uint64(1)) | np.uint64(1)
+_PERM_B = _rng.randint(0, 1 << 62, size=NUM_PERM, dtype=np.int64).astype(np.uint64)
+_SHIFT = np.uint64(32)
+# 밴드의 행 값들을 정수 하나로 합칠 때의 계수 (uint64에서 넘치는 부분은 버려도 키로 쓰는 데 문제없음)
+_BAND_MULT = _rng.randint(1, 1 << 62, size=NUM_PERM, dtype=np.int64).astype(np.uint64)
+# 서명을 한 번에 계산할 제목 수 (n-gram 수 x NUM_PERM 크기의 중간 배열을 이 안에서만 만듦)
+SIGNATURE_BATCH = 1024
+
+# 제목 앞뒤에 붙는 [보도자료], [사진], 【알림】 같은 말머리
+_TITLE_TAGS = re.compile(r"\[[^\]]{0,12}\]|【[^】]{0,12}】|<[^>]{0,12}>")
+_NUMBERS = re.compile(r"\d+")
+
+
+def _clean(title):
+    return _TITLE_TAGS.sub(" ", unicodedata.normalize("NFKC", title or ""))
+
+
+def shingles(title, size=SHINGLE_SIZE):
+    """정규화한 제목의 글자 n-gram 집합 (한국어 제목은 띄어쓰기가 기관마다 달라 공백을 지우고 글자 단위로)"""
+    text = normalize_title(_clean(title))
+    if len(text) <= size:
+        return {text} if text else set()
+    return {text[i:i + size] for i in range(len(text) - size + 1)}
+
+
+def numbers(title):
+    """제목의 숫자들 - '(3차)'와 '(4차)', 연도/회차가 다른 글은 제목이 비슷해도 다른 글로 봄"""
+    return frozenset(_NUMBERS.findall(_clean(title)))
+
+
+def signatures(gram_sets):
+    """비어 있지 않은 n-gram 집합 목록의 MinHash 서명 행렬 (제목 수 x NUM_PERM)
+
+    제목마다 numpy를 부르면 호출 비용이 계산보다 커서, 모든 n-gram 해시를 한 배열에 이어 붙여
+    순열 적용 후 제목 경계(reduceat)별 최솟값을 한 번에 구한다.
+    """
+    lengths = [len(grams) for grams in gram_sets]
+    hashes = np.fromiter((zlib.crc32(gram.encode("utf-8")) for grams in gram_sets for gram in grams),
+                         dtype=np.uint64, count=sum(lengths))
+    # 중간 배열을 하나만 두도록 제자리 연산
+    values = _PERM_A[:, None] * hashes[None, :]
+    values += _PERM_B[:, None]
+    values >>= _SHIFT
+    offsets = np.cumsum([0] + lengths[:-1])
+    return np.minimum.reduceat(values, offsets, axis=1).T
+
+
+def band_keys(sigs, bands=BANDS):
+    """서명 행렬 -> 제목별 밴드 키 목록 (밴드마다 행 값들을 정수 하나로)"""
+    rows = NUM_PERM // bands
+    mixed = (sigs * _BAND_MULT).reshape(len(sigs), bands, rows).sum(axis=2)
+    return mixed.tolist()
+
+
+def jaccard(a, b):
+    if not a or not b:
+        return 0.0
+    return len(a & b) / len(a | b)
+
+
+class NearDuplicateIndex:
+    """여러 기관에 조금씩 다른 제목으로 올라온 같은 보도자료를 한 묶음으로 (MinHash + LSH)
+
+    - 제목마다 글자 3-gram MinHash 서명을 만들고 BANDS개 밴드로 나눠 버킷에 넣는다.
+      같은 버킷에 한 번이라도 들어간 대표 항목만 후보가 되므로 항목이 늘어도 전체와 비교하지 않는다.
+    - 후보는 실제 n-gram Jaccard 유사도로 확인해 threshold 이상인 것 중 가장 비슷한 대표에 붙인다.
+    - 다른 소스끼리만 묶고, 한 묶음에는 소스마다 한 건만 들어간다 (같은 기관의 비슷한 글은 따로 둠).
+      제목의 숫자(연도, 회차)가 다르면 묶지 않는다.
+    먼저 들어온 항목이 묶음의 대표가 된다.
+    """
+
+    def __init__(self, threshold=None, bands=BANDS):
+        self.threshold = settings.NEAR_DUP_THRESHOLD if threshold is None else threshold
+        self.bands = bands
+        self._buckets = [{} for _ in range(bands)]
+        self._grams = []
+        self._numbers = []
+        self._clusters = []
+        self._sources = []
+        # 확인한 후보 수 (전체 비교 대비 얼마나 줄었는지 보는 용도)
+        self.compared = 0
+
+    def candidates(self, keys):
+        found = set()
+        for bucket, key in zip(self._buckets, keys):
+            found.update(bucket.get(key, ()))
+        return found
+
+    def add(self, item):
+        """항목을 넣고 그 항목이 속한 묶음의 대표를 반환 (새 대표면 item 자신)"""
+        return self.add_many([item])[0]
+
+    def add_many(self, items):
+        """항목들을 순서대로 넣고 각 항목의 대표 목록을 반환 (서명은 SIGNATURE_BATCH건씩 한 번에 계산)"""
+        heads = []
+        for start in range(0, len(items), SIGNATURE_BATCH):
+            batch = items[start:start + SIGNATURE_BATCH]
+            gram_sets = [shingles(item.get("title")) for item in batch]
+            keyed = [i for i, grams in enumerate(gram_sets) if grams]
+            keys = dict(zip(keyed, band_keys(signatures([gram_sets[i] for i in keyed]), self.bands))) if keyed else {}
+            for i, item in enumerate(batch):
+                heads.append(self._add(item, gram_sets[i], keys[i]) if i in keys else item)
+        return heads
+
+    def _add(self, item, grams, keys):
+        source = item.get("source")
+        digits = numbers(item.get("title"))
+        best, best_score = None, self.threshold
+        for number in self.candidates(keys):
+            self.compared += 1
+            if source in self._sources[number] or digits != self._numbers[number]:
+                continue
+            score = jaccard(grams, self._grams[number])
+            if score >= best_score:
+                best, best_score = number, score
+        if best is not None:
+            self._clusters[best].append(item)
+            self._sources[best].add(source)
+            return self._clusters[best][0]
+
+        number = len(self._clusters)
+        self._clusters.append([item])
+        self._sources.append({source})
+        self._grams.append(grams)
+        self._numbers.append(digits)
+        for bucket, key in zip(self._buckets, keys):
+            bucket.setdefault(key, []).append(number)
+        return item
+
+    def clusters(self):
+        """둘 이상의 소스가 묶인 묶음 목록 (각 묶음은 대표가 맨 앞인 항목 목록, 들어온 순서)"""
+        return [members for members in self._clusters if len(members) > 1]
+
+
+def cluster(items, threshold=None):
+    """항목 목록 -> 여러 소스에 올라온 같은 글 묶음 목록"""
+    index = NearDuplicateIndex(threshold)
+    index.add_many(list(items))
+    return index.clusters()
+
+
+def groups(items, threshold=None):
+    """항목 목록 -> (대표, 묶인 원래 항목 목록) 목록 (대표 순서는 원래 순서, 묶이지 않은 항목은 (항목, [항목]))
+
+    대표는 캐시에서 온 객체일 수 있으므로 also(함께 올라온 다른 소스)를 채운 새 NewsItem으로 바꾼다.
+    """
+    threshold = settings.NEAR_DUP_THRESHOLD if threshold is None else threshold
+    clusters = cluster(items, threshold) if threshold > 0 else []
+    heads = {}
+    dropped = set()
+    for members in clusters:
+        head = members[0]
+        also = tuple(dict.fromkeys(member.get("source") for member in members[1:]))
+        heads[id(head)] = (NewsItem(head["title"], head["link"], head.get("date"), head.get("source"), also), members)
+        dropped.update(id(member) for member in members[1:])
+    return [heads.get(id(item), (item, [item])) for item in items if id(item) not in dropped]
+
+
+def collapse(items, threshold=None):
+    """같은 글 묶음마다 대표 한 건만 남기고 나머지 소스는 대표의 also에 (순서는 그대로) - 메일/대시보드 표시용
+
+    보관소/수집 이력에는 소스별 원래 항목을 그대로 남기고 보여 줄 때만 묶는다.
+    """
+    return [head for head, _ in groups(items, threshold)]
@@ -0,0 +1,213 @@
+import json
+import os
+import threading
+import time
+from datetime import date, datetime
+
+import pandas as pd
+
+import settings
+from history_export import FORMATS, items_frame, read_frame, write_frame
+from item_store import item_key
+from news_item import NewsItem
+
+INDEX_NAME = "index.json"
+# 하루 파티션의 조각 파일이 이만큼 쌓이면 다음 추가 때 하나로 합침
+MAX_PARTS_PER_DAY = 8
+
+_EXTENSIONS = tuple(ext for ext, _ in FORMATS.values())
+
+
+def _day(value):
+    """date/datetime/'YYYY-MM-DD' -> 'YYYY-MM-DD' (없으면 None)"""
+    if value is None:
+        return None
+    if isinstance(value, datetime):
+        value = value.date()
+    if isinstance(value, date):
+        return value.isoformat()
+    return str(value)[:10]
+
+
+class NewsArchive:
+    """실행마다 수집한 항목을 글 날짜별 파티션에 쌓아 두는 보관소 (대시보드의 지난 기록 보기용)
+
+    ARCHIVE_DIR/2026-01-18/part-<시각>.parquet  글 날짜별 디렉터리 (날짜 없는 글은 보관한 날)
+    ARCHIVE_DIR/index.json                     {"days": {"2026-01-18": {"VisitSeoul": 3, ...}}}
+
+    - append(): 날짜별로 이미 보관한 글(item_key)은 빼고 새 조각 파일로 추가한 뒤 색인 갱신
+    - query(): 색인에서 기간/소스에 해당하는 날짜만 골라 그 파티션만 읽음 (1년치가 쌓여도 7일이면 7개 디렉터리)
+    파일 형식은 history_export와 같다 (HISTORY_EXPORT_FORMAT, pyarrow가 없으면 csv).
+    """
+
+    def __init__(self, directory=None, fmt=None):
+        self.directory = directory or settings.ARCHIVE_DIR
+        self.fmt = fmt
+        self._lock = threading.Lock()
+        self._index = None
+        self._index_mtime = None
+        # 마지막 query() 소요 시간 (대시보드 표시용)
+        self.last_query_ms = 0.0
+
+    @property
+    def index_path(self):
+        return os.path.join(self.directory, INDEX_NAME)
+
+    def _parts(self, day):
+        day_dir = os.path.join(self.directory, day)
+        try:
+            names = sorted(name for name in os.listdir(day_dir) if name.endswith(_EXTENSIONS))
+        except OSError:
+            return []
+        return [os.path.join(day_dir, name) for name in names]
+
+    def _read_day(self, day, columns=None):
+        frames = [read_frame(path, columns) for path in self._parts(day)]
+        if not frames:
+            return None
+        return frames[0] if len(frames) == 1 else pd.concat(frames, ignore_index=True)
+
+    def version(self):
+        """색인 파일의 수정 시각 - 대시보드 캐시 키 (보관소가 바뀌면 달라짐)"""
+        try:
+            return os.stat(self.index_path).st_mtime_ns
+        except OSError:
+            return None
+
+    def _load_index(self):
+        # 다른 프로세스(일일 수집)가 갱신했을 수 있으므로 파일이 바뀌었을 때만 다시 읽음
+        mtime = self.version()
+        if self._index is not None and mtime == self._index_mtime:
+            return self._index
+        if mtime is None:
+            index = self.rebuild_index() if os.path.isdir(self.directory) else {"days": {}}
+        else:
+            try:
+                with open(self.index_path, "r", encoding="utf-8") as f:
+                    index = json.load(f)
+            except (OSError, ValueError):
+                index = self.rebuild_index()
+        self._index, self._index_mtime = index, self.version()
+        return index
+
+    def _save_index(self, index):
+        os.makedirs(self.directory, exist_ok=True)
+        tmp_path = f"{self.index_path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(index, f, ensure_ascii=False, sort_keys=True, separators=(",", ":"))
+        os.replace(tmp_path, self.index_path)
+        self._index, self._index_mtime = index, self.version()
+
+    def rebuild_index(self):
+        """파티션을 모두 읽어 색인을 다시 만듦 (색인이 없거나 깨졌을 때)"""
+        days = {}
+        try:
+            names = sorted(os.listdir(self.directory))
+        except OSError:
+            names = []
+        for day in names:
+            frame = self._read_day(day, ["source"])
+            if frame is not None and len(frame):
+                days[day] = _source_counts(frame)
+        index = {"days": days}
+        if days:
+            self._save_index(index)
+        return index
+
+    def append(self, items, archived_at=None):
+        """새로 본 글만 날짜별 파티션에 추가 - 추가한 건수"""
+        if not items or not self.directory:
+            return 0
+        archived_at = archived_at or datetime.now()
+        by_day = {}
+        for item in items:
+            by_day.setdefault(_day(item.get("date")) or _day(archived_at), []).append(item)
+
+        added = 0
+        stamp = f"{archived_at.strftime('%Y%m%d-%H%M%S')}-{os.getpid()}"
+        with self._lock:
+            index = self._load_index()
+            days = dict(index.get("days", {}))
+            for day, day_items in sorted(by_day.items()):
+                existing = self._read_day(day)
+                seen = set()
+                if existing is not None:
+                    seen = {item_key(row) for row in existing[["source", "title", "link"]].to_dict("records")}
+                fresh = []
+                for item in day_items:
+                    key = item_key(item)
+                    if key in seen: continue
+                    seen.add(key)
+                    fresh.append(item)
+                if not fresh:
+                    continue
+
+                frame = items_frame(fresh, None, archived_at)
+                day_frame = frame if existing is None else pd.concat([existing, frame], ignore_index=True)
+                old_parts = self._parts(day)
+                if len(old_parts) >= MAX_PARTS_PER_DAY:
+                    # 조각이 많아지면 기존 것과 합쳐 한 파일로 (읽을 때 여는 파일 수를 줄임)
+                    write_frame(day_frame, os.path.join(self.directory, day, f"part-{stamp}"), self.fmt)
+                    for path in old_parts:
+                        os.remove(path)
+                else:
+                    write_frame(frame, os.path.join(self.directory, day, f"part-{stamp}"), self.fmt)
+                days[day] = _source_counts(day_frame)
+                added += len(fresh)
+            if added:
+                self._save_index({"days": days})
+        return added
+
+    def days(self, start=None, end=None, sources=None):
+        """색인에서 기간(양 끝 포함) 안에 글이 있는 날짜 목록 (sources가 있으면 그 소스의 글이 있는 날만)"""
+        start, end = _day(start), _day(end)
+        days = []
+        for day, counts in self._load_index().get("days", {}).items():
+            if (start and day < start) or (end and day > end):
+                continue
+            if sources and not any(source in counts for source in sources):
+                continue
+            days.append(day)
+        return sorted(days)
+
+    def sources(self, start=None, end=None):
+        """기간 안에 글이 있는 소스 이름 (글 많은 순)"""
+        totals = {}
+        index_days = self._load_index().get("days", {})
+        for day in self.days(start, end):
+            for source, count in index_days[day].items():
+                totals[source] = totals.get(source, 0) + count
+        return sorted(totals, key=lambda source: (-totals[source], source))
+
+    def query(self, start=None, end=None, sources=None):
+        """기간(양 끝 포함)의 글을 최신 날짜순 NewsItem 목록으로 - 해당 날짜 파티션만 읽음"""
+        started = time.perf_counter()
+        items = []
+        for day in reversed(self.days(start, end, sources)):
+            frame = self._read_day(day, ["source", "title", "link", "date"])
+            if frame is None:
+                continue
+            if sources:
+                frame = frame[frame["source"].isin(sources)]
+            for source, title, link, value in frame.itertuples(index=False, name=None):
+                items.append(NewsItem(title, link, None if pd.isna(value) else value.date(), source))
+        self.last_query_ms = (time.perf_counter() - started) * 1000
+        return items
+
+
+def _source_counts(frame):
+    counts = frame["source"].astype("object").fillna("").value_counts()
+    return {str(source): int(count) for source, count in counts.items()}
+
+
+_archive = None
+_archive_lock = threading.Lock()
+
+
+def get_archive():
+    """프로세스 전체에서 공유하는 보관소"""
+    global _archive
+    with _archive_lock:
+        if _archive is None:
+            _archive = NewsArchive()
+        return _archive
@@ -0,0 +1,62 @@
+from date_extract import extract_date
+
+
+class NewsItem:
+    """수집 항목 하나 - 두 스크래퍼(TourismScraper, IntegratedNewsEngine)가 같은 형태로 만듦
+
+    캐시/스냅샷/이력에 수천 건씩 쌓이므로 dict 대신 __slots__로 작게 유지한다.
+    리포트/대시보드/수집 이력 코드는 item["title"], item.get("date")처럼 읽으므로 읽기용 매핑 접근도 지원한다.
+    JSON에는 to_dict()로 저장하고(json_default가 처리) from_dict()로 되살린다.
+    값 타입이라 (source, title, link)로 해시되어 set/dict 키로 쓸 수 있다.
+    """
+
+    __slots__ = ("source", "title", "link", "date", "also")
+
+    def __init__(self, title, link, date=None, source=None, also=()):
+        self.source = source
+        self.title = title
+        self.link = link
+        self.date = date
+        # 같은 글(near_duplicates로 묶은 보도자료)이 함께 올라온 다른 소스 이름
+        self.also = tuple(also)
+
+    def __getitem__(self, key):
+        if key not in self.__slots__:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def get(self, key, default=None):
+        return getattr(self, key) if key in self.__slots__ else default
+
+    def keys(self):
+        return self.__slots__
+
+    def to_dict(self):
+        return {"source": self.source, "title": self.title, "link": self.link, "date": self.date, "also": list(self.also)}
+
+    @classmethod
+    def from_dict(cls, data):
+        """JSON에서 읽은 dict -> NewsItem ('YYYY-MM-DD' 문자열 날짜는 date로)"""
+        date = data.get("date")
+        if isinstance(date, str):
+            date = extract_date(date)
+        return cls(data.get("title"), data.get("link"), date, data.get("source"), data.get("also") or ())
+
+    def __eq__(self, other):
+        if not isinstance(other, NewsItem):
+            return NotImplemented
+        return self.to_dict() == other.to_dict()
+
+    def __hash__(self):
+        # 같은 항목은 source/title/link가 같으므로 __eq__와 어긋나지 않음 (만든 뒤에는 필드를 바꾸지 않음)
+        return hash((self.source, self.title, self.link))
+
+    def __repr__(self):
+        return f"NewsItem(source={self.source!r}, title={self.title!r}, link={self.link!r}, date={self.date!r}, also={self.also!r})"
+
+
+def restore_items(items):
+    """JSON(캐시/스냅샷/샤드 결과)에서 읽은 항목 목록 -> NewsItem 목록 (None은 그대로)"""
+    if items is None:
+        return None
+    return [item if isinstance(item, NewsItem) else NewsItem.from_dict(item) for item in items]
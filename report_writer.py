@@ -0,0 +1,508 @@
+import html
+from functools import lru_cache
+from string import Formatter
+
+from date_extract import format_date
+from keyword_matcher import KeywordMatcher
+
+# 리포트 렌더링 모듈
+# 수집 결과를 한 번만 순회하면서 여러 출력(TXT, HTML 메일, 대시보드 HTML)에 바로 써 내려간다.
+# 전체 문자열을 메모리에 모으지 않으므로 항목 수가 늘어도 메모리 사용량은 일정하다.
+
+
+class CompiledTemplate:
+    """{name} 자리표시자 템플릿을 한 번만 분해해 두고 값만 채워 넣음"""
+
+    def __init__(self, template):
+        self._parts = [(literal, field) for literal, field, _, _ in Formatter().parse(template)]
+
+    def render(self, **values):
+        out = []
+        for literal, field in self._parts:
+            out.append(literal)
+            if field is not None:
+                out.append(str(values[field]))
+        return "".join(out)
+
+
+def escape(value):
+    return html.escape(str(value), quote=True)
+
+
+def safe_href(link):
+    """http(s) 링크만 허용하고 속성값으로 쓸 수 있게 이스케이프"""
+    link = (link or "").strip()
+    if not link.lower().startswith(("http://", "https://")):
+        return "#"
+    return escape(link)
+
+
+class ReportSink:
+    """출력 하나 (파일 경로 또는 열린 파일 객체)"""
+
+    def __init__(self, target):
+        self._target = target
+        self._file = None
+
+    def open(self):
+        if isinstance(self._target, str):
+            self._file = open(self._target, "w", encoding="utf-8")
+        else:
+            self._file = self._target
+
+    def close(self):
+        if isinstance(self._target, str) and self._file is not None:
+            self._file.close()
+        self._file = None
+
+    def write(self, text):
+        self._file.write(text)
+
+    def begin(self, meta):
+        pass
+
+    def group(self, name, count):
+        pass
+
+    def item(self, item):
+        pass
+
+    def end(self, totals):
+        pass
+
+
+class ReportWriter:
+    """groups: (그룹 이름, 항목 목록) 반복자 - 그룹이 없는 목록은 이름을 None으로 전달"""
+
+    def __init__(self, sinks):
+        self.sinks = list(sinks)
+
+    def write(self, groups, meta):
+        totals = {"items": 0, "groups": 0, "sources": 0}
+        sources = set()
+        for sink in self.sinks:
+            sink.open()
+        try:
+            for sink in self.sinks:
+                sink.begin(meta)
+            for name, items in groups:
+                if name is not None:
+                    totals["groups"] += 1
+                    for sink in self.sinks:
+                        sink.group(name, len(items))
+                for item in items:
+                    totals["items"] += 1
+                    sources.add(item.get("source") or name)
+                    for sink in self.sinks:
+                        sink.item(item)
+            totals["sources"] = len(sources)
+            for sink in self.sinks:
+                sink.end(totals)
+        finally:
+            for sink in self.sinks:
+                sink.close()
+        return totals
+
+
+# ---------------------------------------------------------------------------
+# 느린 사이트 요약 (meta["metrics"]에 CrawlMetrics가 있으면 리포트 끝에 덧붙임)
+
+SLOWEST_LIMIT = 10
+
+_SLOW_TXT_HEADER = CompiledTemplate("⏱️ 느린 사이트 상위 {count}곳 (전체 / 응답 대기 / 다운로드 / 파싱, ms)")
+_SLOW_TXT_ROW = CompiledTemplate("\n- {site}: {total} / {ttfb} / {download} / {parse} ({status}, {accepted}건)")
+_SLOW_HTML_HEADER = CompiledTemplate(
+    "<h3>⏱️ 느린 사이트 상위 {count}곳</h3>"
+    "<table style='width: 100%; border-collapse: collapse; font-size: 0.9em;'>"
+    "<tr><th align='left'>사이트</th><th>상태</th><th>전체(ms)</th><th>응답 대기</th><th>다운로드</th><th>파싱</th><th>채택</th></tr>"
+)
+_SLOW_HTML_ROW = CompiledTemplate(
+    "<tr><td>{site}</td><td align='center'>{status}</td><td align='right'>{total}</td><td align='right'>{ttfb}</td>"
+    "<td align='right'>{download}</td><td align='right'>{parse}</td><td align='right'>{accepted}</td></tr>"
+)
+
+
+def _slowest(meta):
+    metrics = (meta or {}).get("metrics")
+    if metrics is None:
+        return []
+    return [
+        {"site": r["site"], "status": r["status"], "accepted": r["accepted"], "total": f"{r['total_ms']:.0f}",
+         "ttfb": f"{r['ttfb_ms']:.0f}", "download": f"{r['download_ms']:.0f}", "parse": f"{r['parse_ms']:.0f}"}
+        for r in metrics.slowest(SLOWEST_LIMIT)
+    ]
+
+
+def slowest_text(meta):
+    rows = _slowest(meta)
+    if not rows:
+        return ""
+    return _SLOW_TXT_HEADER.render(count=len(rows)) + "".join(_SLOW_TXT_ROW.render(**row) for row in rows)
+
+
+def slowest_html(meta):
+    rows = _slowest(meta)
+    if not rows:
+        return ""
+    body = "".join(_SLOW_HTML_ROW.render(**dict(row, site=escape(row["site"]))) for row in rows)
+    return _SLOW_HTML_HEADER.render(count=len(rows)) + body + "</table>"
+
+
+# ---------------------------------------------------------------------------
+# 건너뛴/차단된 사이트 (meta["health"]에 SiteHealth나 그 unhealthy() 행이 있으면 리포트 끝에 덧붙임)
+
+_HEALTH_STATES = {"skipped": "건너뜀", "opened": "차단 시작"}
+_HEALTH_TXT_HEADER = CompiledTemplate("🚫 연속 실패로 차단된 사이트 {count}곳 (점검 필요)")
+_HEALTH_TXT_ROW = CompiledTemplate("\n- {site}: {state}, 연속 실패 {failures}회, 재시도 {retry_at} - {last_error}")
+_HEALTH_HTML_HEADER = CompiledTemplate(
+    "<h3>🚫 연속 실패로 차단된 사이트 {count}곳</h3>"
+    "<table style='width: 100%; border-collapse: collapse; font-size: 0.9em;'>"
+    "<tr><th align='left'>사이트</th><th>상태</th><th>연속 실패</th><th>재시도</th><th align='left'>마지막 오류</th></tr>"
+)
+_HEALTH_HTML_ROW = CompiledTemplate(
+    "<tr><td>{site}</td><td align='center'>{state}</td><td align='right'>{failures}</td>"
+    "<td align='center'>{retry_at}</td><td>{last_error}</td></tr>"
+)
+
+
+def _unhealthy(meta):
+    health = (meta or {}).get("health")
+    if health is None:
+        return []
+    # SiteHealth 또는 샤드 결과를 합칠 때처럼 이미 뽑아 둔 unhealthy() 행 목록
+    rows = health.unhealthy() if hasattr(health, "unhealthy") else health
+    return [dict(row, state=_HEALTH_STATES.get(row["state"], row["state"])) for row in rows]
+
+
+def unhealthy_text(meta):
+    rows = _unhealthy(meta)
+    if not rows:
+        return ""
+    return _HEALTH_TXT_HEADER.render(count=len(rows)) + "".join(_HEALTH_TXT_ROW.render(**row) for row in rows)
+
+
+def unhealthy_html(meta):
+    rows = _unhealthy(meta)
+    if not rows:
+        return ""
+    body = "".join(_HEALTH_HTML_ROW.render(**{k: escape(v) for k, v in row.items()}) for row in rows)
+    return _HEALTH_HTML_HEADER.render(count=len(rows)) + body + "</table>"
+
+
+# ---------------------------------------------------------------------------
+# 여러 기관에 올라온 같은 보도자료 (meta["duplicates"]에 NearDuplicateIndex나 그 clusters()가 있으면 리포트 끝에 덧붙임)
+
+_DUP_TXT_HEADER = CompiledTemplate("🔁 여러 기관에 올라온 같은 보도자료 {count}건 (첫 소스의 글만 목록에 포함)")
+_DUP_TXT_ROW = CompiledTemplate("\n- {title}\n  {sources}")
+_DUP_HTML_HEADER = CompiledTemplate(
+    "<h3>🔁 여러 기관에 올라온 같은 보도자료 {count}건</h3>"
+    "<table style='width: 100%; border-collapse: collapse; font-size: 0.9em;'>"
+    "<tr><th align='left'>제목</th><th align='left'>소스</th></tr>"
+)
+_DUP_HTML_ROW = CompiledTemplate("<tr><td><a href='{link}' target='_blank'>{title}</a></td><td>{sources}</td></tr>")
+
+
+def _duplicates(meta):
+    duplicates = (meta or {}).get("duplicates")
+    if duplicates is None:
+        return []
+    clusters = duplicates.clusters() if hasattr(duplicates, "clusters") else duplicates
+    return [
+        {"title": members[0]["title"], "link": members[0]["link"],
+         "sources": ", ".join(dict.fromkeys(member["source"] for member in members))}
+        for members in clusters
+    ]
+
+
+def duplicates_text(meta):
+    rows = _duplicates(meta)
+    if not rows:
+        return ""
+    return _DUP_TXT_HEADER.render(count=len(rows)) + "".join(_DUP_TXT_ROW.render(**row) for row in rows)
+
+
+def duplicates_html(meta):
+    rows = _duplicates(meta)
+    if not rows:
+        return ""
+    body = "".join(_DUP_HTML_ROW.render(link=safe_href(row["link"]), title=escape(row["title"]),
+                                        sources=escape(row["sources"])) for row in rows)
+    return _DUP_HTML_HEADER.render(count=len(rows)) + body + "</table>"
+
+
+def also_text(item):
+    """같은 글이 함께 올라온 다른 소스 (near_duplicates.collapse가 채운 also, 없으면 빈 문자열)"""
+    also = item.get("also")
+    return f"같은 소식: {', '.join(also)}" if also else ""
+
+
+# ---------------------------------------------------------------------------
+# IntegratedNewsEngine 리포트 (사이트별 그룹)
+
+_ENGINE_TXT_HEADER = CompiledTemplate("📅 수집 일시: {generated_at}\n🔍 필터 키워드: {keywords}\n" + "=" * 60)
+_ENGINE_TXT_GROUP = CompiledTemplate("\n\n📌 {name} ({count}건)")
+_ENGINE_TXT_ITEM = CompiledTemplate("\n- {title}\n  🔗 {link}")
+_ENGINE_TXT_FOOTER = CompiledTemplate("\n\n" + "=" * 60 + "\n✅ 총 {total}건의 '돈 되는 정보'를 수집했습니다.")
+
+
+class EngineTxtReport(ReportSink):
+    def begin(self, meta):
+        self._meta = meta
+        self.write(_ENGINE_TXT_HEADER.render(generated_at=meta["generated_at"], keywords=", ".join(meta["keywords"])))
+
+    def group(self, name, count):
+        self.write(_ENGINE_TXT_GROUP.render(name=name, count=count))
+
+    def item(self, item):
+        self.write(_ENGINE_TXT_ITEM.render(title=item["title"], link=item["link"]))
+
+    def end(self, totals):
+        self.write(_ENGINE_TXT_FOOTER.render(total=totals["items"]))
+        for section in (duplicates_text(self._meta), unhealthy_text(self._meta), slowest_text(self._meta)):
+            if section:
+                self.write("\n\n" + section)
+
+
+_ENGINE_HTML_HEADER = CompiledTemplate(
+    "<html><head><meta charset='utf-8'><style>"
+    "body {{ font-family: 'Malgun Gothic', dotum, sans-serif; line-height: 1.6; max-width: 800px; margin: 20px auto; padding: 20px; border: 1px solid #ddd; border-radius: 10px; }}"
+    "h1 {{ color: #2c3e50; text-align: center; border-bottom: 2px solid #3498db; padding-bottom: 10px; }}"
+    "h3 {{ color: #2980b9; margin-top: 30px; border-left: 5px solid #3498db; padding-left: 10px; }}"
+    "ul {{ list-style: none; padding: 0; }}"
+    "li {{ margin-bottom: 15px; padding: 10px; background: #f9f9f9; border-radius: 5px; }}"
+    "a {{ color: #3498db; text-decoration: none; font-weight: bold; font-size: 1.1em; }}"
+    "a:hover {{ text-decoration: underline; color: #2980b9; }}"
+    ".info {{ color: #7f8c8d; font-size: 0.9em; margin-bottom: 20px; }}"
+    ".footer {{ margin-top: 40px; text-align: center; color: #95a5a6; font-size: 0.9em; border-top: 1px solid #eee; padding-top: 20px; }}"
+    "</style></head><body>"
+    "<h1>📅 오늘자 뉴스 수집 리포트</h1>"
+    "<div class='info'>📅 <b>수집 일시:</b> {generated_at}<br>"
+    "🔍 <b>필터 키워드:</b> {keywords}</div>"
+)
+_ENGINE_HTML_GROUP = CompiledTemplate("{close}<h3>📌 {name} ({count}건)</h3><ul>")
+_ENGINE_HTML_ITEM = CompiledTemplate("<li><a href='{link}' target='_blank'>{title}</a></li>")
+_ENGINE_HTML_FOOTER = CompiledTemplate("{close}<div class='footer'>✅ 총 {total}건의 정보를 수집했습니다.</div></body></html>")
+
+
+class EngineHtmlReport(ReportSink):
+    def begin(self, meta):
+        self._meta = meta
+        self._in_group = False
+        self.write(_ENGINE_HTML_HEADER.render(generated_at=escape(meta["generated_at"]),
+                                              keywords=escape(", ".join(meta["keywords"]))))
+
+    def group(self, name, count):
+        self.write(_ENGINE_HTML_GROUP.render(close="</ul>" if self._in_group else "", name=escape(name), count=count))
+        self._in_group = True
+
+    def item(self, item):
+        self.write(_ENGINE_HTML_ITEM.render(link=safe_href(item["link"]), title=escape(item["title"])))
+
+    def end(self, totals):
+        sections = duplicates_html(self._meta) + unhealthy_html(self._meta) + slowest_html(self._meta)
+        if sections:
+            self.write(("</ul>" if self._in_group else "") + sections)
+            self._in_group = False
+        self.write(_ENGINE_HTML_FOOTER.render(close="</ul>" if self._in_group else "", total=totals["items"]))
+
+
+# ---------------------------------------------------------------------------
+# 관광 뉴스 리포트 (소스 태그가 붙은 단일 목록)
+
+HIGHLIGHT_KEYWORDS = ["여행", "참여", "숙박", "호텔", "할인", "이벤트", "축제", "패키지", "쿠폰"]
+HIGHLIGHT_MATCHER = KeywordMatcher(HIGHLIGHT_KEYWORDS, ignore_case=True)
+
+# 이메일 클라이언트 호환성을 위해 인라인 스타일 사용
+EMAIL_HIGHLIGHT_OPEN = '<span style="background-color: #fff176; font-weight: bold; color: #d32f2f; padding: 0 2px;">'
+DASHBOARD_HIGHLIGHT_OPEN = '<span class="highlight">'
+
+
+def highlight_title(title, open_tag):
+    return HIGHLIGHT_MATCHER.highlight(title, open_tag, "</span>", escape=escape)
+
+
+_EMAIL_HEADER = CompiledTemplate("""
+    <!DOCTYPE html>
+    <html lang="ko">
+    <head>
+        <meta charset="UTF-8">
+        <style>
+            body {{ font-family: 'Apple SD Gothic Neo', 'Malgun Gothic', sans-serif; line-height: 1.6; color: #333; margin: 0; padding: 0; background-color: #f8f9fa; }}
+            .container {{ max-width: 600px; margin: 20px auto; background: #ffffff; border-radius: 12px; overflow: hidden; box-shadow: 0 4px 15px rgba(0,0,0,0.1); border: 1px solid #eee; }}
+            .header {{ background: linear-gradient(135deg, #007bff 0%, #0056b3 100%); color: white; padding: 30px 20px; text-align: center; }}
+            .header h1 {{ margin: 0; font-size: 24px; font-weight: bold; }}
+            .header p {{ margin: 10px 0 0; font-size: 14px; opacity: 0.9; }}
+            .content {{ padding: 20px; }}
+            .stats {{ background: #f1f3f5; padding: 15px; border-radius: 8px; margin-bottom: 20px; font-size: 14px; display: flex; justify-content: space-around; }}
+            .news-item {{ border-bottom: 1px solid #eee; padding: 15px 0; }}
+            .news-item:last-child {{ border-bottom: none; }}
+            .source-tag {{ display: inline-block; padding: 2px 8px; border-radius: 4px; font-size: 11px; font-weight: bold; color: #1976D2; background: #E3F2FD; margin-bottom: 5px; }}
+            .title {{ display: block; font-size: 17px; font-weight: bold; color: #1a1a1a; text-decoration: none; margin-bottom: 5px; line-height: 1.4; }}
+            .date {{ font-size: 13px; color: #888; }}
+            .also {{ font-size: 12px; color: #888; margin-left: 4px; }}
+            .footer {{ background: #f8f9fa; padding: 20px; text-align: center; font-size: 12px; color: #999; border-top: 1px solid #eee; }}
+            .highlight {{ background-color: #fff176; font-weight: bold; color: #d32f2f; }}
+        </style>
+    </head>
+    <body>
+        <div class="container">
+            <div class="header">
+                <h1>🇰🇷 전국 관광 뉴스 일일 리포트</h1>
+                <p>{generated_at} 기준 최신 소식</p>
+            </div>
+            <div class="content">
+                <div class="stats">
+                    <span>전체 소식: <b>{total}건</b></span>
+                    <span>수집 소스: <b>{sources}개</b></span>
+                </div>
+    {notice}""")
+_EMAIL_FAILED = CompiledTemplate("<p style='font-size: 13px; color: #c0392b;'>⚠️ 일부 소스 수집 실패: {sources}</p>")
+_EMAIL_ITEM = CompiledTemplate("""
+                <div class="news-item">
+                    <span class="source-tag">{source}</span>{also}
+                    <a href="{link}" class="title">{title}</a>
+                    <div class="date">📅 {date}</div>
+                </div>
+            """)
+_EMAIL_ALSO = CompiledTemplate('<span class="also">🔁 {text}</span>')
+_EMAIL_EMPTY = "<p style='text-align:center; padding: 40px; color: #666;'>오늘 수집된 새로운 소식이 없습니다.</p>"
+_EMAIL_FOOTER = """
+            </div>
+            <div class="footer">
+                <p>본 메일은 설정된 스케줄에 따라 자동 발송되었습니다.</p>
+                <p>© 2026 관광 뉴스 통합 엔진 | <a href="#" style="color:#999;">알림 설정 변경</a></p>
+            </div>
+        </div>
+    </body>
+    </html>
+    """
+
+
+class EmailHtmlReport(ReportSink):
+    """메일 본문용 HTML (메일 용량을 고려해 상위 max_items건만 포함)"""
+
+    def __init__(self, target, max_items=30):
+        super().__init__(target)
+        self.max_items = max_items
+
+    def begin(self, meta):
+        self._written = 0
+        failed = meta.get("failed_sources") or []
+        notice = _EMAIL_FAILED.render(sources=escape(", ".join(failed))) if failed else ""
+        self.write(_EMAIL_HEADER.render(generated_at=escape(meta["generated_at"]), total=meta.get("total", 0),
+                                        sources=meta.get("sources", 0), notice=notice))
+
+    def item(self, item):
+        if self._written >= self.max_items:
+            return
+        self._written += 1
+        also = also_text(item)
+        self.write(_EMAIL_ITEM.render(source=escape(item["source"]), link=safe_href(item["link"]),
+                                      also=_EMAIL_ALSO.render(text=escape(also)) if also else "",
+                                      title=highlight_title(item["title"], EMAIL_HIGHLIGHT_OPEN),
+                                      date=escape(format_date(item["date"]))))
+
+    def end(self, totals):
+        if not self._written:
+            self.write(_EMAIL_EMPTY)
+        self.write(_EMAIL_FOOTER)
+
+
+_TOURISM_TXT_ITEM = CompiledTemplate("[{source}] {title} - {link}{also}\n")
+
+
+class TourismTxtReport(ReportSink):
+    """백업용 텍스트 (상위 max_items건)"""
+
+    def __init__(self, target, max_items=10):
+        super().__init__(target)
+        self.max_items = max_items
+
+    def begin(self, meta):
+        self._meta = meta
+        self._written = 0
+
+    def item(self, item):
+        if self._written >= self.max_items:
+            return
+        self._written += 1
+        also = also_text(item)
+        self.write(_TOURISM_TXT_ITEM.render(source=item["source"], title=item["title"], link=item["link"],
+                                            also=f" ({also})" if also else ""))
+
+    def end(self, totals):
+        for section in (unhealthy_text(self._meta), slowest_text(self._meta)):
+            if section:
+                self.write("\n" + section + "\n")
+
+
+_DASHBOARD_HEADER = CompiledTemplate("""<!DOCTYPE html>
+<html lang="ko">
+<head>
+<meta charset="UTF-8">
+<title>대한민국 관광 뉴스 통합 대시보드</title>
+<style>
+    body {{ font-family: 'Noto Sans KR', 'Malgun Gothic', sans-serif; background: linear-gradient(135deg, #f8f9fa 0%, #e9ecef 100%); margin: 0; padding: 30px; }}
+    .wrap {{ max-width: 960px; margin: 0 auto; }}
+    .summary {{ color: #555; margin-bottom: 20px; }}
+    .news-card {{ background-color: white; padding: 1.5rem; border-radius: 16px; box-shadow: 0 4px 20px rgba(0,0,0,0.08); margin-bottom: 1.2rem; border-left: 6px solid #007bff; }}
+    .source-tag {{ display: inline-block; padding: 0.3rem 0.8rem; border-radius: 50px; font-size: 0.75rem; font-weight: 700; margin-bottom: 0.8rem; text-transform: uppercase; letter-spacing: 0.5px; background-color: #E3F2FD; color: #1976D2; }}
+    .tag-visitkorea {{ background-color: #F3E5F5; color: #7B1FA2; }}
+    .tag-ggtour {{ background-color: #E8F5E9; color: #388E3C; }}
+    .tag-mcst {{ background-color: #FFF3E0; color: #E65100; }}
+    .tag-busan {{ background-color: #E0F2F1; color: #00796B; }}
+    .tag-jeju {{ background-color: #FCE4EC; color: #C2185B; }}
+    .tag-incheon {{ background-color: #E8EAF6; color: #303F9F; }}
+    .tag-gangwon {{ background-color: #F1F8E9; color: #558B2F; }}
+    .tag-gyeongbuk {{ background-color: #EFEBE9; color: #5D4037; }}
+    .news-title {{ font-size: 1.25rem; font-weight: 700; color: #1a1a1a; margin-bottom: 0.6rem; text-decoration: none; display: block; line-height: 1.4; }}
+    .news-date {{ font-size: 0.85rem; color: #888; }}
+    .news-also {{ font-size: 0.8rem; color: #888; margin-top: 0.3rem; }}
+    .highlight {{ background: linear-gradient(120deg, #fff176 0%, #fff176 100%); background-repeat: no-repeat; background-size: 100% 40%; background-position: 0 90%; padding: 0 2px; font-weight: 700; color: #d32f2f; }}
+</style>
+</head>
+<body>
+<div class="wrap">
+<h1>🇰🇷 전국 관광 뉴스 통합 엔진</h1>
+<div class="summary">{generated_at} 기준 · 전체 {total}건 · 소스 {sources}개</div>
+""")
+_DASHBOARD_ITEM = CompiledTemplate("""<div class="news-card">
+    <span class="source-tag {source_class}">{source}</span>
+    <a href="{link}" target="_blank" class="news-title">{title}</a>
+    <div class="news-date">📅 {date}</div>{also}
+</div>
+""")
+_DASHBOARD_ALSO = CompiledTemplate('\n    <div class="news-also">🔁 {text}</div>')
+_DASHBOARD_FOOTER = "</div>\n</body>\n</html>\n"
+
+
+@lru_cache(maxsize=16384)
+def _render_card(source, title, link, date, also=""):
+    return _DASHBOARD_ITEM.render(source_class=escape(f"tag-{source.lower()}"), source=escape(source),
+                                  link=safe_href(link), title=highlight_title(title, DASHBOARD_HIGHLIGHT_OPEN),
+                                  date=escape(date), also=_DASHBOARD_ALSO.render(text=escape(also)) if also else "")
+
+
+def render_card(item):
+    """대시보드 카드 HTML 한 장 (app.py와 정적 대시보드가 같이 사용)
+
+    모듈 수준에서 메모이즈하므로 Streamlit이 스크립트를 다시 실행해도
+    이미 그린 항목은 하이라이트/이스케이프를 다시 하지 않는다.
+    스냅샷 행에는 소스/제목이 비어(None) 있을 수 있으므로 빈 문자열로 바꿔 넘긴다.
+    """
+    return _render_card(item["source"] or "", item["title"] or "", item["link"], format_date(item["date"]),
+                        also_text(item))
+
+
+class DashboardHtmlReport(ReportSink):
+    """Streamlit 없이 열어 볼 수 있는 정적 대시보드 (전체 항목 카드)"""
+
+    def begin(self, meta):
+        self.write(_DASHBOARD_HEADER.render(generated_at=escape(meta["generated_at"]), total=meta.get("total", 0),
+                                            sources=meta.get("sources", 0)))
+
+    def item(self, item):
+        self.write(render_card(item))
+
+    def end(self, totals):
+        self.write(_DASHBOARD_FOOTER)
@@ -1,14 +1,33 @@
-import requests
-from bs4 import BeautifulSoup
 import json
 from datetime import datetime
 import sys
 import urllib3
-import re
+import threading
+import time
+from concurrent.futures import Future, wait
+
+import crawl_metrics
+import http_client
+import settings
+from charset_resolver import CharsetResolver
+from crawl_metrics import CrawlMetrics
+from date_extract import DateCutoff, cutoff_date, extract_date, format_date
+from html_parser import parse_html
+from http_cache import get_cache
+from news_item import NewsItem
+from site_health import SiteHealth
+from site_profiles import SiteProfileStore
 
 # SSL 경고 무시
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
+# 링크가 없는 항목의 대체 URL로도 쓰이는 목록 주소
+JEJU_NOTICE_URL = "https://ijto.or.kr/korean/Bd/list.php?btable=notice"
+GYEONGBUK_NOTICE_URL = "https://www.gtc.co.kr/page/10059/10007.tc"
+
+# 응답 시간 기록이 충분하지 않은 소스의 요청 제한 시간(초)
+DEFAULT_TIMEOUT = 10
+
 # 터미널 출력 인코딩 설정 (Windows 대응)
 if sys.platform == 'win32':
     import io
@@ -16,252 +35,486 @@ if sys.platform == 'win32':
     sys.stderr = io.TextIOWrapper(sys.stderr.detach(), encoding='utf-8')
 
 class TourismScraper:
-    def __init__(self):
+    # 소스 이름과 수집 메서드 (fetch_all 결과 병합 순서)
+    SOURCES = [
+        ("VisitSeoul", "fetch_visit_seoul"), ("VisitKorea", "fetch_visit_korea"),
+        ("GGTour", "fetch_gg_tour"), ("MCST", "fetch_mcst"),
+        ("Busan", "fetch_visit_busan"), ("Jeju", "fetch_jeju"),
+        ("Incheon", "fetch_incheon"), ("Gangwon", "fetch_gangwon"),
+        ("Gyeongbuk", "fetch_gyeongbuk"),
+    ]
+
+    def __init__(self, client=None, item_store=None):
+        # 모든 요청은 공용 연결 풀 클라이언트로 보냄 (호스트별 keep-alive 재사용)
+        self.client = client or http_client.get_client()
+        self.cache = get_cache()
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
         }
+        # 마지막 fetch_all의 소스별 상태 (ok / timeout / error / skipped)
+        self.source_status = {}
+        # 소스별 응답 시간/연속 실패 (제한 시간 조정과 회로 차단, 학습 프로필 파일에 함께 저장)
+        self.profiles = SiteProfileStore()
+        self.health = SiteHealth(self.profiles, DEFAULT_TIMEOUT)
+        # 선언 없는 응답의 인코딩은 추정 후 프로필에 기억 (이전에는 항상 UTF-8로 가정)
+        self.charset = CharsetResolver(self.profiles)
+        # 수집 이력(ItemStore)이 있으면 이미 본 글이 나올 때까지 다음 쪽도 읽음 (없으면 1쪽만)
+        self.item_store = item_store
+        # 마지막 fetch_all의 소스별 연결/응답/파싱 측정값
+        self.metrics = CrawlMetrics("tourism")
+        # 병렬 수집 시 소스별 오류를 스레드 단위로 기록
+        self._local = threading.local()
 
-    def _safe_get(self, url, params=None):
+    def _safe_get(self, url, params=None, data=None):
+        # fetch_all 안에서는 소스 이름, 단독 호출이면 URL 기준으로 상태를 기록
+        health_key = getattr(self._local, "health_key", None) or url
+        started = time.perf_counter()
         try:
-            res = requests.get(url, params=params, headers=self.headers, verify=False, timeout=10)
-            res.encoding = 'utf-8'
-            res.raise_for_status()
-            return res
+            # 조건부 GET 캐시를 거쳐 요청 (변경 없으면 이전 추출 결과 재사용)
+            method = "POST" if data is not None else "GET"
+            res = self.cache.fetch(self.client, url, method=method, params=params, data=data,
+                                   headers=self.headers, verify=False, timeout=self.health.timeout(health_key),
+                                   cutoff=cutoff_date(getattr(self._local, "since", None)))
         except Exception as e:
             print(f"Request failed for {url}: {repr(e)}")
+            self._local.error = repr(e)
+            if not self._expired():
+                self.health.failure(health_key, repr(e))
+            crawl_metrics.set_status("error", repr(e))
             return None
+        if not self._expired():
+            self.health.success(health_key, time.perf_counter() - started)
+        return res
+
+    def _expired(self):
+        """fetch_all의 제한 시간이 지난 뒤에도 돌고 있는 소스인지 (이미 timeout으로 보고했으므로 상태를 바꾸지 않음)"""
+        expired = getattr(self._local, "expired", None)
+        return expired is not None and expired.is_set()
+
+    def _fetch_listing(self, url, parse, params=None, data=None):
+        res = self._safe_get(url, params=params, data=data)
+        if res is None: return []
+        if res.unchanged and res.cached_items is not None:
+            items = self._date_scan().filter(res.cached_items)
+            crawl_metrics.set_status("cached")
+            crawl_metrics.add("accepted", len(items))
+            return items
+
+        text = self.charset.decode(res, getattr(self._local, "health_key", None) or url)
+        started = time.perf_counter()
+        items = parse(text)
+        crawl_metrics.add("parse_ms", (time.perf_counter() - started) * 1000)
+        crawl_metrics.add("accepted", len(items))
+        # 기준일로 잘라 낸 결과도 그 기준일과 함께 저장 (대시보드처럼 더 이른 기준일로 가져오면 다시 파싱)
+        self.cache.store_items(res, items, cutoff_date(getattr(self._local, "since", None)))
+        return items
+
+    def _date_scan(self):
+        """이 소스의 기준일 필터 (fetch_all 밖에서 바로 파싱하면 MAX_ITEM_AGE_DAYS만 적용)"""
+        self._local.scan = DateCutoff(cutoff_date(getattr(self._local, "since", None)))
+        return self._local.scan
+
+    def _fetch_pages(self, url, parse, page_param, params=None, data=None):
+        """목록을 1쪽부터 차례로 읽다가 이미 본 글(수집 이력)이 있는 쪽에서 멈춤 (최대 MAX_LIST_PAGES쪽)
+
+        평소에는 1쪽에 이미 본 글이 있어 요청 한 번으로 끝나고, 장애로 며칠 빠진 뒤에는
+        이력의 마지막 글이 나올 때까지 따라가 빠짐없이 채운다. 상단 고정 공지도 이미 본 글이므로
+        쪽 단위로만 멈추고 그 쪽의 글은 모두 돌려준다 (새 글 선별은 호출한 쪽의 filter_new).
+        지난 실행에서 메일 건수 제한으로 못 보낸 글이 있는 소스는 이미 본 글 대신 기준일(DateCutoff)로만
+        멈춘다 - 못 보낸 오래된 글은 이미 보낸 새 글보다 뒤쪽에 있어 이미 본 글에서 멈추면 다시 읽지 못한다.
+        """
+        max_pages = settings.MAX_LIST_PAGES if self.item_store is not None else 1
+        items = []
+        links = set()
+        for page in range(1, max_pages + 1):
+            page_params, page_data = params, data
+            if page > 1:
+                # 1쪽은 쪽 번호 없이 원래 주소 그대로 요청 (캐시 키 유지)
+                if data is not None:
+                    page_data = dict(data, **{page_param: str(page)})
+                else:
+                    page_params = dict(params or {}, **{page_param: page})
+            self._local.scan = None
+            crawl_metrics.add("pages", 1)
+            page_items = self._fetch_listing(url, parse, params=page_params, data=page_data)
+            # 빈 쪽이거나, 쪽 번호를 무시하고 같은 목록을 돌려주는 사이트
+            fresh = [item for item in page_items if item['link'] not in links]
+            if not fresh:
+                break
+            links.update(item['link'] for item in fresh)
+            items.extend(fresh)
+            scan = getattr(self._local, "scan", None)
+            if scan is not None and scan.done:
+                break
+            if getattr(self._local, "held_back", False) and scan is not None and scan.cutoff is not None:
+                continue
+            if self.item_store is not None and any(self.item_store.contains(item) for item in fresh):
+                break
+        return items
 
     def fetch_visit_seoul(self):
         """VisitSeoul 공지사항"""
-        url = "https://korean.visitseoul.net/announcements"
-        res = self._safe_get(url)
-        if not res: return []
-        
-        soup = BeautifulSoup(res.text, 'html.parser')
+        return self._fetch_pages("https://korean.visitseoul.net/announcements", self.parse_visit_seoul, "curPage")
+
+    def parse_visit_seoul(self, text):
+        soup = parse_html(text)
         items = []
         rows = soup.select('.qna-list-table tbody tr')
+        scan = self._date_scan()
         for row in rows:
             title_elem = row.select_one('td.text-align-left a')
             if not title_elem: continue
+
+            date = extract_date(row.select('td')[2].get_text(strip=True))
+            if not scan.accept(date):
+                if scan.done: break
+                continue
             
-            items.append({
-                'source': 'VisitSeoul',
-                'title': title_elem.get_text(strip=True),
-                'date': row.select('td')[2].get_text(strip=True),
-                'link': "https://korean.visitseoul.net" + title_elem['href']
-            })
+            items.append(NewsItem(
+                source='VisitSeoul',
+                title=title_elem.get_text(strip=True),
+                date=date,
+                link="https://korean.visitseoul.net" + title_elem['href']
+            ))
         return items
 
     def fetch_visit_korea(self):
         """VisitKorea 뉴스/공지사항 (API)"""
         url = "https://korean.visitkorea.or.kr/call"
         payload = {'cmd': 'NOTICE_LIST_VIEW', 'page': '1', 'cnt': '10', 'sortkind': '1'}
-        try:
-            res = requests.post(url, data=payload, headers=self.headers, verify=False, timeout=10)
-            res.encoding = 'utf-8'
-            data = res.json()
-            items = []
-            for res_item in data.get('body', {}).get('result', []):
-                raw_date = res_item.get('createDate', '')
-                items.append({
-                    'source': 'VisitKorea',
-                    'title': res_item.get('title'),
-                    'date': f"{raw_date[:4]}-{raw_date[4:6]}-{raw_date[6:8]}" if len(raw_date) >= 8 else raw_date,
-                    'link': f"https://korean.visitkorea.or.kr/notice/news_detail.do?nwsId={res_item.get('nwsId')}"
-                })
-            return items
-        except Exception as e:
-            print(f"Error VisitKorea: {repr(e)}")
-            return []
+        return self._fetch_pages(url, self.parse_visit_korea, "page", data=payload)
+
+    def parse_visit_korea(self, text):
+        data = json.loads(text)
+        items = []
+        scan = self._date_scan()
+        for res_item in data.get('body', {}).get('result', []):
+            date = extract_date(str(res_item.get('createDate') or ''))
+            if not scan.accept(date):
+                if scan.done: break
+                continue
+            items.append(NewsItem(
+                source='VisitKorea',
+                title=res_item.get('title'),
+                date=date,
+                link=f"https://korean.visitkorea.or.kr/notice/news_detail.do?nwsId={res_item.get('nwsId')}"
+            ))
+        return items
 
     def fetch_gg_tour(self):
         """경기관광공사 (API)"""
-        url = "https://ggtour.or.kr/api/v1/service/notice"
-        res = self._safe_get(url)
-        if not res: return []
-        
-        data = res.json()
+        return self._fetch_pages("https://ggtour.or.kr/api/v1/service/notice", self.parse_gg_tour, "page")
+
+    def parse_gg_tour(self, text):
+        data = json.loads(text)
         items = []
+        scan = self._date_scan()
         for res_item in data.get('data', {}).get('items', []):
-            items.append({
-                'source': 'GGTour',
-                'title': res_item.get('title'),
-                'date': res_item.get('createdAt', '').split(' ')[0],
-                'link': res_item.get('contentLink')
-            })
+            date = extract_date(res_item.get('createdAt') or '')
+            if not scan.accept(date):
+                if scan.done: break
+                continue
+            items.append(NewsItem(
+                source='GGTour',
+                title=res_item.get('title'),
+                date=date,
+                link=res_item.get('contentLink')
+            ))
         return items
 
     def fetch_mcst(self):
         """문화체육관광부 공지사항"""
-        url = "https://www.mcst.go.kr/site/s_notice/notice/noticeList.jsp"
-        res = self._safe_get(url)
-        if not res: return []
-        
-        soup = BeautifulSoup(res.text, 'html.parser')
+        return self._fetch_pages("https://www.mcst.go.kr/site/s_notice/notice/noticeList.jsp", self.parse_mcst, "pCurrentPage")
+
+    def parse_mcst(self, text):
+        soup = parse_html(text)
         items = []
         rows = soup.select('table.board tbody tr')
+        scan = self._date_scan()
         for row in rows:
             title_elem = row.select_one('td.subject a')
             if not title_elem: continue
             
             date_tds = row.select('td')
             # 문체부 테이블 구조에 따라 날짜 위치 확인 필요 (보통 끝에서 두번째 또는 네번째)
-            date = date_tds[-2].get_text(strip=True) if len(date_tds) > 2 else ""
+            date = extract_date(date_tds[-2].get_text(strip=True)) if len(date_tds) > 2 else None
+            if not scan.accept(date):
+                if scan.done: break
+                continue
             
-            items.append({
-                'source': 'MCST',
-                'title': title_elem.get_text(strip=True),
-                'date': date,
-                'link': "https://www.mcst.go.kr/site/s_notice/notice/" + title_elem['href']
-            })
+            items.append(NewsItem(
+                source='MCST',
+                title=title_elem.get_text(strip=True),
+                date=date,
+                link="https://www.mcst.go.kr/site/s_notice/notice/" + title_elem['href']
+            ))
         return items
 
     def fetch_visit_busan(self):
         """비짓부산 공지사항"""
         url = "https://www.visitbusan.net/board/list.do?boardId=BBS_0000001&menuCd=DOM_000000204001000000"
-        res = self._safe_get(url)
-        if not res: return []
-        
-        soup = BeautifulSoup(res.text, 'html.parser')
+        return self._fetch_pages(url, self.parse_visit_busan, "pageIndex")
+
+    def parse_visit_busan(self, text):
+        soup = parse_html(text)
         items = []
         rows = soup.select('table.bbs_default.list tbody tr')
+        scan = self._date_scan()
         for row in rows:
             title_elem = row.select_one('td.tit a')
             if not title_elem: continue
+
+            date_td = row.select_one('td.date')
+            date = extract_date(date_td.get_text(strip=True)) if date_td else None
+            if not scan.accept(date):
+                if scan.done: break
+                continue
             
-            items.append({
-                'source': 'Busan',
-                'title': title_elem.get_text(strip=True),
-                'date': row.select('td.date')[0].get_text(strip=True) if row.select('td.date') else "",
-                'link': "https://www.visitbusan.net" + title_elem['href']
-            })
+            items.append(NewsItem(
+                source='Busan',
+                title=title_elem.get_text(strip=True),
+                date=date,
+                link="https://www.visitbusan.net" + title_elem['href']
+            ))
         return items
 
+    @staticmethod
+    def _date_cell(row):
+        """날짜 칸 위치가 정해져 있지 않은 표: 날짜로 읽히는 첫 번째 짧은 td (제목 속 날짜는 제외)"""
+        for td in row.select('td'):
+            txt = td.get_text(strip=True)
+            date = extract_date(txt) if len(txt) <= 20 else None
+            if date:
+                return date
+        return None
+
     def fetch_jeju(self):
         """제주관광공사 공지사항"""
-        url = "https://ijto.or.kr/korean/Bd/list.php?btable=notice"
-        res = self._safe_get(url)
-        if not res: return []
-        
-        soup = BeautifulSoup(res.text, 'html.parser')
+        return self._fetch_pages(JEJU_NOTICE_URL, self.parse_jeju, "pg")
+
+    def parse_jeju(self, text):
+        soup = parse_html(text)
         items = []
         # Ttable_wrap 구조 확인 결과 반영
         rows = soup.select('.Ttable_wrap.notice table tbody tr')
+        scan = self._date_scan()
         for row in rows:
             title_elem = row.select_one('.board_title.table_a')
             if not title_elem: continue
             
             # 날짜 위치 (td 중 보통 하나)
-            date = ""
-            tds = row.select('td')
-            for td in tds:
-                txt = td.get_text(strip=True)
-                if re.match(r'\d{4}-\d{2}-\d{2}', txt):
-                    date = txt
-                    break
+            date = self._date_cell(row)
+            if not scan.accept(date):
+                if scan.done: break
+                continue
             
-            items.append({
-                'source': 'Jeju',
-                'title': title_elem.get_text(strip=True),
-                'date': date,
-                'link': "https://ijto.or.kr/korean/Bd/" + title_elem['href'] if 'href' in title_elem.attrs else url
-            })
+            items.append(NewsItem(
+                source='Jeju',
+                title=title_elem.get_text(strip=True),
+                date=date,
+                link="https://ijto.or.kr/korean/Bd/" + title_elem['href'] if 'href' in title_elem.attrs else JEJU_NOTICE_URL
+            ))
         return items
 
     def fetch_incheon(self):
         """인천관광공사 공지사항"""
-        url = "https://www.ito.or.kr/main/board/notice.jsp"
-        res = self._safe_get(url)
-        if not res: return []
-        
-        soup = BeautifulSoup(res.text, 'html.parser')
+        return self._fetch_pages("https://www.ito.or.kr/main/board/notice.jsp", self.parse_incheon, "page")
+
+    def parse_incheon(self, text):
+        soup = parse_html(text)
         items = []
         rows = soup.select('table tbody tr')
+        scan = self._date_scan()
         for row in rows:
             title_elem = row.select_one('td.tit a')
             if not title_elem: continue
+
+            date_td = row.select_one('td.date')
+            date = extract_date(date_td.get_text(strip=True)) if date_td else None
+            if not scan.accept(date):
+                if scan.done: break
+                continue
             
-            items.append({
-                'source': 'Incheon',
-                'title': title_elem.get_text(strip=True),
-                'date': row.select('td.date')[0].get_text(strip=True) if row.select('td.date') else "",
-                'link': "https://www.ito.or.kr" + title_elem['href']
-            })
+            items.append(NewsItem(
+                source='Incheon',
+                title=title_elem.get_text(strip=True),
+                date=date,
+                link="https://www.ito.or.kr" + title_elem['href']
+            ))
         return items
 
     def fetch_gangwon(self):
         """강원관광재단 공지사항"""
-        url = "https://www.gwto.or.kr/www/selectBbsNttList.do?bbsNo=1&key=21"
-        res = self._safe_get(url)
-        if not res: return []
-        
-        soup = BeautifulSoup(res.text, 'html.parser')
+        return self._fetch_pages("https://www.gwto.or.kr/www/selectBbsNttList.do?bbsNo=1&key=21", self.parse_gangwon, "pageIndex")
+
+    def parse_gangwon(self, text):
+        soup = parse_html(text)
         items = []
         rows = soup.select('table.bbs_list tbody tr') or soup.select('.bbs_list table tbody tr')
+        scan = self._date_scan()
         for row in rows:
             title_elem = row.select_one('td.subject a')
             if not title_elem: continue
+
+            date_td = row.select_one('td.date')
+            date = extract_date(date_td.get_text(strip=True)) if date_td else None
+            if not scan.accept(date):
+                if scan.done: break
+                continue
             
-            items.append({
-                'source': 'Gangwon',
-                'title': title_elem.get_text(strip=True),
-                'date': row.select('td.date')[0].get_text(strip=True) if row.select('td.date') else "",
-                'link': "https://www.gwto.or.kr" + title_elem['href']
-            })
+            items.append(NewsItem(
+                source='Gangwon',
+                title=title_elem.get_text(strip=True),
+                date=date,
+                link="https://www.gwto.or.kr" + title_elem['href']
+            ))
         return items
 
     def fetch_gyeongbuk(self):
         """경북관광공사 공지사항"""
-        url = "https://www.gtc.co.kr/page/10059/10007.tc"
-        res = self._safe_get(url)
-        if not res: return []
-        
-        soup = BeautifulSoup(res.text, 'html.parser')
+        return self._fetch_pages(GYEONGBUK_NOTICE_URL, self.parse_gyeongbuk, "pageIndex")
+
+    def parse_gyeongbuk(self, text):
+        soup = parse_html(text)
         items = []
         rows = soup.select('.Ttable_wrap.notice table tbody tr')
+        scan = self._date_scan()
         for row in rows:
             title_elem = row.select_one('.board_title.table_a')
             if not title_elem: continue
             
-            date = ""
-            for td in row.select('td'):
-                txt = td.get_text(strip=True)
-                if re.match(r'\d{4}-\d{2}-\d{2}', txt):
-                    date = txt
-                    break
-
-            items.append({
-                'source': 'Gyeongbuk',
-                'title': title_elem.get_text(strip=True),
-                'date': date,
-                'link': "https://www.gtc.co.kr" + title_elem['href'] if 'href' in title_elem.attrs else url
-            })
+            date = self._date_cell(row)
+            if not scan.accept(date):
+                if scan.done: break
+                continue
+
+            items.append(NewsItem(
+                source='Gyeongbuk',
+                title=title_elem.get_text(strip=True),
+                date=date,
+                link="https://www.gtc.co.kr" + title_elem['href'] if 'href' in title_elem.attrs else GYEONGBUK_NOTICE_URL
+            ))
         return items
 
-    def fetch_all(self):
-        """모든 소스 통합"""
-        all_items = []
-        fetchers = [
-            self.fetch_visit_seoul, self.fetch_visit_korea, self.fetch_gg_tour,
-            self.fetch_mcst, self.fetch_visit_busan, self.fetch_jeju,
-            self.fetch_incheon, self.fetch_gangwon, self.fetch_gyeongbuk
-        ]
-        
-        for fetcher in fetchers:
+    def _run_fetcher(self, name, method, since_last_run=False, expired=None):
+        """(항목, 오류, 걸린 시간) - 회로가 열려 건너뛴 소스는 항목이 None
+
+        expired: fetch_all이 제한 시간을 넘기면 세우는 Event (그 뒤로는 사이트 상태를 기록하지 않음)
+        """
+        self._local.error = None
+        self._local.expired = expired
+        self._local.health_key = f"tourism:{name}"
+        # 새 항목만 보고하는 실행이면 마지막 성공 실행일 이전 글은 읽지 않음
+        profile = self.profiles.get(self._local.health_key) if since_last_run else {}
+        self._local.since = profile.get("last_run")
+        self._local.held_back = bool(profile.get("held_back"))
+        if not self.health.allow(self._local.health_key, name):
+            print(f"Skipping {name}: circuit open after repeated failures")
+            with self.metrics.site(name):
+                crawl_metrics.set_status("skipped")
+            return None, None, 0.0
+        started = time.monotonic()
+        with self.metrics.site(name):
             try:
-                all_items.extend(fetcher())
+                items = getattr(self, method)()
             except Exception as e:
                 print(f"Fetcher error: {repr(e)}")
-        
-        # 유효한 날짜 데이터가 있는 것만 필터링 및 정렬
+                self._local.error = repr(e)
+                crawl_metrics.set_status("error", repr(e))
+                items = []
+        return items, self._local.error, time.monotonic() - started
+
+    def _start_fetcher(self, name, method, since_last_run, expired):
+        """소스 하나를 데몬 스레드에서 수집하고 결과를 받을 Future를 반환
+
+        스레드 풀의 작업 스레드는 인터프리터 종료 때 끝날 때까지 기다리므로, 제한 시간을 넘긴 소스가
+        실행 전체를 붙잡지 않도록 버려도 되는 데몬 스레드를 쓴다.
+        """
+        future = Future()
+
+        def run():
+            try:
+                future.set_result(self._run_fetcher(name, method, since_last_run, expired))
+            except BaseException as e:
+                future.set_exception(e)
+
+        threading.Thread(target=run, name=f"fetch-{name}", daemon=True).start()
+        return future
+
+    def fetch_all(self, deadline=None, since_last_run=False):
+        """모든 소스 통합 (제한 시간 안에 끝난 소스만 반영)
+
+        since_last_run: 소스별 마지막 성공 실행일 이전 글은 읽지 않음 (새 항목만 보고하는 일일 실행용)
+        마지막 성공 실행일은 여기서 기록하지 않고, 리포트를 보낸 뒤 호출한 쪽이 save_last_run으로 기록한다.
+        """
+        if deadline is None:
+            deadline = settings.FETCH_DEADLINE
+
+        self.metrics = CrawlMetrics("tourism")
+        self.health = SiteHealth(self.profiles, DEFAULT_TIMEOUT)
+        expired = threading.Event()
+        futures = {self._start_fetcher(name, method, since_last_run, expired): name for name, method in self.SOURCES}
+        done, _ = wait(futures, timeout=deadline)
+        # 늦은 소스는 기다리지 않고 부분 결과만 반환 (남은 스레드는 데몬이라 종료를 막지 않고, 상태도 더 기록하지 않음)
+        expired.set()
+
+        all_items = []
+        status = {}
+        for future, name in futures.items():
+            if future not in done:
+                status[name] = {'status': 'timeout', 'count': 0, 'elapsed': deadline, 'error': None}
+                self.metrics.mark(name, 'timeout')
+                continue
+            items, error, elapsed = future.result()
+            if items is None:
+                status[name] = {'status': 'skipped', 'count': 0, 'elapsed': 0.0, 'error': None}
+                continue
+            all_items.extend(items)
+            status[name] = {
+                'status': 'error' if error else 'ok',
+                'count': len(items),
+                'elapsed': round(elapsed, 2),
+                'error': error,
+            }
+        self.source_status = status
+        self.profiles.save()
+
+        # 유효한 날짜 데이터가 있는 것만 필터링 및 최신순 정렬 (date 기준이라 표기 형식과 무관)
         valid_items = [i for i in all_items if i['date']]
         valid_items.sort(key=lambda x: x['date'], reverse=True)
+        # 여러 기관에 올라온 같은 보도자료도 소스별로 그대로 반환 (보관소/이력용) - 메일/대시보드는 near_duplicates.collapse로 묶음
         return valid_items
 
+    def save_last_run(self, held_back=(), today=None):
+        """마지막 fetch_all에서 오류 없이 읽은 소스의 마지막 성공 실행일을 기록
+
+        수집 중에 기록하면 리포트/메일 전에 실행이 실패해도 다음 실행이 그 날짜 이전 글을 읽지 않아
+        글이 빠지므로, 리포트를 다 만든 뒤에 호출한다. held_back(메일 건수 제한으로 보내지 못한 새 글)이
+        있는 소스는 오늘 대신 그중 가장 오래된 글의 날짜까지만 넘겨 다음 실행에서 다시 읽게 한다
+        (기준일과 같은 날짜의 글은 읽으므로 그 글도 포함, 이미 보낸 글은 수집 이력이 거름).
+        """
+        today = today or datetime.now().strftime('%Y-%m-%d')
+        oldest = {}
+        for item in held_back:
+            day = format_date(item['date'])
+            if day and (item['source'] not in oldest or day < oldest[item['source']]):
+                oldest[item['source']] = day
+        for name, info in self.source_status.items():
+            if info['status'] == 'ok':
+                self.profiles.update(f"tourism:{name}", last_run=min(oldest.get(name, today), today),
+                                     held_back=name in oldest)
+        self.profiles.save()
+
 if __name__ == "__main__":
     scraper = TourismScraper()
     print("Fetching news from all expanded sources...")
     results = scraper.fetch_all()
     print(f"Finished. Total {len(results)} items found.")
+    for name, info in scraper.source_status.items():
+        print(f"  - {name}: {info['status']} ({info['count']} items, {info['elapsed']}s)")
+    scraper.metrics.export()
+    print(crawl_metrics.format_summary(scraper.metrics))
+    print(http_client.format_stats(http_client.close_client()))
+    scraper.cache.prune()
     for item in results[:20]:
         print(f"[{item['source']}] {item['date']} - {item['title'][:60]}...")
@@ -0,0 +1,67 @@
+class TitleIndex:
+    """대시보드 제목 검색용 메모리 색인 (데이터를 불러올 때 한 번 생성)
+
+    - 제목을 소문자로 바꿔 한 번만 저장하고, 글자 2-gram마다 항목 번호 목록(postings)을 둔다.
+      한국어 제목은 띄어쓰기가 일정하지 않아 단어 대신 글자 n-gram을 쓴다.
+    - 검색어의 각 단어는 2-gram postings를 짧은 것부터 교집합해 후보를 줄인 뒤
+      실제 부분 문자열인지 확인한다 (2-gram이 흩어져 있는 오탐 제거).
+    - 여러 단어는 모두 포함해야 하며, 단어가 많이 등장한 제목이 먼저 온다 (동점은 원래 순서).
+    """
+
+    def __init__(self, items, n=2):
+        self.n = n
+        self.items = items
+        self._titles = [(item.get("title") or "").lower() for item in items]
+        self._grams = {}
+        self._sources = {}
+        for idx, (item, title) in enumerate(zip(items, self._titles)):
+            # 같은 보도자료로 묶인 항목은 함께 올라온 소스(also)로 골라도 나옴
+            for source in (item.get("source"), *(item.get("also") or ())):
+                self._sources.setdefault(source, []).append(idx)
+            for gram in {title[i:i + n] for i in range(len(title) - n + 1)}:
+                self._grams.setdefault(gram, []).append(idx)
+
+    def _term_candidates(self, term):
+        if len(term) < self.n:
+            # 한 글자 검색어는 n-gram이 없으므로 제목을 직접 확인
+            return {idx for idx, title in enumerate(self._titles) if term in title}
+        postings = []
+        for gram in {term[i:i + self.n] for i in range(len(term) - self.n + 1)}:
+            posting = self._grams.get(gram)
+            if not posting:
+                return set()
+            postings.append(posting)
+        postings.sort(key=len)
+        candidates = set(postings[0])
+        for posting in postings[1:]:
+            candidates.intersection_update(posting)
+            if not candidates:
+                return candidates
+        if len(term) > self.n:
+            candidates = {idx for idx in candidates if term in self._titles[idx]}
+        return candidates
+
+    def search(self, query="", source=None):
+        """검색어/소스 조건에 맞는 항목 번호 목록 (순위 순)"""
+        terms = [t for t in (query or "").lower().split() if t]
+        candidates = None
+        if source is not None:
+            candidates = set(self._sources.get(source, ()))
+        # 후보가 적은 단어부터 교집합
+        for term in sorted(terms, key=len, reverse=True):
+            term_ids = self._term_candidates(term)
+            candidates = term_ids if candidates is None else candidates & term_ids
+            if not candidates:
+                return []
+        if candidates is None:
+            return list(range(len(self.items)))
+        if not terms:
+            return sorted(candidates)
+
+        def rank(idx):
+            title = self._titles[idx]
+            return (-sum(title.count(term) for term in terms), idx)
+        return sorted(candidates, key=rank)
+
+    def filter(self, query="", source=None):
+        return [self.items[idx] for idx in self.search(query, source)]
@@ -0,0 +1,100 @@
+import os
+
+# 실행 환경 설정 (GitHub Actions 등에서 환경 변수로 조정 가능)
+
+# 동시에 수집할 최대 사이트 수 (1이면 순차 수집)
+CRAWL_MAX_WORKERS = int(os.environ.get("NEWS_BOT_MAX_WORKERS", "8"))
+
+# 목록 파싱/추출을 맡을 프로세스 수 (0이면 수집 스레드에서 바로 파싱) - 기본은 CPU 코어 수 (코어가 하나면 0)
+_CPUS = os.cpu_count() or 1
+PARSE_PROCESSES = int(os.environ.get("NEWS_BOT_PARSE_PROCESSES", str(_CPUS if _CPUS > 1 else 0)))
+# 파싱을 기다리거나 파싱 중인 페이지 수 상한 - 차면 수집 스레드가 멈춤 (받아 둔 HTML이 메모리에 쌓이지 않도록)
+PARSE_QUEUE_SIZE = int(os.environ.get("NEWS_BOT_PARSE_QUEUE", "16"))
+# 파싱 워커가 죽어 프로세스 풀이 깨졌을 때 한 실행에서 새로 만드는 최대 횟수 (넘으면 수집 스레드에서 바로 파싱)
+PARSE_POOL_RESTARTS = int(os.environ.get("NEWS_BOT_PARSE_POOL_RESTARTS", "2"))
+
+# 같은 호스트에 연속 요청할 때의 최소 간격(초)
+HOST_MIN_INTERVAL = float(os.environ.get("NEWS_BOT_HOST_INTERVAL", "1.0"))
+
+# TourismScraper.fetch_all 전체 제한 시간(초) - 초과 시 끝난 소스만 반환
+FETCH_DEADLINE = float(os.environ.get("NEWS_BOT_FETCH_DEADLINE", "30"))
+
+# 공용 HTTP 클라이언트 연결 풀 크기 (유지할 호스트 수 / 호스트당 keep-alive 연결 수)
+HTTP_POOL_HOSTS = int(os.environ.get("NEWS_BOT_POOL_HOSTS", "100"))
+HTTP_POOL_MAXSIZE = int(os.environ.get("NEWS_BOT_POOL_MAXSIZE", "4"))
+
+# 새 연결의 DNS 조회 시간을 따로 잴지 (1이면 연결마다 조회를 한 번 더 함 - 기본은 조회 시간이 connect_ms에 포함)
+HTTP_TIME_DNS = os.environ.get("NEWS_BOT_TIME_DNS", "0") == "1"
+
+# 부하 테스트용 HTTP 모드: live(기본) / record(실제 응답을 카세트로 저장) / replay(카세트로만 응답, 네트워크 없음)
+HTTP_MODE = os.environ.get("NEWS_BOT_HTTP_MODE", "live")
+
+# 모든 요청을 보낼 스텁 서버 주소 (예: http://127.0.0.1:8765, stub_server.py) - 비우면 실제 사이트로 요청
+HTTP_BASE_URL = os.environ.get("NEWS_BOT_HTTP_BASE", "")
+
+# IntegratedNewsEngine 수집 대상 목록 JSON ([{"name": ..., "url": ...}]) - 비우면 TARGET_SITES
+SITES_FILE = os.environ.get("NEWS_BOT_SITES_FILE", "")
+
+# 사이트별 요청 제한 시간: 최근 응답 시간 p95의 HEALTH_TIMEOUT_FACTOR배 (표본이 적으면 스크래퍼 기본값)
+HEALTH_TIMEOUT_FACTOR = float(os.environ.get("NEWS_BOT_TIMEOUT_FACTOR", "3"))
+HEALTH_TIMEOUT_MIN = float(os.environ.get("NEWS_BOT_TIMEOUT_MIN", "3"))
+HEALTH_TIMEOUT_MAX = float(os.environ.get("NEWS_BOT_TIMEOUT_MAX", "30"))
+HEALTH_CONNECT_TIMEOUT = float(os.environ.get("NEWS_BOT_CONNECT_TIMEOUT", "5"))
+
+# 연속 실패가 이 횟수에 이르면 회로를 열어 쿨다운 동안 건너뜀 (다시 실패할 때마다 쿨다운 두 배, 최대값까지)
+CIRCUIT_FAILURES = int(os.environ.get("NEWS_BOT_CIRCUIT_FAILURES", "3"))
+CIRCUIT_COOLDOWN_HOURS = float(os.environ.get("NEWS_BOT_CIRCUIT_COOLDOWN_HOURS", "20"))
+CIRCUIT_MAX_COOLDOWN_HOURS = float(os.environ.get("NEWS_BOT_CIRCUIT_MAX_COOLDOWN_HOURS", "168"))
+
+# 실행 간에 유지되는 상태(HTTP 캐시 등) 저장 위치 - GitHub Actions cache로 복원됨
+STATE_DIR = os.environ.get("NEWS_BOT_STATE_DIR", ".news_bot")
+
+# 조건부 GET 캐시 (ETag / Last-Modified)
+HTTP_CACHE_ENABLED = os.environ.get("NEWS_BOT_HTTP_CACHE", "1") != "0"
+HTTP_CACHE_DIR = os.path.join(STATE_DIR, "http_cache")
+HTTP_CACHE_MAX_BYTES = int(os.environ.get("NEWS_BOT_HTTP_CACHE_MAX_MB", "50")) * 1024 * 1024
+HTTP_CACHE_MAX_AGE_DAYS = float(os.environ.get("NEWS_BOT_HTTP_CACHE_MAX_AGE_DAYS", "14"))
+
+# 수집 이력이 있을 때 소스 목록을 이미 본 글이 나올 때까지 최대 몇 쪽까지 읽을지
+MAX_LIST_PAGES = int(os.environ.get("NEWS_BOT_MAX_PAGES", "5"))
+
+# 목록에서 이 일수보다 오래된 글은 건너뜀 (0이면 제한 없음)
+# 새 항목만 보고하는 실행은 마지막 성공 실행일 이전 글도 건너뜀
+MAX_ITEM_AGE_DAYS = float(os.environ.get("NEWS_BOT_MAX_ITEM_AGE_DAYS", "0"))
+# 기준일 이전 행이 이만큼 연속으로 나오면 목록의 나머지는 읽지 않음 (상단 고정 공지 대비)
+STALE_ROW_STREAK = int(os.environ.get("NEWS_BOT_STALE_ROW_STREAK", "3"))
+
+# 목록 페이지 본문 상한 (KB) - 넘는 부분은 받지 않음 (0이면 제한 없음)
+MAX_PAGE_BYTES = int(os.environ.get("NEWS_BOT_MAX_PAGE_KB", "1024")) * 1024
+
+# record/replay 카세트 저장 위치
+HTTP_CASSETTE_DIR = os.environ.get("NEWS_BOT_CASSETTE_DIR", os.path.join(STATE_DIR, "cassettes"))
+
+# 실행 간 중복 제거용 수집 이력 (SQLite) - 리포트에는 새 항목만 포함
+ONLY_NEW_ITEMS = os.environ.get("NEWS_BOT_ONLY_NEW", "1") != "0"
+ITEM_STORE_PATH = os.path.join(STATE_DIR, "items.sqlite3")
+ITEM_RETENTION_DAYS = float(os.environ.get("NEWS_BOT_HISTORY_DAYS", "180"))
+
+# 실행마다 수집 결과를 열 단위 파일로 남길 위치 (비우면 남기지 않음)와 형식: parquet / feather (pyarrow 필요, 없으면 csv)
+HISTORY_EXPORT_DIR = os.environ.get("NEWS_BOT_HISTORY_EXPORT_DIR", os.path.join(STATE_DIR, "history"))
+HISTORY_EXPORT_FORMAT = os.environ.get("NEWS_BOT_HISTORY_FORMAT", "parquet")
+
+# 수집 항목 보관소: 글 날짜별 파티션 + 날짜/소스 색인 (대시보드 지난 기록 보기) - 비우면 보관하지 않음
+ARCHIVE_DIR = os.environ.get("NEWS_BOT_ARCHIVE_DIR", os.path.join(STATE_DIR, "archive"))
+
+# 여러 기관에 올라온 같은 보도자료로 묶을 제목 유사도 (글자 3-gram Jaccard, 0이면 묶지 않음)
+NEAR_DUP_THRESHOLD = float(os.environ.get("NEWS_BOT_NEAR_DUP_THRESHOLD", "0.5"))
+
+# 사이트별로 학습한 수집 정보 (잘 맞는 목록 선택자 등)
+SITE_PROFILE_PATH = os.path.join(STATE_DIR, "site_profiles.json")
+
+# 사이트별 수집 측정값: JSON lines(실행마다 파일 끝에 추가) / Prometheus textfile - 비우면 기록하지 않음
+METRICS_JSONL_PATH = os.environ.get("NEWS_BOT_METRICS_JSONL", "crawl_metrics.jsonl")
+METRICS_PROMETHEUS_PATH = os.environ.get("NEWS_BOT_METRICS_PROM", "")
+
+# HTML 파서 백엔드: html.parser(기본) / lxml / html5lib / selectolax
+HTML_PARSER = os.environ.get("NEWS_BOT_HTML_PARSER", "html.parser")
+
+# 대시보드: 마지막으로 성공한 수집 결과 스냅샷과 백그라운드 갱신 주기(초)
+DASHBOARD_SNAPSHOT_PATH = os.path.join(STATE_DIR, "dashboard_snapshot.json")
+DASHBOARD_TTL = float(os.environ.get("NEWS_BOT_DASHBOARD_TTL", "1800"))
@@ -0,0 +1,116 @@
+import math
+import threading
+import time
+from datetime import datetime
+
+import settings
+
+# 사이트별로 보관하는 최근 응답 시간 표본 수
+LATENCY_SAMPLES = 20
+
+
+def percentile(samples, pct):
+    """최근 표본의 백분위 (nearest-rank)"""
+    if not samples:
+        return None
+    ordered = sorted(samples)
+    index = min(len(ordered), max(1, math.ceil(pct / 100 * len(ordered)))) - 1
+    return ordered[index]
+
+
+class SiteHealth:
+    """사이트별 응답 시간과 연속 실패를 학습 프로필(SiteProfileStore)의 health 필드에 기록
+
+    - timeout(): 관측한 p95 응답 시간으로 요청 제한 시간을 정함 (표본이 적으면 기본값)
+    - allow(): 연속 실패가 기준을 넘은 사이트는 회로를 열어 쿨다운 동안 건너뛰고,
+      쿨다운이 지나면 한 번 시험 요청(probe)을 보냄. 시험도 실패하면 쿨다운을 두 배로 늘림.
+    """
+
+    def __init__(self, profiles, default_timeout):
+        self.profiles = profiles
+        self.default_timeout = default_timeout
+        # 이번 실행에서 본 사이트: key -> {"name", "state"} (skipped / opened / probe)
+        self._seen = {}
+        self._lock = threading.Lock()
+
+    def _health(self, key):
+        return dict(self.profiles.get(key).get("health") or {})
+
+    def _note(self, key, name, state):
+        with self._lock:
+            entry = self._seen.setdefault(key, {"name": name or key, "state": None})
+            if name:
+                entry["name"] = name
+            if state:
+                entry["state"] = state
+
+    def allow(self, key, name=None):
+        health = self._health(key)
+        open_until = health.get("open_until")
+        if open_until and time.time() < open_until:
+            self._note(key, name, "skipped")
+            return False
+        self._note(key, name, "probe" if open_until else None)
+        return True
+
+    def timeout(self, key):
+        """(연결, 읽기) 제한 시간 - 응답이 빠른 사이트일수록 짧아짐"""
+        samples = self._health(key).get("latency") or []
+        if len(samples) < 3:
+            read = self.default_timeout
+        else:
+            read = percentile(samples, 95) * settings.HEALTH_TIMEOUT_FACTOR
+            read = min(max(read, settings.HEALTH_TIMEOUT_MIN), settings.HEALTH_TIMEOUT_MAX)
+        return min(settings.HEALTH_CONNECT_TIMEOUT, read), read
+
+    def success(self, key, latency):
+        health = self._health(key)
+        samples = (health.get("latency") or [])[-(LATENCY_SAMPLES - 1):]
+        samples.append(round(latency, 3))
+        health.update(latency=samples, failures=0, opens=0, open_until=None, last_ok=time.time())
+        self.profiles.update(key, health=health)
+        with self._lock:
+            if key in self._seen and self._seen[key]["state"] == "probe":
+                self._seen[key]["state"] = None
+
+    def failure(self, key, error):
+        health = self._health(key)
+        failures = health.get("failures", 0) + 1
+        health.update(failures=failures, last_error=str(error)[:200], last_failure=time.time())
+        if failures >= settings.CIRCUIT_FAILURES:
+            # 연속으로 회로가 열릴수록 쿨다운을 두 배로 (최대 CIRCUIT_MAX_COOLDOWN_HOURS)
+            opens = health.get("opens", 0) + 1
+            hours = min(settings.CIRCUIT_COOLDOWN_HOURS * 2 ** (opens - 1), settings.CIRCUIT_MAX_COOLDOWN_HOURS)
+            health.update(opens=opens, open_until=time.time() + hours * 3600)
+            with self._lock:
+                if key in self._seen:
+                    self._seen[key]["state"] = "opened"
+        self.profiles.update(key, health=health)
+
+    def stats(self, key):
+        health = self._health(key)
+        samples = health.get("latency") or []
+        return {
+            "p50": percentile(samples, 50),
+            "p95": percentile(samples, 95),
+            "failures": health.get("failures", 0),
+            "open_until": health.get("open_until"),
+        }
+
+    def unhealthy(self):
+        """이번 실행에서 건너뛰었거나 회로가 열린 사이트 (리포트용)"""
+        with self._lock:
+            seen = [(key, dict(entry)) for key, entry in self._seen.items() if entry["state"] in ("skipped", "opened")]
+        rows = []
+        for key, entry in seen:
+            health = self._health(key)
+            open_until = health.get("open_until")
+            rows.append({
+                "site": entry["name"],
+                "state": entry["state"],
+                "failures": health.get("failures", 0),
+                "retry_at": datetime.fromtimestamp(open_until).strftime("%Y-%m-%d %H:%M") if open_until else "-",
+                "last_error": health.get("last_error") or "",
+            })
+        rows.sort(key=lambda r: (r["state"], r["site"]))
+        return rows
@@ -0,0 +1,40 @@
+import json
+import os
+import threading
+
+import settings
+
+
+class SiteProfileStore:
+    """사이트 URL별로 학습한 정보를 JSON 파일 하나에 보관"""
+
+    def __init__(self, path=None):
+        self.path = path or settings.SITE_PROFILE_PATH
+        self._lock = threading.Lock()
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                self._profiles = json.load(f)
+        except (OSError, ValueError):
+            self._profiles = {}
+
+    def get(self, site_key):
+        with self._lock:
+            return dict(self._profiles.get(site_key, {}))
+
+    def update(self, site_key, **fields):
+        with self._lock:
+            self._profiles.setdefault(site_key, {}).update(fields)
+
+    def save(self):
+        if self.path == os.devnull:
+            # 벤치마크 등에서 쓰는 저장하지 않는 프로필
+            return
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with self._lock:
+            data = json.dumps(self._profiles, ensure_ascii=False, indent=1, sort_keys=True)
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(data)
+        os.replace(tmp_path, self.path)
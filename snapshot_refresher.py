@@ -0,0 +1,94 @@
+import json
+import os
+import threading
+import time
+
+import settings
+from date_extract import json_default
+from news_item import restore_items
+
+
+class SnapshotRefresher:
+    """마지막으로 성공한 수집 결과(스냅샷)를 바로 돌려주고, 오래되면 백그라운드에서 갱신
+
+    fetch는 (items, source_status)를 돌려주는 함수.
+    새 결과는 디스크에 먼저 기록한 뒤 참조를 한 번에 바꿔 끼우므로
+    읽는 쪽은 항상 완전한 스냅샷만 보게 된다.
+    """
+
+    def __init__(self, fetch, path=None, ttl=None):
+        self._fetch = fetch
+        self.path = path or settings.DASHBOARD_SNAPSHOT_PATH
+        self.ttl = settings.DASHBOARD_TTL if ttl is None else ttl
+        self._lock = threading.Lock()
+        self._thread = None
+        self._ready = threading.Event()
+        self.last_error = None
+        self._snapshot = self._load()
+        if self._snapshot is not None:
+            self._ready.set()
+
+    def _load(self):
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                snapshot = json.load(f)
+            if "items" not in snapshot or "fetched_at" not in snapshot:
+                return None
+            snapshot["items"] = restore_items(snapshot["items"])
+            return snapshot
+        except (OSError, ValueError):
+            return None
+
+    def _save(self, snapshot):
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(snapshot, f, ensure_ascii=False, default=json_default)
+        os.replace(tmp_path, self.path)
+
+    @property
+    def refreshing(self):
+        thread = self._thread
+        return thread is not None and thread.is_alive()
+
+    def age(self):
+        """스냅샷이 만들어진 뒤 지난 시간(초), 스냅샷이 없으면 None"""
+        snapshot = self._snapshot
+        return None if snapshot is None else max(time.time() - snapshot["fetched_at"], 0)
+
+    def get(self):
+        """현재 스냅샷을 즉시 반환 (TTL이 지났으면 갱신만 시작)"""
+        age = self.age()
+        if age is None or age >= self.ttl:
+            self.refresh_async()
+        return self._snapshot
+
+    def wait(self, timeout=None):
+        """스냅샷이 하나도 없을 때(첫 실행) 첫 수집이 끝날 때까지 대기"""
+        self._ready.wait(timeout)
+        return self._snapshot
+
+    def refresh_async(self):
+        with self._lock:
+            if self.refreshing:
+                return False
+            self._thread = threading.Thread(target=self._refresh, name="snapshot-refresh", daemon=True)
+            self._thread.start()
+            return True
+
+    def _refresh(self):
+        try:
+            items, status = self._fetch()
+            # 모든 소스가 실패했다면 이전 스냅샷을 유지 (last-good)
+            if items or self._snapshot is None:
+                snapshot = {"items": items, "status": status, "fetched_at": time.time()}
+                self._save(snapshot)
+                self._snapshot = snapshot
+            self.last_error = None
+        except Exception as e:
+            print(f"Snapshot refresh failed: {repr(e)}")
+            self.last_error = repr(e)
+        finally:
+            self._ready.set()
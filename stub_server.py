@@ -0,0 +1,266 @@
+"""부하 테스트용 로컬 스텁 서버
+
+http_replay.py로 기록한 카세트와 템플릿으로 만든 가상 사이트를 응답한다.
+지연, 오류(503), 연결 끊김, 응답 없음(타임아웃), 느리게 흘려보내는 본문을 비율로 섞을 수 있다.
+
+    python stub_server.py --port 8765 --synth 2000 --sites-out stub_sites.json --latency 0.05 --error-rate 0.02
+    NEWS_BOT_HTTP_BASE=http://127.0.0.1:8765 NEWS_BOT_SITES_FILE=stub_sites.json python integrated_news_engine.py
+
+스크래퍼는 NEWS_BOT_HTTP_BASE가 설정되면 원래 URL을 /<scheme>/<host>/<path> 형태로 이 서버에 보낸다.
+"""
+import argparse
+import hashlib
+import json
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from http_replay import Cassette, request_key, unroute_path
+
+SYNTH_DOMAIN = "stub.test"
+
+_TITLE_WORDS = ("관광 여행 축제 지원 사업 모집 공고 선정 예산 투자 육성 혜택 보조금 이벤트 안전 추천 "
+                "안내 결과 발표 계획 변경 일정 시민 참여 문화 행사 교통 통제 청년 창업").split()
+
+# 실제 사이트에서 흔한 목록 구조 (IntegratedNewsEngine.table_patterns / 대체 탐색이 찾는 형태)
+_PAGE = ('<!DOCTYPE html>\n<html lang="ko"><head><meta charset="UTF-8"><title>{name}</title></head>\n'
+         '<body><div class="gnb"><ul>{menu}</ul></div>\n<div id="content">\n{body}\n</div>\n'
+         '<footer>Copyright {name}</footer></body></html>\n')
+_TEMPLATES = (
+    ('<table class="board-list"><tbody>{rows}</tbody></table>',
+     '<tr><td>{num}</td><td class="subject"><a href="/board/view.do?id={num}">{title}</a></td><td>{date}</td></tr>\n'),
+    ('<div class="board_list"><table><tbody>{rows}</tbody></table></div>',
+     '<tr><td>{num}</td><td class="title"><a href="view?nttNo={num}">{title}</a></td><td>{date}</td></tr>\n'),
+    ('<div class="news_list"><ul>{rows}</ul></div>',
+     '<li><a href="/news/{num}.html">{title}</a> <span class="date">{date}</span></li>\n'),
+    ('<section class="main_news">{rows}</section>',
+     '<div class="list_item"><a href="/articleView.html?idxno={num}"><h4>{title}</h4></a><em>{date}</em></div>\n'),
+    ('<table><tbody>{rows}</tbody></table>',
+     '<tr><td class="al"><a href="/site/board/{num}">{title}</a></td><td>{date}</td></tr>\n'),
+)
+
+
+def synth_sites(count, domain=SYNTH_DOMAIN):
+    """가상 사이트 목록 ([{"name", "url"}], NEWS_BOT_SITES_FILE 형식)"""
+    return [{"name": f"가상 사이트 {i:04d}", "url": f"http://site{i:04d}.{domain}/board/list.do"}
+            for i in range(count)]
+
+
+def synth_page(index, rows=15):
+    """index번 가상 사이트의 목록 페이지 (같은 index면 항상 같은 본문 -> 304/캐시 경로도 시험 가능)"""
+    rng = random.Random(index)
+    container, row = _TEMPLATES[index % len(_TEMPLATES)]
+    body = "".join(
+        row.format(num=10000 - n, title=" ".join(rng.choice(_TITLE_WORDS) for _ in range(rng.randint(3, 8))),
+                   date=f"2026-01-{28 - n % 28:02d}")
+        for n in range(rows)
+    )
+    menu = "".join(f'<li><a href="/menu/{m}">메뉴 {m}</a></li>' for m in range(40))
+    return _PAGE.format(name=f"가상 사이트 {index:04d}", menu=menu, body=container.format(rows=body))
+
+
+class FaultConfig:
+    """요청마다 지연과 장애 종류를 정함 (seed로 재현 가능)"""
+
+    def __init__(self, latency=0.0, jitter=0.0, error_rate=0.0, drop_rate=0.0, hang_rate=0.0, hang_seconds=30.0,
+                 drip_rate=0.0, drip_bytes=512, drip_delay=0.1, seed=0):
+        self.latency = latency
+        self.jitter = jitter
+        self.rates = (("error", error_rate), ("drop", drop_rate), ("hang", hang_rate), ("drip", drip_rate))
+        self.hang_seconds = hang_seconds
+        self.drip_bytes = max(drip_bytes, 1)
+        self.drip_delay = drip_delay
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def pick(self):
+        """(지연 초, 장애 종류 또는 None)"""
+        with self._lock:
+            delay = self.latency + (self._rng.uniform(0, self.jitter) if self.jitter else 0.0)
+            roll = self._rng.random()
+        for fault, rate in self.rates:
+            if roll < rate:
+                return delay, fault
+            roll -= rate
+        return delay, None
+
+
+class _Handler(BaseHTTPRequestHandler):
+    # keep-alive를 지원해야 클라이언트 연결 풀 동작까지 실제와 비슷하게 시험할 수 있음
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        self._serve_safely("GET")
+
+    def do_POST(self):
+        self._serve_safely("POST")
+
+    def _serve_safely(self, method):
+        try:
+            self._serve(method)
+        except (BrokenPipeError, ConnectionResetError):
+            # 클라이언트가 타임아웃으로 먼저 끊은 경우
+            self.close_connection = True
+
+    def log_message(self, format, *args):
+        if self.server.stub.verbose:
+            super().log_message(format, *args)
+
+    def _send(self, status, headers, body, drip=False):
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if not drip:
+            self.wfile.write(body)
+            return
+        faults = self.server.stub.faults
+        for start in range(0, len(body), faults.drip_bytes):
+            self.wfile.write(body[start:start + faults.drip_bytes])
+            self.wfile.flush()
+            time.sleep(faults.drip_delay)
+
+    def _serve(self, method):
+        stub = self.server.stub
+        length = int(self.headers.get("Content-Length") or 0)
+        payload = self.rfile.read(length) if length else b""
+        url = unroute_path(self.path)
+        if url is None:
+            self._send(404, {"Content-Type": "text/plain"}, b"use /<scheme>/<host>/<path>")
+            return
+
+        delay, fault = stub.faults.pick()
+        stub.count(fault or "ok")
+        if delay:
+            time.sleep(delay)
+        if fault == "drop":
+            # 응답 없이 연결을 닫음 -> 클라이언트에서 ConnectionError
+            self.close_connection = True
+            return
+        if fault == "hang":
+            time.sleep(stub.faults.hang_seconds)
+        if fault == "error":
+            self._send(503, {"Content-Type": "text/plain"}, b"stub error")
+            return
+
+        entry = stub.lookup(method, url, payload)
+        if entry is None:
+            self._send(404, {"Content-Type": "text/plain"}, f"no stub for {method} {url}".encode("utf-8"))
+            return
+        status, headers, body = entry
+        etag = headers.get("ETag")
+        if status == 200 and etag and self.headers.get("If-None-Match") == etag:
+            self._send(304, {"ETag": etag}, b"")
+            return
+        self._send(status, headers, body, drip=fault == "drip")
+
+
+class _StubHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+    # 수천 개 사이트를 동시에 시험할 때 accept 대기열이 넘치지 않도록
+    request_queue_size = 256
+
+
+class StubServer:
+    """카세트 + 가상 사이트를 응답하는 ThreadingHTTPServer (start()는 백그라운드 스레드에서 실행)"""
+
+    def __init__(self, host="127.0.0.1", port=0, cassette_dir=None, synth=0, faults=None, verbose=False):
+        self.faults = faults or FaultConfig()
+        self.verbose = verbose
+        self.cassette = Cassette(cassette_dir, mode="replay") if cassette_dir else None
+        self.sites = synth_sites(synth)
+        self._routes = {}
+        for index, site in enumerate(self.sites):
+            self._add_route("GET", site["url"], synth_page(index))
+        self._counts = {}
+        self._lock = threading.Lock()
+
+        self.httpd = _StubHTTPServer((host, port), _Handler)
+        self.httpd.stub = self
+        self._thread = None
+
+    @property
+    def base_url(self):
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def _add_route(self, method, url, html):
+        body = html.encode("utf-8")
+        headers = {"Content-Type": "text/html; charset=utf-8", "ETag": f'"{hashlib.sha1(body).hexdigest()}"'}
+        self._routes[request_key(method, url)] = (200, headers, body)
+
+    def lookup(self, method, url, payload=b""):
+        key = request_key(method, url, payload)
+        entry = self._routes.get(key)
+        if entry is None and self.cassette is not None:
+            meta, body = self.cassette.load(key)
+            if meta is not None:
+                entry = (meta["status"], meta.get("headers", {}), body)
+        return entry
+
+    def count(self, outcome):
+        with self._lock:
+            self._counts[outcome] = self._counts.get(outcome, 0) + 1
+
+    def counts(self):
+        with self._lock:
+            return dict(self._counts)
+
+    def write_sites(self, path):
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.sites, f, ensure_ascii=False, indent=1)
+
+    def start(self):
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--cassettes", default=None, help="directory recorded with NEWS_BOT_HTTP_MODE=record")
+    parser.add_argument("--synth", type=int, default=0, help="number of fake sites to serve")
+    parser.add_argument("--sites-out", default=None, help="write the fake site list here (for NEWS_BOT_SITES_FILE)")
+    parser.add_argument("--latency", type=float, default=0.0, help="base delay per response (seconds)")
+    parser.add_argument("--jitter", type=float, default=0.0, help="extra random delay up to this many seconds")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="fraction answered with 503")
+    parser.add_argument("--drop-rate", type=float, default=0.0, help="fraction closed without a response")
+    parser.add_argument("--hang-rate", type=float, default=0.0, help="fraction delayed by --hang seconds")
+    parser.add_argument("--hang", type=float, default=30.0)
+    parser.add_argument("--drip-rate", type=float, default=0.0, help="fraction whose body is sent slowly")
+    parser.add_argument("--drip-bytes", type=int, default=512)
+    parser.add_argument("--drip-delay", type=float, default=0.1)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--verbose", action="store_true")
+    args = parser.parse_args()
+
+    faults = FaultConfig(latency=args.latency, jitter=args.jitter, error_rate=args.error_rate,
+                         drop_rate=args.drop_rate, hang_rate=args.hang_rate, hang_seconds=args.hang,
+                         drip_rate=args.drip_rate, drip_bytes=args.drip_bytes, drip_delay=args.drip_delay,
+                         seed=args.seed)
+    stub = StubServer(args.host, args.port, cassette_dir=args.cassettes, synth=args.synth, faults=faults,
+                      verbose=args.verbose)
+    if args.sites_out:
+        stub.write_sites(args.sites_out)
+    print(f"Stub server on {stub.base_url} ({len(stub.sites)} fake sites"
+          f"{', cassettes: ' + args.cassettes if args.cassettes else ''})")
+    print(f"  NEWS_BOT_HTTP_BASE={stub.base_url}" + (f" NEWS_BOT_SITES_FILE={args.sites_out}" if args.sites_out else ""))
+    try:
+        stub.httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        stub.httpd.server_close()
+        print(f"Responses: {stub.counts()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,7 @@
+import os
+import sys
+import tempfile
+
+# settings는 임포트할 때 환경 변수를 읽으므로 상태 디렉터리(수집 이력/프로필/캐시)를 먼저 임시 경로로
+os.environ["NEWS_BOT_STATE_DIR"] = tempfile.mkdtemp(prefix="news_bot_test_")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,52 @@
+from datetime import date
+
+import settings
+from date_extract import DateCutoff, cutoff_date
+from news_item import NewsItem
+
+
+def test_cutoff_date_uses_later_of_max_age_and_last_run(monkeypatch):
+    today = date(2026, 10, 18)
+    monkeypatch.setattr(settings, "MAX_ITEM_AGE_DAYS", 0)
+    assert cutoff_date(None, today) is None
+    assert cutoff_date("2026-10-10", today) == date(2026, 10, 10)
+    monkeypatch.setattr(settings, "MAX_ITEM_AGE_DAYS", 7)
+    assert cutoff_date(None, today) == date(2026, 10, 11)
+    assert cutoff_date("2026-10-01", today) == date(2026, 10, 11)
+    assert cutoff_date("2026-10-15", today) == date(2026, 10, 15)
+
+
+def test_date_cutoff_keeps_rows_on_the_cutoff_day_and_undated_rows():
+    scan = DateCutoff(date(2026, 10, 10), streak=3)
+    assert scan.accept(date(2026, 10, 12))
+    assert scan.accept(date(2026, 10, 10))
+    assert scan.accept(None)
+    assert not scan.accept(date(2026, 10, 9))
+    assert not scan.done
+
+
+def test_date_cutoff_is_done_only_after_a_streak_of_old_rows():
+    scan = DateCutoff(date(2026, 10, 10), streak=3)
+    # 상단 고정 공지처럼 중간에 섞인 오래된 행은 목록 읽기를 멈추지 않음
+    assert not scan.accept(date(2025, 1, 1))
+    assert scan.accept(date(2026, 10, 11))
+    for _ in range(3):
+        scan.accept(date(2026, 10, 1))
+    assert scan.done
+
+
+def test_date_cutoff_without_cutoff_accepts_everything():
+    scan = DateCutoff(None, streak=1)
+    assert scan.accept(date(2000, 1, 1))
+    assert not scan.done
+
+
+def test_date_cutoff_filter_drops_only_older_items():
+    items = [
+        NewsItem("new", "https://example.com/1", date(2026, 10, 11)),
+        NewsItem("edge", "https://example.com/2", date(2026, 10, 10)),
+        NewsItem("old", "https://example.com/3", date(2026, 10, 9)),
+        NewsItem("undated", "https://example.com/4"),
+    ]
+    kept = DateCutoff(date(2026, 10, 10)).filter(items)
+    assert [item.title for item in kept] == ["new", "edge", "undated"]
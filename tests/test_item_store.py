@@ -0,0 +1,44 @@
+import pytest
+
+from item_store import ItemStore
+from news_item import NewsItem
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = ItemStore(str(tmp_path / "items.sqlite3"))
+    yield store
+    store.close()
+
+
+def make_items():
+    return [
+        NewsItem("관광 주간 행사 안내", "https://example.com/1", None, "MCST"),
+        NewsItem("축제 참가자 모집", "https://example.com/2", None, "GGTour"),
+    ]
+
+
+def test_filter_new_marks_items_by_default(store):
+    items = make_items()
+    assert store.filter_new(items) == items
+    assert store.filter_new(items) == []
+
+
+def test_filter_new_without_mark_keeps_items_new(store):
+    items = make_items()
+    assert store.filter_new(items, mark=False) == items
+    assert store.filter_new(items, mark=False) == items
+    assert not store.contains(items[0])
+
+
+def test_mark_seen_records_only_given_items(store):
+    sent, held_back = make_items()
+    store.filter_new([sent, held_back], mark=False)
+    store.mark_seen([sent])
+    assert store.contains(sent)
+    assert store.filter_new([sent, held_back], mark=False) == [held_back]
+
+
+def test_same_link_with_different_tracking_query_is_seen(store):
+    store.mark_seen([NewsItem("제목", "https://example.com/view?id=1&utm_source=mail", None, "MCST")])
+    assert store.contains(NewsItem("제목", "https://EXAMPLE.com/view?id=1", None, "MCST"))
@@ -0,0 +1,42 @@
+import json
+
+import pytest
+
+from integrated_news_engine import IntegratedNewsEngine
+
+SITES = [{"name": "A청"}, {"name": "B청"}]
+
+
+@pytest.fixture
+def engine(tmp_path, monkeypatch):
+    # 리포트/측정값 파일은 현재 디렉터리에 씀
+    monkeypatch.chdir(tmp_path)
+    return IntegratedNewsEngine(only_new=False, parse_processes=0)
+
+
+def write_partial(path, groups):
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"groups": groups, "metrics": [], "health": [], "elapsed_ms": 10.0}, f, ensure_ascii=False)
+    return str(path)
+
+
+def item(title, link):
+    return {"title": title, "link": link, "date": "2026-10-18", "source": None, "also": []}
+
+
+def test_merge_without_partials_writes_no_report(engine, tmp_path):
+    assert engine.merge_shards([str(tmp_path / "shard-0.json"), str(tmp_path / "shard-1.json")], SITES) is None
+    assert not (tmp_path / "daily_news_report.html").exists()
+
+
+def test_merge_skips_missing_shards_and_drops_repeated_items(engine, tmp_path):
+    first = write_partial(tmp_path / "shard-0.json", [["B청", [item("공고", "https://b.example/1")]]])
+    second = write_partial(tmp_path / "shard-1.json", [
+        ["A청", [item("모집", "https://a.example/1")]],
+        ["B청", [item("공고", "https://b.example/1")]],
+    ])
+    assert engine.merge_shards([first, str(tmp_path / "shard-2.json"), second], SITES) is not None
+    html = (tmp_path / "daily_news_report.html").read_text(encoding="utf-8")
+    assert html.count("https://b.example/1") == 1
+    # 사이트 목록 순서대로
+    assert html.index("A청") < html.index("B청")
@@ -0,0 +1,35 @@
+from near_duplicates import collapse, groups
+from news_item import NewsItem
+
+
+def test_groups_copies_across_sources_and_keeps_members():
+    original = NewsItem("[보도자료] 2026 관광주간 행사 개최 안내", "https://a.example/1", None, "MCST")
+    copy = NewsItem("2026 관광 주간 행사 개최 안내", "https://b.example/1", None, "GGTour")
+    other = NewsItem("지역 축제 자원봉사자 모집 공고", "https://c.example/1", None, "Busan")
+    result = groups([original, copy, other])
+
+    assert len(result) == 2
+    head, members = result[0]
+    assert members == [original, copy]
+    assert head.link == original.link
+    assert head.also == ("GGTour",)
+    assert result[1] == (other, [other])
+    assert collapse([original, copy, other]) == [head, other]
+
+
+def test_groups_does_not_merge_items_from_the_same_source():
+    first = NewsItem("2026 관광주간 행사 개최 안내", "https://a.example/1", None, "MCST")
+    second = NewsItem("[알림] 2026 관광주간 행사 개최 안내", "https://a.example/2", None, "MCST")
+    assert groups([first, second]) == [(first, [first]), (second, [second])]
+
+
+def test_groups_keeps_titles_with_different_numbers_apart():
+    third = NewsItem("관광두레 주민사업체 3차 모집 공고", "https://a.example/1", None, "MCST")
+    fourth = NewsItem("관광두레 주민사업체 4차 모집 공고", "https://b.example/1", None, "GGTour")
+    assert len(groups([third, fourth])) == 2
+
+
+def test_groups_disabled_with_zero_threshold():
+    original = NewsItem("2026 관광주간 행사 개최 안내", "https://a.example/1", None, "MCST")
+    copy = NewsItem("2026 관광주간 행사 개최 안내", "https://b.example/1", None, "GGTour")
+    assert groups([original, copy], threshold=0) == [(original, [original]), (copy, [copy])]
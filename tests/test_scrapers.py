@@ -0,0 +1,67 @@
+from datetime import date
+
+import pytest
+
+import settings
+from news_item import NewsItem
+from scrapers import TourismScraper
+from site_profiles import SiteProfileStore
+
+
+class SeenLinks:
+    """ItemStore 대신 링크 목록으로 이미 본 글을 판별"""
+
+    def __init__(self, links):
+        self.links = set(links)
+
+    def contains(self, item):
+        return item["link"] in self.links
+
+
+@pytest.fixture
+def scraper(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "MAX_ITEM_AGE_DAYS", 0)
+    scraper = TourismScraper(item_store=SeenLinks(["https://example.com/seen"]))
+    scraper.profiles = SiteProfileStore(str(tmp_path / "site_profiles.json"))
+    return scraper
+
+
+def test_save_last_run_holds_back_to_oldest_unsent_item(scraper):
+    scraper.source_status = {"MCST": {"status": "ok"}, "Jeju": {"status": "ok"}, "Busan": {"status": "timeout"}}
+    held_back = [
+        NewsItem("b", "https://example.com/b", date(2026, 10, 12), "MCST"),
+        NewsItem("a", "https://example.com/a", date(2026, 10, 10), "MCST"),
+    ]
+    scraper.save_last_run(held_back, today="2026-10-18")
+    assert scraper.profiles.get("tourism:MCST") == {"last_run": "2026-10-10", "held_back": True}
+    assert scraper.profiles.get("tourism:Jeju") == {"last_run": "2026-10-18", "held_back": False}
+    assert scraper.profiles.get("tourism:Busan") == {}
+
+
+def fetch_pages(scraper, held_back):
+    pages = {
+        1: [(date(2026, 10, 18), "https://example.com/new"), (date(2026, 10, 15), "https://example.com/seen")],
+        2: [(date(2026, 10, 12), "https://example.com/held-1"), (date(2026, 10, 10), "https://example.com/held-2")],
+        3: [(date(2026, 10, day), f"https://example.com/old-{day}") for day in (9, 8, 7, 6)],
+    }
+
+    def fetch_listing(url, parse, params=None, data=None):
+        scan = scraper._date_scan()
+        rows = pages.get((params or {}).get("page", 1), [])
+        return [NewsItem("제목", link, day, "MCST") for day, link in rows if scan.accept(day)]
+
+    scraper._fetch_listing = fetch_listing
+    scraper._local.since = "2026-10-10"
+    scraper._local.held_back = held_back
+    return [item.link for item in scraper._fetch_pages("https://example.com/list", None, "page")]
+
+
+def test_fetch_pages_stops_at_a_page_with_seen_items(scraper):
+    assert fetch_pages(scraper, held_back=False) == ["https://example.com/new", "https://example.com/seen"]
+
+
+def test_fetch_pages_reads_past_seen_items_when_items_were_held_back(scraper):
+    assert fetch_pages(scraper, held_back=True) == [
+        "https://example.com/new", "https://example.com/seen",
+        "https://example.com/held-1", "https://example.com/held-2",
+    ]